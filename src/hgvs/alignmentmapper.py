@@ -155,7 +155,7 @@ class AlignmentMapper:
         """convert a genomic (g.) interval to a transcript cDNA (n.) interval"""
 
         if strict_bounds is None:
-            strict_bounds = global_config.mapping.strict_bounds
+            strict_bounds = global_config.snapshot().mapping.strict_bounds
 
         grs, gre = (
             g_interval.start.base - 1 - self.gc_offset,
@@ -174,7 +174,7 @@ class AlignmentMapper:
             frs_offset, fre_offset = -fre_offset, -frs_offset
 
         # The returned interval would be uncertain when locating at alignment gaps
-        return hgvs.location.BaseOffsetInterval(
+        return hgvs.location.BaseOffsetInterval.unchecked(
             start=hgvs.location.BaseOffsetPosition(
                 base=_zbc_to_hgvs(frs), offset=frs_offset, datum=Datum.SEQ_START
             ),
@@ -188,7 +188,7 @@ class AlignmentMapper:
         """convert a transcript (n.) interval to a genomic (g.) interval"""
 
         if strict_bounds is None:
-            strict_bounds = global_config.mapping.strict_bounds
+            strict_bounds = global_config.snapshot().mapping.strict_bounds
 
         frs = _hgvs_to_zbc(n_interval.start.base)
         start_offset = n_interval.start.offset
@@ -210,7 +210,7 @@ class AlignmentMapper:
         gs, ge = grs + start_offset, gre + end_offset
 
         # The returned interval would be uncertain when locating at alignment gaps
-        return hgvs.location.Interval(
+        return hgvs.location.Interval.unchecked(
             start=hgvs.location.SimplePosition(gs, uncertain=n_interval.start.uncertain),
             end=hgvs.location.SimplePosition(ge, uncertain=n_interval.end.uncertain),
             uncertain=grs_cigar in "DI" or gre_cigar in "DI",
@@ -220,7 +220,7 @@ class AlignmentMapper:
         """convert a transcript cDNA (n.) interval to a transcript CDS (c.) interval"""
 
         if strict_bounds is None:
-            strict_bounds = global_config.mapping.strict_bounds
+            strict_bounds = global_config.snapshot().mapping.strict_bounds
 
         if (
             self.cds_start_i is None
@@ -248,7 +248,7 @@ class AlignmentMapper:
                 c_datum = Datum.CDS_END
             return hgvs.location.BaseOffsetPosition(base=c, offset=pos.offset, datum=c_datum)
 
-        c_interval = hgvs.location.BaseOffsetInterval(
+        c_interval = hgvs.location.BaseOffsetInterval.unchecked(
             start=pos_n_to_c(n_interval.start),
             end=pos_n_to_c(n_interval.end),
             uncertain=n_interval.uncertain,
@@ -259,7 +259,7 @@ class AlignmentMapper:
         """convert a transcript CDS (c.) interval to a transcript cDNA (n.) interval"""
 
         if strict_bounds is None:
-            strict_bounds = global_config.mapping.strict_bounds
+            strict_bounds = global_config.snapshot().mapping.strict_bounds
 
         if self.cds_start_i is None:
             raise HGVSUsageError(
@@ -284,7 +284,7 @@ class AlignmentMapper:
                 base=n, offset=pos.offset, datum=Datum.SEQ_START
             )
 
-        n_interval = hgvs.location.BaseOffsetInterval(
+        n_interval = hgvs.location.BaseOffsetInterval.unchecked(
             start=pos_c_to_n(c_interval.start),
             end=pos_c_to_n(c_interval.end),
             uncertain=c_interval.uncertain,
@@ -10,6 +10,7 @@ from hgvs.exceptions import (
     HGVSInvalidVariantError,
     HGVSUnsupportedOperationError,
 )
+from hgvs.utils.tracing import traced
 from hgvs.variantmapper import VariantMapper
 
 _logger = logging.getLogger(__name__)
@@ -102,24 +103,28 @@ class AssemblyMapper(VariantMapper):
             "replace_reference={self.replace_reference})".format(self=self, t=type(self))
         )
 
+    @traced
     def g_to_c(self, var_g, tx_ac):
         var_out = super(AssemblyMapper, self).g_to_c(
             var_g, tx_ac, alt_aln_method=self.alt_aln_method
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def g_to_n(self, var_g, tx_ac):
         var_out = super(AssemblyMapper, self).g_to_n(
             var_g, tx_ac, alt_aln_method=self.alt_aln_method
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def g_to_t(self, var_g, tx_ac):
         var_out = super(AssemblyMapper, self).g_to_t(
             var_g, tx_ac, alt_aln_method=self.alt_aln_method
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def c_to_g(self, var_c):
         alt_ac = self._alt_ac_for_tx_ac(var_c.ac)
         var_out = super(AssemblyMapper, self).c_to_g(
@@ -127,6 +132,7 @@ class AssemblyMapper(VariantMapper):
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def n_to_g(self, var_n):
         alt_ac = self._alt_ac_for_tx_ac(var_n.ac)
         var_out = super(AssemblyMapper, self).n_to_g(
@@ -134,6 +140,7 @@ class AssemblyMapper(VariantMapper):
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def t_to_g(self, var_t):
         alt_ac = self._alt_ac_for_tx_ac(var_t.ac)
         var_out = super(AssemblyMapper, self).t_to_g(
@@ -141,6 +148,7 @@ class AssemblyMapper(VariantMapper):
         )
         return self._maybe_normalize(var_out)
 
+    @traced
     def t_to_p(self, var_t):
         """Return a protein variant, or "non-coding" for non-coding variant types
 
@@ -160,18 +168,22 @@ class AssemblyMapper(VariantMapper):
             "Expected a coding (c.) or non-coding (n.) variant; got " + str(var_t)
         )
 
+    @traced
     def c_to_n(self, var_c):
         var_out = super(AssemblyMapper, self).c_to_n(var_c)
         return self._maybe_normalize(var_out)
 
+    @traced
     def n_to_c(self, var_n):
         var_out = super(AssemblyMapper, self).n_to_c(var_n)
         return self._maybe_normalize(var_out)
 
+    @traced
     def c_to_p(self, var_c):
         var_out = super(AssemblyMapper, self).c_to_p(var_c)
         return self._maybe_normalize(var_out)
 
+    @traced
     def relevant_transcripts(self, var_g):
         """return list of transcripts accessions (strings) for given variant,
         selected by genomic overlap"""
@@ -180,6 +192,7 @@ class AssemblyMapper(VariantMapper):
         )
         return [e["tx_ac"] for e in tx]
 
+    @traced
     def _alt_ac_for_tx_ac(self, tx_ac):
         """return chromosomal accession for given transcript accession (and
         the_assembly and aln_method setting used to instantiate this
@@ -239,6 +252,7 @@ class AssemblyMapper(VariantMapper):
         assert len(alt_acs) == 1, "Should have exactly one alignment at this point"
         return alt_acs[0]
 
+    @traced
     def _fetch_AlignmentMapper(self, tx_ac, alt_ac=None, alt_aln_method=None):
         """convenience version of VariantMapper._fetch_AlignmentMapper that
         derives alt_ac from transcript, assembly, and alt_aln_method
@@ -252,6 +266,7 @@ class AssemblyMapper(VariantMapper):
             alt_aln_method = self.alt_aln_method
         return super(AssemblyMapper, self)._fetch_AlignmentMapper(tx_ac, alt_ac, alt_aln_method)
 
+    @traced
     def _maybe_normalize(self, var):
         """normalize variant if requested, and ignore HGVSUnsupportedOperationError
         This is better than checking whether the variant is intronic because
@@ -14,6 +14,22 @@ Although keys are settable, they are stringified on setting and
 type-inferred on getting, which means that round-tripping works only
 for str, int, and boolean.
 
+Each lookup through ConfigParser is relatively expensive.  Code that
+reads settings frequently should use `Config.snapshot()`, which
+returns a read-only `Settings` object with plain, already-typed
+attributes.  The snapshot is built once and reused until the
+configuration changes: setting a value or reading a file invalidates
+it automatically.  Code that modifies the underlying ConfigParser
+directly must call `Config.invalidate()`.
+
+>>> import hgvs
+>>> hgvs.global_config.snapshot().formatting.max_ref_length
+0
+>>> hgvs.global_config.formatting.max_ref_length = 3
+>>> hgvs.global_config.snapshot().formatting.max_ref_length
+3
+>>> hgvs.global_config.formatting.max_ref_length = 0
+
 >>> import hgvs.config
 
 .. data:: hgvs.config.global_config
@@ -54,6 +70,28 @@ class Config:
     def read_stream(self, flo):
         """read configuration from ini-formatted file-like object"""
         self._cp.read_string(flo.read().decode("ascii"))
+        self.invalidate()
+
+    def snapshot(self):
+        """return read-only, typed snapshot (a `Settings` instance) of
+        the current configuration
+
+        The snapshot is cached until the configuration changes.
+
+        """
+        snapshot = self.__dict__.get("_snapshot")
+        if snapshot is None or snapshot.generation != _generation:
+            snapshot = self.__dict__["_snapshot"] = Settings(self._cp, _generation)
+        return snapshot
+
+    @staticmethod
+    def invalidate():
+        """discard cached snapshots; call after modifying the
+        ConfigParser instance directly
+
+        """
+        global _generation
+        _generation += 1
 
     def __copy__(self):
         new_config = Config.__new__(Config)
@@ -90,10 +128,41 @@ class ConfigGroup:
     def __setattr__(self, k, v):
         logger.info(str(self.__class__.__name__) + ".__setattr__({k}, ...)".format(k=k))
         self.__dict__["_section"][k] = str(v)
+        Config.invalidate()
 
     __setitem__ = __setattr__
 
 
+class Settings:
+    """read-only snapshot of a configuration, with one attribute per
+    section; see `Config.snapshot()`
+
+    """
+
+    def __init__(self, cp, generation):
+        self.__dict__.update((name, SettingsGroup(cp[name])) for name in cp.sections())
+        self.__dict__["generation"] = generation
+
+    def __setattr__(self, k, v):
+        raise AttributeError("configuration snapshots are read-only; set values on the Config")
+
+    def __getitem__(self, k):
+        return getattr(self, k)
+
+
+class SettingsGroup:
+    """read-only, typed values of one configuration section"""
+
+    def __init__(self, section):
+        self.__dict__.update((k, _val_xform(section[k])) for k in section)
+
+    def __setattr__(self, k, v):
+        raise AttributeError("configuration snapshots are read-only; set values on the Config")
+
+    def __getitem__(self, k):
+        return getattr(self, k)
+
+
 def _name_xform(o):
     """transform names to lowercase, without symbols (except underscore)
     Any chars other than alphanumeric are converted to an underscore
@@ -115,6 +184,10 @@ def _val_xform(v):
     return v
 
 
+# incremented whenever any configuration changes; snapshots built for
+# an earlier generation are stale
+_generation = 0
+
 _default_config = Config()
 _default_config.read_stream(resource_stream(__name__, "_data/defaults.ini"))
 
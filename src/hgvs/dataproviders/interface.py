@@ -5,6 +5,7 @@
 
 import abc
 import os
+from collections.abc import Mapping
 
 import six
 from six.moves import map
@@ -12,7 +13,11 @@ from six.moves import map
 import hgvs
 
 from ..decorators.lru_cache import LEARN, RUN, VERIFY, lru_cache
+from ..decorators.seq_blocks import seq_blocks
+from ..exceptions import HGVSDataNotAvailableError
+from ..utils.cachestore import OverlayDict, open_cache
 from ..utils.PersistentDict import PersistentDict
+from ..utils.tracing import traced
 
 
 class Interface(six.with_metaclass(abc.ABCMeta, object)):
@@ -45,8 +50,13 @@ class Interface(six.with_metaclass(abc.ABCMeta, object)):
         """
         :param mode: cache mode (None[default lru cache], 'learn', 'run', 'verify')
         :type mode: str
-        :param cache: local cache file name
+        :param cache: local cache file name, or a persistent store (a
+            mapping with a sync() method)
         :type cache: str
+
+        The cache file type is chosen by extension; see
+        :func:`hgvs.utils.cachestore.open_cache`.  Use a ``.sqlite``
+        file for large caches in learn mode.
         """
         self.mode = None
         if mode == "learn":
@@ -58,53 +68,72 @@ class Interface(six.with_metaclass(abc.ABCMeta, object)):
 
         self.cache = None
         if self.mode is not None:
-            if self.mode == LEARN:
-                self.cache = PersistentDict(cache, flag="c")
+            if isinstance(cache, Mapping):
+                self.cache = cache
+            elif self.mode == LEARN:
+                self.cache = open_cache(cache, flag="c")
             else:
-                self.cache = PersistentDict(cache, flag="r")
+                self.cache = open_cache(cache, flag="r")
+                if self.mode == VERIFY and not isinstance(self.cache, PersistentDict):
+                    # keep results of misses in memory, as PersistentDict does
+                    self.cache = OverlayDict(self.cache)
 
+        # sequences vary widely in size, so they have separate limits,
+        # including a limit on total bytes
         maxsize = hgvs.global_config.lru_cache.maxsize
+        seq_maxsize = hgvs.global_config.lru_cache.seq_maxsize
+        seq_max_bytes = hgvs.global_config.lru_cache.seq_max_bytes
+        seq_block_size = hgvs.global_config.lru_cache.seq_block_size
+        negative_maxsize = hgvs.global_config.lru_cache.negative_maxsize
+        negative_ttl = hgvs.global_config.lru_cache.negative_ttl
+        negative_persistent = hgvs.global_config.lru_cache.negative_persistent
         if "PYTEST_CURRENT_TEST" in os.environ:
-            maxsize = None
+            maxsize = seq_maxsize = seq_max_bytes = None
+            if negative_maxsize:
+                negative_maxsize = None
             print(f"{__file__}: Using unlimited cache size")
 
-        self.data_version = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.data_version
-        )
-        self.schema_version = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.schema_version
-        )
-        self.get_acs_for_protein_seq = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_acs_for_protein_seq
-        )
-        self.get_gene_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_gene_info
-        )
-        self.get_pro_ac_for_tx_ac = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_pro_ac_for_tx_ac
-        )
-        self.get_seq = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(self.get_seq)
-        self.get_similar_transcripts = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_similar_transcripts
-        )
-        self.get_tx_exons = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_exons
-        )
-        self.get_tx_for_gene = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_for_gene
-        )
-        self.get_tx_for_region = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_for_region
-        )
-        self.get_tx_identity_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_identity_info
-        )
-        self.get_tx_info = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_info
-        )
-        self.get_tx_mapping_options = lru_cache(maxsize=maxsize, mode=self.mode, cache=self.cache)(
-            self.get_tx_mapping_options
-        )
+        # each data provider call is traced as "hdp.<method>", including
+        # cache hits; the underlying call is traced as "hdp.<method>.fetch"
+        # only when it is executed (i.e., on cache misses), and a cached
+        # exception that is raised again is traced as
+        # "hdp.<method>.negative".  Caches are registered as
+        # "hdp.<method>".  See hgvs.utils.tracing, hgvs.utils.accounting,
+        # and hgvs.utils.cachestats.
+        for name in (
+            "data_version",
+            "schema_version",
+            "get_acs_for_protein_seq",
+            "get_gene_info",
+            "get_pro_ac_for_tx_ac",
+            "get_seq",
+            "get_similar_transcripts",
+            "get_tx_exons",
+            "get_tx_for_gene",
+            "get_tx_for_region",
+            "get_tx_identity_info",
+            "get_tx_info",
+            "get_tx_mapping_options",
+        ):
+            hdp_name = "hdp." + name
+            if name in self.sequence_methods:
+                limits = dict(maxsize=seq_maxsize, max_bytes=seq_max_bytes)
+            else:
+                limits = dict(maxsize=maxsize)
+            if name in self.negative_cache_methods and negative_maxsize != 0:
+                limits.update(
+                    negative=(HGVSDataNotAvailableError,),
+                    negative_maxsize=negative_maxsize,
+                    negative_ttl=negative_ttl,
+                    negative_persistent=negative_persistent,
+                )
+            fn = traced(hdp_name + ".fetch")(getattr(self, name))
+            fn = lru_cache(mode=self.mode, cache=self.cache, name=hdp_name, **limits)(fn)
+            if name in self.sequence_methods and seq_block_size and self.mode is None:
+                # cache aligned blocks and serve subranges from them;
+                # not with persistent caches, whose keys are exact ranges
+                fn = seq_blocks(seq_block_size)(fn)
+            setattr(self, name, traced(hdp_name, record_args=True)(fn))
 
         def _split_version_string(v):
             versions = list(map(int, v.split(".")))
@@ -127,6 +156,16 @@ class Interface(six.with_metaclass(abc.ABCMeta, object)):
             )
         )
 
+    # methods that return sequences, which are cached with the
+    # [lru_cache] seq_maxsize and seq_max_bytes limits, optionally in
+    # blocks of seq_block_size
+    sequence_methods = ("get_seq",)
+
+    # methods for which HGVSDataNotAvailableError is cached (i.e., for
+    # missing transcripts), with the [lru_cache] negative_maxsize and
+    # negative_ttl limits
+    negative_cache_methods = ("get_tx_exons", "get_tx_identity_info", "get_tx_info")
+
     # required_version: what version of the remote schema is required
     # by the subclass? This value is compared to the result of
     # schema_version, which must be implemented by the class.
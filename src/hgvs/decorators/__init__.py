@@ -1,4 +1,5 @@
 from .deprecated import deprecated
 from .lru_cache import lru_cache
+from .seq_blocks import seq_blocks
 
-__all__ = ["deprecated", "lru_cache"]
+__all__ = ["deprecated", "lru_cache", "seq_blocks"]
@@ -11,11 +11,15 @@ Added persistence capability
 
 """
 
-from collections import namedtuple
+import copy
+import sys
+from collections import OrderedDict, namedtuple
 from functools import update_wrapper
 from threading import RLock
+from time import monotonic, perf_counter, time
 
 from ..exceptions import HGVSDataNotAvailableError, HGVSVerifyFailedError
+from ..utils import cachestats, tracing
 
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
@@ -69,17 +73,63 @@ def _make_key(
     return _HashedSeq(key)
 
 
+class _CachedError:
+    """an exception raised by a cached function, stored in a persistent
+    cache in place of a result"""
+
+    __slots__ = ["error", "time"]
+
+    def __init__(self, error):
+        self.error = copy.copy(error)  # without traceback
+        self.time = time()
+
+    def expired(self, ttl):
+        return ttl is not None and time() - self.time >= ttl
+
+    def __repr__(self):
+        return "_CachedError({error!r})".format(error=self.error)
+
+
 LEARN = 1
 RUN = 2
 VERIFY = 3
 
 
-def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
+def lru_cache(
+    maxsize=100,
+    typed=False,
+    mode=None,
+    cache=None,
+    name=None,
+    max_bytes=None,
+    sizeof=None,
+    negative=None,
+    negative_maxsize=100,
+    negative_ttl=None,
+    negative_persistent=False,
+):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
     can grow without bound.
 
+    If *max_bytes* is set, the cache is also bounded by the total size of
+    the cached results, as measured by *sizeof* (default: sys.getsizeof),
+    and least-recently-used entries are evicted until the total fits.
+    Results larger than *max_bytes* are not cached.  *max_bytes* may be
+    combined with *maxsize*, or used with maxsize=None to bound the cache
+    by size only.  It is intended for functions with results of widely
+    varying size, such as sequences.
+
+    If *negative* is a tuple of exception classes, those exceptions are
+    cached too ("negative caching"): a later call with the same
+    arguments raises a copy of the exception without calling the
+    function.  Cached exceptions are kept separately from results, with
+    their own limits: at most *negative_maxsize* exceptions (None for no
+    limit), each for *negative_ttl* seconds (None for no expiry).
+    Exceptions are cached in memory unless *negative_persistent* is True
+    (see below).
+
     If *typed* is True, arguments of different types will be cached separately.
     For example, f(3.0) and f(3) will be treated as distinct calls with
     distinct results.
@@ -90,6 +140,15 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
     f.cache_info().  Clear the cache and statistics with f.cache_clear().
     Access the underlying function with f.__wrapped__.
 
+    f.cache_stats() returns a dict with extended statistics: hits,
+    misses, evictions, maxsize, max_bytes, currsize, nbytes (estimated
+    size of keys and results), miss_time (total seconds spent in
+    the underlying function), negative_hits (calls answered with a
+    cached exception), and negative_currsize (number of cached
+    exceptions).  In the persistent modes, the store may be shared
+    with other functions, so currsize, nbytes, and negative_currsize
+    are None.
+
     See:  http://en.wikipedia.org/wiki/Cache_algorithms#Least_Recently_Used
 
 
@@ -100,6 +159,25 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
         RUN:    queries are executed against caches; misses result in DataNotLocallyAvailableError
         VERIFY: always execute the function; if persistent cache value and returned value are different, raise VerifyFailedError
     :param cache: PersistentDict object or None;
+    :param name: if given, register the cache under this name in
+        :data:`hgvs.utils.cachestats.registry`, and trace calls answered
+        with a cached exception as "<name>.negative" spans
+    :param max_bytes: maximum total size of cached results; ignored in
+        the persistent modes
+    :param sizeof: function returning the size of a result in bytes
+    :param negative: exception classes to cache
+    :param negative_maxsize: maximum number of cached exceptions
+    :param negative_ttl: seconds after which a cached exception expires
+    :param negative_persistent: if True, LEARN mode writes cached
+        exceptions to the persistent cache, RUN mode raises them
+        again, and VERIFY mode checks that the function raises an
+        exception of the same type with the same args.
+        negative_maxsize does not apply to persistent caches, and
+        negative_ttl applies only in LEARN mode.  Cache files with
+        such entries cannot be read by hgvs versions without negative
+        caching.  If False, exceptions are cached in memory in LEARN
+        mode, as without a persistent cache, and not at all in RUN and
+        VERIFY modes.
 
     """  # noqa: E501
 
@@ -113,29 +191,111 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
 
         _cache = cache
         _maxsize = maxsize
+        _max_bytes = max_bytes
+        _sizeof = sizeof or sys.getsizeof
 
         if _cache is None:
             _cache = dict()
         elif mode is not None:
             _maxsize = None
-
-        stats = [0, 0]  # make statistics updateable non-locally
-        HITS, MISSES = 0, 1  # names for the stats fields
+            _max_bytes = None
+
+        def verify_error(error, args, kwds):
+            """call the function, and raise its exception if it is
+            consistent with the cached exception `error`; otherwise,
+            raise HGVSVerifyFailedError"""
+            try:
+                user_function(*args, **kwds)
+            except Exception as e:
+                if type(e) is type(error) and e.args == error.args:
+                    raise
+                cause = e
+            else:
+                cause = None
+            raise HGVSVerifyFailedError(
+                "The cached exception " + repr(error) + " is not consistent with latest result"
+                " when calling "
+                + user_function.__name__
+                + " with args "
+                + str(args)
+                + " and keywords "
+                + str(kwds)
+            ) from cause
+
+        stats = [0, 0, 0, 0.0, 0]  # make statistics updateable non-locally
+        HITS, MISSES, EVICTIONS, MISS_TIME, NEGATIVE_HITS = 0, 1, 2, 3, 4  # names for stats fields
+        _negative = tuple(negative or ())  # `except ()` catches nothing
+        negative_cache = OrderedDict()  # key -> (exception, expiry); in-memory only
         make_key = _make_key
         cache_get = _cache.get  # bound method to lookup key or return None
         _len = len  # localize the global len() function
 
+        def trace_negative_hit():
+            # a call answered with a cached exception did no work; record
+            # it as a "<name>.negative" span (see hgvs.utils.accounting)
+            if name is not None:
+                with tracing.span(name + ".negative"):
+                    pass
+
         root = []  # root of the circular doubly linked list
-        root[:] = [root, root, None, None]  # initialize by pointing to self
+        root[:] = [root, root, None, None, 0]  # initialize by pointing to self
         nonlocal_root = [root]  # make updateable non-locally
-        PREV, NEXT, KEY, RESULT = 0, 1, 2, 3  # names for the link fields
+        PREV, NEXT, KEY, RESULT, SIZE = 0, 1, 2, 3, 4  # names for the link fields
+        cached_bytes = [0]  # total SIZE of links; updated only if _max_bytes
 
         if _maxsize == 0:
 
             def wrapper(*args, **kwds):
                 # no caching, just do a statistics update after a successful call
+                t0 = perf_counter()
                 result = user_function(*args, **kwds)
                 stats[MISSES] += 1
+                stats[MISS_TIME] += perf_counter() - t0
+                return result
+
+        elif _max_bytes is not None:
+
+            def wrapper(*args, **kwds):
+                # caching bounded by total result size (and by count if _maxsize)
+                key = make_key(user_function.__name__, args, kwds, typed, ())
+                with lock:
+                    link = cache_get(key)
+                    if link is not None:
+                        # move the link to the front of the list (most recent)
+                        link_prev, link_next, _, result, _ = link
+                        link_prev[NEXT] = link_next
+                        link_next[PREV] = link_prev
+                        last = root[PREV]
+                        last[NEXT] = root[PREV] = link
+                        link[PREV] = last
+                        link[NEXT] = root
+                        stats[HITS] += 1
+                        return result
+                t0 = perf_counter()
+                result = user_function(*args, **kwds)
+                miss_time = perf_counter() - t0
+                size = _sizeof(result)
+                with lock:
+                    stats[MISSES] += 1
+                    stats[MISS_TIME] += miss_time
+                    if key in _cache or size > _max_bytes:
+                        # added while the lock was released, or too large to cache
+                        return result
+                    last = root[PREV]
+                    link = [last, root, key, result, size]
+                    last[NEXT] = root[PREV] = _cache[key] = link
+                    cached_bytes[0] += size
+                    while cached_bytes[0] > _max_bytes or (
+                        _maxsize is not None and _len(_cache) > _maxsize
+                    ):
+                        # evict the least recently used link
+                        oldest = root[NEXT]
+                        oldest_next = oldest[NEXT]
+                        root[NEXT] = oldest_next
+                        oldest_next[PREV] = root
+                        del _cache[oldest[KEY]]
+                        cached_bytes[0] -= oldest[SIZE]
+                        stats[EVICTIONS] += 1
                 return result
 
         elif _maxsize is None:
@@ -144,6 +304,15 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                 # simple caching without ordering or size limit
                 key = make_key(user_function.__name__, args, kwds, typed, ())
                 result = cache_get(key, root)  # root used here as a unique not-found sentinel
+                if isinstance(result, _CachedError):
+                    if mode == VERIFY:
+                        stats[NEGATIVE_HITS] += 1
+                        verify_error(result.error, args, kwds)
+                    if mode == RUN or not result.expired(negative_ttl):
+                        stats[NEGATIVE_HITS] += 1
+                        trace_negative_hit()
+                        raise copy.copy(result.error)
+                    result = root  # expired; call the function again
                 if result is not root:
                     stats[HITS] += 1
                     if mode == VERIFY:
@@ -167,11 +336,21 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                         + " and keywords "
                         + str(kwds)
                     )
-                result = user_function(*args, **kwds)
+                t0 = perf_counter()
+                try:
+                    result = user_function(*args, **kwds)
+                except _negative as e:
+                    if mode == LEARN and negative_persistent:
+                        _cache[key] = _CachedError(e)
+                        _cache.sync()
+                        stats[MISSES] += 1
+                        stats[MISS_TIME] += perf_counter() - t0
+                    raise
                 _cache[key] = result
                 if mode == LEARN:
                     _cache.sync()
                 stats[MISSES] += 1
+                stats[MISS_TIME] += perf_counter() - t0
                 return result
 
         else:
@@ -184,7 +363,7 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                     if link is not None:
                         # record recent use of the key by moving it to the front of the list
                         (root,) = nonlocal_root
-                        link_prev, link_next, key, result = link
+                        link_prev, link_next, key, result, _ = link
                         link_prev[NEXT] = link_next
                         link_next[PREV] = link_prev
                         last = root[PREV]
@@ -193,7 +372,9 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                         link[NEXT] = root
                         stats[HITS] += 1
                         return result
+                t0 = perf_counter()
                 result = user_function(*args, **kwds)
+                miss_time = perf_counter() - t0
                 with lock:
                     (root,) = nonlocal_root
                     if key in _cache:
@@ -214,14 +395,55 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
                         # now update the cache dictionary for the new links
                         del _cache[oldkey]
                         _cache[key] = oldroot
+                        stats[EVICTIONS] += 1
                     else:
                         # put result in a new link at the front of the list
                         last = root[PREV]
-                        link = [last, root, key, result]
+                        link = [last, root, key, result, 0]
                         last[NEXT] = root[PREV] = _cache[key] = link
                     stats[MISSES] += 1
+                    stats[MISS_TIME] += miss_time
                 return result
 
+        if (
+            _negative
+            and negative_maxsize != 0
+            and (mode is None or (mode == LEARN and not negative_persistent))
+        ):
+            cached_wrapper = wrapper
+
+            def wrapper(*args, **kwds):
+                # cache the exceptions in _negative, separately from results
+                key = make_key(user_function.__name__, args, kwds, typed, ())
+                with lock:
+                    entry = negative_cache.get(key)
+                    if entry is not None:
+                        error, expiry = entry
+                        if expiry is None or monotonic() < expiry:
+                            negative_cache.move_to_end(key)
+                            stats[NEGATIVE_HITS] += 1
+                            trace_negative_hit()
+                            raise copy.copy(error)
+                        del negative_cache[key]
+                t0 = perf_counter()
+                try:
+                    return cached_wrapper(*args, **kwds)
+                except _negative as e:
+                    if mode == LEARN:
+                        entry = cache_get(key)
+                        if isinstance(entry, _CachedError) and not entry.expired(negative_ttl):
+                            # raised from the persistent cache, and counted there
+                            raise
+                    expiry = None if negative_ttl is None else monotonic() + negative_ttl
+                    with lock:
+                        stats[MISSES] += 1
+                        stats[MISS_TIME] += perf_counter() - t0
+                        negative_cache[key] = (copy.copy(e), expiry)
+                        negative_cache.move_to_end(key)
+                        if negative_maxsize is not None and len(negative_cache) > negative_maxsize:
+                            negative_cache.popitem(last=False)
+                    raise
+
         def cache_info():
             """Report cache statistics"""
             with lock:
@@ -232,12 +454,54 @@ def lru_cache(maxsize=100, typed=False, mode=None, cache=None):
             with lock:
                 _cache.clear()
                 root = nonlocal_root[0]
-                root[:] = [root, root, None, None]
-                stats[:] = [0, 0]
+                root[:] = [root, root, None, None, 0]
+                stats[:] = [0, 0, 0, 0.0, 0]
+                cached_bytes[0] = 0
+                negative_cache.clear()
+
+        def cache_stats():
+            """Report extended cache statistics as a dict"""
+            with lock:
+                hits, misses, evictions, miss_time, negative_hits = stats
+                negative_currsize = len(negative_cache)
+                if mode is not None:
+                    # persistent stores may be shared by several functions
+                    # and may be large, so their contents are not inspected
+                    items = None
+                elif _maxsize or _max_bytes is not None:
+                    # values are links of the recency list
+                    items = [(link[KEY], link[RESULT]) for link in _cache.values()]
+                else:
+                    items = list(_cache.items())
+            if items is None:
+                currsize = nbytes = negative_currsize = None
+            else:
+                currsize = len(items)
+                nbytes = sum(
+                    cachestats.estimate_nbytes(k, follow_objects=False)
+                    + cachestats.estimate_nbytes(r)
+                    for k, r in items
+                )
+            return {
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+                "maxsize": _maxsize,
+                "max_bytes": _max_bytes,
+                "currsize": currsize,
+                "nbytes": nbytes,
+                "miss_time": miss_time,
+                "negative_hits": negative_hits,
+                "negative_currsize": negative_currsize,
+            }
 
         wrapper.__wrapped__ = user_function
         wrapper.cache_info = cache_info
         wrapper.cache_clear = cache_clear
-        return update_wrapper(wrapper, user_function)
+        wrapper.cache_stats = cache_stats
+        wrapper = update_wrapper(wrapper, user_function)
+        if name is not None:
+            cachestats.registry.register(name, wrapper)
+        return wrapper
 
     return decorating_function
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Decorator that serves subsequences from fixed-size, aligned blocks.
+
+Cached sequence fetches are keyed by their exact (ac, start_i, end_i)
+arguments, so overlapping windows of the same sequence (e.g., those
+requested by the normalizer, the reference replacement in the variant
+mapper, and the validator) each miss the cache.  `seq_blocks` instead
+fetches block-aligned ranges [k * block_size, (k + 1) * block_size) and
+returns the requested subrange by slicing the blocks.  When the
+decorated function is cached (see `hgvs.decorators.lru_cache`), any
+subrange within previously fetched blocks is served without a fetch.
+
+Sequences shorter than one block (e.g., nearly all transcripts with
+a block size of 65536) are thus fetched whole, as the first block.
+Requests for whole sequences (end_i=None) and ranges longer than a
+block are passed through as a single fetch, since serving them from
+blocks would take one fetch per block (thousands for a chromosome).
+
+>>> fetches = []
+>>> @seq_blocks(block_size=4)
+... def get_seq(ac, start_i=None, end_i=None):
+...     fetches.append((start_i, end_i))
+...     return "ACGTACGTAC"[start_i:end_i]
+>>> get_seq("NM_01234.5", 2, 5)
+'GTA'
+>>> fetches
+[(0, 4), (4, 8)]
+>>> get_seq("NM_01234.5", 6, 9)
+'GTA'
+>>> fetches[2:]
+[(4, 8), (8, 12)]
+>>> get_seq("NM_01234.5")
+'ACGTACGTAC'
+>>> fetches[4:]
+[(None, None)]
+
+"""
+
+from functools import update_wrapper
+
+
+def seq_blocks(block_size):
+    """Decorator for functions with the signature of
+    `hgvs.dataproviders.interface.Interface.get_seq`.
+
+    Calls are served from blocks of `block_size` characters that are
+    fetched with the decorated function.  A block shorter than
+    `block_size` marks the end of the sequence, so ranges that extend
+    past the end are truncated, as when slicing.  Calls with
+    end_i=None, with ranges longer than `block_size`, or with negative
+    or empty ranges are passed through unchanged.
+
+    """
+
+    def decorating_function(fetch):
+        def wrapper(ac, start_i=None, end_i=None):
+            start = start_i or 0
+            if end_i is None or start < 0 or not 0 < end_i - start <= block_size:
+                return fetch(ac, start_i, end_i)
+            first = start // block_size
+            blocks = []
+            for k in range(first, (end_i - 1) // block_size + 1):
+                block = fetch(ac, k * block_size, (k + 1) * block_size)
+                blocks.append(block)
+                if len(block) < block_size:
+                    break  # end of sequence
+            offset = first * block_size
+            return "".join(blocks)[start - offset : end_i - offset]
+
+        wrapper.block_size = block_size
+        return update_wrapper(wrapper, fetch)
+
+    return decorating_function
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
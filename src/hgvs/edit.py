@@ -15,6 +15,7 @@ import six
 from bioutils.sequences import aa1_to_aa3, aa_to_aa1
 
 import hgvs
+import hgvs.utils.binary
 from hgvs.exceptions import HGVSError, HGVSUnsupportedOperationError
 
 
@@ -24,15 +25,16 @@ class Edit(abc.ABC):
         return str(self)
 
     def _format_config_na(self, conf=None):
-        max_ref_length = hgvs.global_config.formatting.max_ref_length
+        max_ref_length = hgvs.global_config.snapshot().formatting.max_ref_length
         if conf and "max_ref_length" in conf:
             max_ref_length = conf["max_ref_length"]
         return max_ref_length
 
     def _format_config_aa(self, conf=None):
-        p_3_letter = hgvs.global_config.formatting.p_3_letter
-        p_term_asterisk = hgvs.global_config.formatting.p_term_asterisk
-        p_init_met = hgvs.global_config.formatting.p_init_met
+        formatting = hgvs.global_config.snapshot().formatting
+        p_3_letter = formatting.p_3_letter
+        p_term_asterisk = formatting.p_term_asterisk
+        p_init_met = formatting.p_init_met
 
         if conf and "p_3_letter" in conf and conf["p_3_letter"] is not None:
             p_3_letter = conf["p_3_letter"]
@@ -42,6 +44,15 @@ class Edit(abc.ABC):
             p_init_met = conf["p_init_met"]
         return p_3_letter, p_term_asterisk, p_init_met
 
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _del_ins_lengths(self, ilen):
         raise HGVSUnsupportedOperationError(
             "internal function _del_ins_lengths not implemented for this variant type"
@@ -139,6 +150,14 @@ class NARefAlt(Edit):
 
     __str__ = format
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.alt = self.alt
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -244,6 +263,15 @@ class AARefAlt(Edit):
 
     __str__ = format
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.alt = self.alt
+        new.uncertain = self.uncertain
+        new.init_met = self.init_met
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -333,6 +361,15 @@ class AAFs(Edit):
 
     __str__ = format
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.alt = self.alt
+        new.length = self.length
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -382,6 +419,16 @@ class AAExt(Edit):
 
     __str__ = format
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.alt = self.alt
+        new.aaterm = self.aaterm
+        new.length = self.length
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -433,6 +480,13 @@ class Dup(Edit):
             else None
         )
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -478,6 +532,15 @@ class Repeat(Edit):
 
     __str__ = format
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.min = self.min
+        new.max = self.max
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -512,6 +575,13 @@ class NACopy(Edit):
         s = "copy{}".format(self.copy)
         return "(" + s + ")" if self.uncertain else s
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.copy = self.copy
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -545,6 +615,13 @@ class Inv(Edit):
     def __str__(self):
         return "inv"
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.ref = self.ref
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -603,6 +680,16 @@ class Conv(Edit):
             s = "con"
         return "(" + s + ")" if self.uncertain else s
 
+    def clone(self):
+        """return a deep copy of this edit"""
+        new = object.__new__(type(self))
+        new.from_ac = self.from_ac
+        new.from_type = self.from_type
+        from_pos = self.from_pos
+        new.from_pos = None if from_pos is None else from_pos.clone()
+        new.uncertain = self.uncertain
+        return new
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""fast, reusable formatting of variants
+
+`SequenceVariant.format()` and the format methods of the objects it
+contains resolve the formatting options (max_ref_length, p_3_letter,
+p_term_asterisk, p_init_met) from the configuration and the conf
+dict on every call.  A `Formatter` resolves the options once, when it
+is created, and formats variants with specialized code for the common
+position and edit classes.  The result is identical to
+``var.format(conf)``:
+
+>>> import hgvs.parser
+>>> hp = hgvs.parser.Parser()
+>>> var = hp.parse("NP_001628.1:p.Gly528Arg")
+>>> Formatter().format(var)
+'NP_001628.1:p.Gly528Arg'
+>>> Formatter({"p_3_letter": False}).format(var)
+'NP_001628.1:p.G528R'
+
+`format_many` formats a sequence of variants, one per line, and
+writes them directly to a file or buffer:
+
+>>> import io
+>>> out = io.StringIO()
+>>> Formatter().format_many([var, hp.parse("NM_01234.5:c.22+1A>T")], out)
+2
+>>> print(out.getvalue(), end="")
+NP_001628.1:p.Gly528Arg
+NM_01234.5:c.22+1A>T
+
+Options are resolved against `hgvs.global_config` when the Formatter
+is created; later configuration changes do not affect it.
+
+"""
+
+from bioutils.sequences import aa1_to_aa3_lut
+
+import hgvs
+import hgvs.edit
+import hgvs.location
+from hgvs.enums import Datum
+
+_conf_options = ("max_ref_length", "p_3_letter", "p_term_asterisk", "p_init_met")
+
+_CDS_END = Datum.CDS_END
+
+
+class Formatter:
+    """formats variants with precompiled formatting options
+
+    :param conf: a dict of formatting options, as for
+      `SequenceVariant.format()`; options that are missing (or None,
+      except for max_ref_length) are taken from the global
+      configuration
+
+    """
+
+    def __init__(self, conf=None):
+        formatting = hgvs.global_config.snapshot().formatting
+        self.max_ref_length = formatting.max_ref_length
+        self.p_3_letter = formatting.p_3_letter
+        self.p_term_asterisk = formatting.p_term_asterisk
+        self.p_init_met = formatting.p_init_met
+        if conf:
+            if "max_ref_length" in conf:
+                self.max_ref_length = conf["max_ref_length"]
+            for name in _conf_options[1:]:
+                if conf.get(name) is not None:
+                    setattr(self, name, conf[name])
+
+        # conf passed to format methods of objects without a fast path
+        self.conf = {name: getattr(self, name) for name in _conf_options}
+
+        # amino acid sequence -> formatted sequence for single residues;
+        # "Ter" becomes "*" only when it is the whole sequence
+        if self.p_3_letter:
+            self._aa_map = dict(aa1_to_aa3_lut)
+            if self.p_term_asterisk:
+                self._aa_map["*"] = "*"
+        else:
+            self._aa_map = None
+
+        self._formatters = {
+            hgvs.location.SimplePosition: self._format_simple_position,
+            hgvs.location.BaseOffsetPosition: self._format_base_offset_position,
+            hgvs.location.AAPosition: self._format_aa_position,
+            hgvs.location.Interval: self._format_interval,
+            hgvs.location.BaseOffsetInterval: self._format_interval,
+            hgvs.edit.NARefAlt: self._format_na_ref_alt,
+            hgvs.edit.AARefAlt: self._format_aa_ref_alt,
+            hgvs.edit.AASub: self._format_aa_sub,
+            hgvs.edit.AAFs: self._format_aa_fs,
+            hgvs.edit.AAExt: self._format_aa_ext,
+            hgvs.edit.Dup: self._format_dup,
+        }
+
+    def format(self, var):
+        """return `var` (a SequenceVariant) as a string"""
+        ac = var.ac
+        if ac:
+            gene = var.gene
+            ref = ac + "(" + gene + "):" if gene else ac + ":"
+        else:
+            ref = ""
+        posedit = var.posedit
+        return ref + var.type + "." + ("?" if posedit is None else self.format_posedit(posedit))
+
+    def format_posedit(self, posedit):
+        """return `posedit` (a PosEdit) as a string"""
+        pos = posedit.pos
+        edit = posedit.edit
+        if edit.__class__ is str:
+            edit_s = edit
+        else:
+            edit_s = self._dispatch(edit)
+        rv = edit_s if pos is None else self._dispatch(pos) + edit_s
+        if posedit.uncertain:
+            if edit in ["0", ""]:
+                rv = rv + "?"
+            else:
+                rv = "(" + rv + ")"
+        return rv
+
+    def format_many(self, variants, out=None, end="\n", chunk_size=1000):
+        """format each variant in `variants`, followed by `end`
+
+        If `out` is None, the concatenated result is returned as a
+        string.  Otherwise, the result is written to `out` (a
+        text-mode file or buffer, or any object with a write method)
+        in chunks of `chunk_size` variants, and the number of variants
+        written is returned.
+
+        """
+        fmt = self.format
+        if out is None:
+            return "".join([fmt(var) + end for var in variants])
+        write = out.write
+        n = 0
+        chunk = []
+        append = chunk.append
+        for var in variants:
+            append(fmt(var) + end)
+            n += 1
+            if len(chunk) == chunk_size:
+                write("".join(chunk))
+                chunk.clear()
+        if chunk:
+            write("".join(chunk))
+        return n
+
+    def _dispatch(self, obj):
+        try:
+            fn = self._formatters[obj.__class__]
+        except KeyError:
+            fn = self._formatters[obj.__class__] = self._find_formatter(obj.__class__)
+        return fn(obj)
+
+    def _find_formatter(self, cls):
+        # subclasses (e.g., frozen classes) use the fast path of their
+        # nearest base if they don't override format or __str__
+        for base in cls.__mro__[1:]:
+            fn = self._formatters.get(base)
+            if fn is not None:
+                if cls.format is base.format and cls.__str__ is base.__str__:
+                    return fn
+                break
+        return self._format_with_conf
+
+    def _format_with_conf(self, obj):
+        return obj.format(self.conf)
+
+    def _aa(self, seq):
+        aa_map = self._aa_map
+        if aa_map is None:
+            return seq
+        s = aa_map.get(seq)
+        if s is None:
+            s = "".join([aa1_to_aa3_lut[aa1] for aa1 in seq])
+        return s
+
+    # positions
+
+    def _format_simple_position(self, pos):
+        base = pos.base
+        s = "?" if base is None else str(base)
+        return "(" + s + ")" if pos.uncertain else s
+
+    def _format_base_offset_position(self, pos):
+        base = pos.base
+        offset = pos.offset
+        if base is None:
+            s = "?"
+        elif pos.datum is _CDS_END:
+            s = "*" + str(base)
+        else:
+            s = str(base)
+        if offset is None:
+            s += "+?"
+        elif offset:
+            s += "%+d" % offset
+        return "(" + s + ")" if pos.uncertain else s
+
+    def _format_aa_position(self, pos):
+        aa = pos.aa
+        base = pos.base
+        s = ("?" if aa is None else self._aa(aa)) + ("?" if base is None else str(base))
+        return "(" + s + ")" if pos.uncertain else s
+
+    def _format_interval(self, iv):
+        start = iv.start
+        if start is None:
+            return ""
+        end = iv.end
+        if end is None or start == end:
+            return self._dispatch(start)
+        s = self._dispatch(start) + "_" + self._dispatch(end)
+        return "(" + s + ")" if iv.uncertain else s
+
+    # edits
+
+    def _na_ref(self, ref):
+        max_ref_length = self.max_ref_length
+        if max_ref_length is None:
+            return ref
+        if ref and ref[0] in "ACGTUN" and len(ref) <= max_ref_length:
+            return ref
+        return ""
+
+    def _format_na_ref_alt(self, edit):
+        ref = edit.ref
+        alt = edit.alt
+        if ref is None:
+            if alt.__class__ is not str:
+                return self._format_with_conf(edit)
+            s = "ins" + alt
+        elif ref.__class__ is not str:
+            return self._format_with_conf(edit)
+        elif alt is None:
+            s = "del" + self._na_ref(ref)
+        elif alt.__class__ is not str:
+            return self._format_with_conf(edit)
+        elif ref == alt:
+            s = self._na_ref(ref) + "="
+        elif len(alt) == 1 and len(ref) == 1 and not ref.isdigit():
+            s = ref + ">" + alt
+        else:
+            s = "del" + self._na_ref(ref) + "ins" + alt
+        return "(" + s + ")" if edit.uncertain else s
+
+    def _format_aa_ref_alt(self, edit):
+        ref = edit.ref
+        alt = edit.alt
+        if ref is None and alt is None:
+            return "="
+        if edit.init_met:
+            if self.p_init_met:
+                s = "Met1?" if self.p_3_letter else "M1?"
+            else:
+                s = "?"
+        elif ref is not None and alt is not None:
+            if ref == alt:
+                s = self._aa(ref) + "="
+            elif len(ref) == 1 and len(alt) == 1:
+                s = self._aa(alt)
+            else:
+                s = "delins" + self._aa(alt)
+        elif alt is None:
+            s = "del"
+        else:
+            s = "ins" + self._aa(alt)
+        return "(" + s + ")" if edit.uncertain else s
+
+    def _format_aa_sub(self, edit):
+        alt = edit.alt
+        if alt is None:
+            return self._format_with_conf(edit)
+        s = alt if alt == "?" else self._aa(alt)
+        return "(" + s + ")" if edit.uncertain else s
+
+    def _format_aa_fs(self, edit):
+        alt = edit.alt
+        if alt is None:
+            return self._format_with_conf(edit)
+        length = edit.length
+        length_s = str(length) if length else ""
+        if self.p_3_letter:
+            alt = "".join([aa1_to_aa3_lut[aa1] for aa1 in alt])
+            s = alt + ("fs*" if self.p_term_asterisk else "fsTer") + length_s
+        else:
+            s = alt + "fs*" + length_s
+        return "(" + s + ")" if edit.uncertain else s
+
+    def _format_aa_ext(self, edit):
+        length = edit.length
+        s = (
+            self._aa(edit.alt or "")
+            + "ext"
+            + self._aa(edit.aaterm or "")
+            + (str(length) if length else "")
+        )
+        return "(" + s + ")" if edit.uncertain else s
+
+    def _format_dup(self, edit):
+        ref = edit.ref
+        if ref is None:
+            return "dup"
+        if ref.__class__ is not str:
+            return self._format_with_conf(edit)
+        return "dup" + self._na_ref(ref)
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
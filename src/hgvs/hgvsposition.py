@@ -5,6 +5,8 @@
 
 import attr
 
+import hgvs.utils.binary
+
 
 @attr.s(slots=True, repr=False)
 class HGVSPosition:
@@ -33,6 +35,25 @@ class HGVSPosition:
             ", ".join((a.name + "=" + str(getattr(self, a.name))) for a in self.__attrs_attrs__),
         )
 
+    def clone(self):
+        """return a deep copy of this position"""
+        new = object.__new__(type(self))
+        new.ac = self.ac
+        new.type = self.type
+        pos = self.pos
+        new.pos = None if pos is None else pos.clone()
+        new.gene = self.gene
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
 
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
@@ -21,6 +21,7 @@ import attr
 from bioutils.sequences import aa1_to_aa3
 
 import hgvs
+import hgvs.utils.binary
 from hgvs.enums import Datum, ValidationLevel
 from hgvs.exceptions import HGVSInvalidIntervalError, HGVSUnsupportedOperationError
 
@@ -50,6 +51,22 @@ class SimplePosition:
         """return True if the position is marked uncertain or undefined"""
         return self.uncertain or self.base is None
 
+    def clone(self):
+        """return a deep copy of this position"""
+        new = object.__new__(type(self))
+        new.base = self.base
+        new.uncertain = self.uncertain
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _set_uncertain(self):
         "mark this location as uncertain and return reference to self; this is called during parsing (see hgvs.ometa)"
         self.uncertain = True
@@ -122,7 +139,7 @@ class BaseOffsetPosition:
         if self.base is not None and self.base == 0:
             return (ValidationLevel.ERROR, "BaseOffsetPosition base may not be 0")
         if (
-            hgvs.global_config.mapping.strict_bounds
+            hgvs.global_config.snapshot().mapping.strict_bounds
             and self.base is not None
             and self.datum != Datum.CDS_START
             and self.base < 1
@@ -157,6 +174,24 @@ class BaseOffsetPosition:
             ", ".join((a.name + "=" + str(getattr(self, a.name))) for a in self.__attrs_attrs__),
         )
 
+    def clone(self):
+        """return a deep copy of this position"""
+        new = object.__new__(type(self))
+        new.base = self.base
+        new.offset = self.offset
+        new.datum = self.datum
+        new.uncertain = self.uncertain
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _set_uncertain(self):
         "mark this location as uncertain and return reference to self; this is called during parsing (see hgvs.ometa)"
         self.uncertain = True
@@ -234,8 +269,9 @@ class AAPosition:
     def format(self, conf=None):
         self.validate()
 
-        p_3_letter = hgvs.global_config.formatting.p_3_letter
-        p_term_asterisk = hgvs.global_config.formatting.p_term_asterisk
+        formatting = hgvs.global_config.snapshot().formatting
+        p_3_letter = formatting.p_3_letter
+        p_term_asterisk = formatting.p_term_asterisk
         if conf and "p_3_letter" in conf and conf["p_3_letter"] is not None:
             p_3_letter = conf["p_3_letter"]
         if conf and "p_term_asterisk" in conf and conf["p_term_asterisk"] is not None:
@@ -264,6 +300,23 @@ class AAPosition:
         """return base, for backward compatibility"""
         return self.base
 
+    def clone(self):
+        """return a deep copy of this position"""
+        new = object.__new__(type(self))
+        new.base = self.base
+        new.aa = self.aa
+        new.uncertain = self.uncertain
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _set_uncertain(self):
         "mark this location as uncertain and return reference to self; this is called during parsing (see hgvs.ometa)"
         self.uncertain = True
@@ -351,6 +404,41 @@ class Interval:
             ", ".join((a.name + "=" + str(getattr(self, a.name))) for a in self.__attrs_attrs__),
         )
 
+    def clone(self):
+        """return a deep copy of this interval"""
+        new = object.__new__(type(self))
+        start = self.start
+        new.start = None if start is None else start.clone()
+        end = self.end
+        new.end = None if end is None else end.clone()
+        new.uncertain = self.uncertain
+        return new
+
+    @classmethod
+    def unchecked(cls, start, end, uncertain=False):
+        """return a new interval without running the attrs initializer
+
+        For BaseOffsetInterval, __attrs_post_init__ is skipped as well:
+        the datums of `start` and `end` are neither adjusted nor
+        checked.  Use this only for internally computed intervals that
+        are known to be valid, e.g., in AlignmentMapper.
+
+        """
+        new = object.__new__(cls)
+        new.start = start
+        new.end = end
+        new.uncertain = uncertain
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _set_uncertain(self):
         "mark this interval as uncertain and return reference to self; this is called during parsing (see hgvs.ometa)"
         self.uncertain = True
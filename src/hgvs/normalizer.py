@@ -2,12 +2,12 @@
 """hgvs.normalizer
 """
 
-import copy
 import logging
 
 from bioutils.sequences import reverse_complement
 
 import hgvs
+import hgvs.utils.frozen
 import hgvs.validator
 import hgvs.variantmapper
 from hgvs.dataproviders.ncbi import connect
@@ -17,6 +17,7 @@ from hgvs.exceptions import (
     HGVSUnsupportedOperationError,
 )
 from hgvs.utils.norm import normalize_alleles
+from hgvs.utils.tracing import traced
 
 _logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class Normalizer:
             self.validator = hgvs.validator.IntrinsicValidator(strict=False)
         self.vm = variantmapper or hgvs.variantmapper.VariantMapper(self.hdp)
 
+    @traced
     def normalize(self, var):
         """Perform sequence variants normalization for single variant"""
         assert isinstance(
@@ -86,10 +88,12 @@ class Normalizer:
                 "Unsupported normalization of conversion variants: {0}", format(var)
             )
 
-        var.fill_ref(self.hdp)
+        var = var.fill_ref(self.hdp)
 
         if var.posedit.edit.type == "identity":
-            var_norm = copy.deepcopy(var)
+            if hgvs.utils.frozen.is_frozen(var):
+                return var
+            var_norm = var.clone()
             return var_norm
 
         # For c. variants normalization, first convert to n. variant
@@ -118,7 +122,7 @@ class Normalizer:
                 return "Bad Request" not in str(e)
 
         if var.posedit.pos.start.base < 0 or not is_valid_pos(var.ac, var.posedit.pos.end.base):
-            if hgvs.global_config.mapping.strict_bounds:
+            if hgvs.global_config.snapshot().mapping.strict_bounds:
                 raise HGVSInvalidVariantError(f"{var}: coordinates are out-of-bounds")
             _logger.warning(f"{var}: coordinates are out-of-bounds; returning as-is")
             return orig_var
@@ -201,13 +205,19 @@ class Normalizer:
             ref_start = tgt_len
             ref_end = tgt_len
 
-        var_norm = copy.deepcopy(var)
-        var_norm.posedit.edit = edit
-        var_norm.posedit.pos.start.base = ref_start
-        var_norm.posedit.pos.end.base = ref_end
+        # build the normalized variant from new posedit, interval, and
+        # positions; var itself is not modified
+        evolve = hgvs.utils.frozen.evolve
+        pos = var.posedit.pos
+        pos_norm = evolve(
+            pos, start=evolve(pos.start, base=ref_start), end=evolve(pos.end, base=ref_end)
+        )
+        var_norm = evolve(var, posedit=evolve(var.posedit, pos=pos_norm, edit=edit))
 
         if type == "c":
             var_norm = self.vm.n_to_c(var_norm)
+            if hgvs.utils.frozen.is_frozen(orig_var):
+                var_norm = hgvs.utils.frozen.freeze(var_norm)
 
         return var_norm
 
@@ -376,7 +386,7 @@ class Normalizer:
         """Normalize the variant until it could not be shuffled"""
 
         ref, alt = self._get_ref_alt(var, boundary)
-        win_size = hgvs.global_config.normalizer.window_size
+        win_size = hgvs.global_config.snapshot().normalizer.window_size
 
         if self.shuffle_direction == 3:
             if var.posedit.edit.type == "ins":
@@ -4,9 +4,20 @@ components, such as intronic-offset coordiates
 
 """
 
+import argparse
+import collections
+import concurrent.futures
+import contextlib
 import copy
+import gzip
+import io
+import itertools
+import json
 import logging
+import queue
 import re
+import sys
+import threading
 
 import bioutils.sequences
 import ometa.runtime
@@ -21,9 +32,143 @@ import hgvs.hgvsposition
 import hgvs.location
 import hgvs.posedit
 import hgvs.sequencevariant
-from hgvs.exceptions import HGVSParseError
+import hgvs.utils.accessions
+import hgvs.utils.rdparser
+from hgvs.decorators.lru_cache import _CacheInfo, lru_cache
+from hgvs.enums import Datum
+from hgvs.exceptions import HGVSParseError, HGVSUsageError
 from hgvs.generated.hgvs_grammar import createParserClass
 
+# Result record yielded by Parser.parse_many in place of a
+# SequenceVariant when an input fails to parse.  Records are plain
+# tuples and therefore cheap to create and to pass between processes.
+ParseFailure = collections.namedtuple("ParseFailure", ["input", "message"])
+
+# Precompiled recognizer for the most common variant shapes:
+# substitutions, deletions, duplications, insertions, delins and
+# identity on g., m., c., and n. sequences with definite positions.
+# The expressions mirror the corresponding rules in hgvs.pymeta, but
+# accept only a strict (ASCII, uppercase sequence) subset of them.
+# Strings that do not match are parsed by the grammar, so the
+# recognizer only needs to be correct for what it accepts.
+_accn_re = r"[A-Za-z](?:[A-Za-z0-9]|[-_](?=[A-Za-z0-9]))*(?:\.[0-9]+)?"
+_gene_re = r"[A-Za-z](?:[A-Za-z0-9]|[-_](?=[A-Za-z0-9]))+"
+_dna_re = r"[ACGTRYMKWSBDHVN]"
+_fast_variant_re = re.compile(
+    r"(?P<ac>{accn})(?:\((?P<gene>{gene})\))?:(?P<type>[cgmn])\."
+    r"(?P<s_star>\*)?(?P<s_base>[-+]?[0-9]+)(?P<s_offset>[-+][0-9]+)?"
+    r"(?:_(?P<e_star>\*)?(?P<e_base>[-+]?[0-9]+)(?P<e_offset>[-+][0-9]+)?)?"
+    r"(?:(?P<sub_ref>{dna})>(?P<sub_alt>{dna})"
+    r"|(?P<ident>{dna}*)="
+    r"|del(?P<del>[0-9]+|{dna}*)(?:ins(?P<delins>{dna}+))?"
+    r"|ins(?P<ins>{dna}+)"
+    r"|dup(?P<dup>{dna}*))\Z".format(accn=_accn_re, gene=_gene_re, dna=_dna_re)
+)
+_datum_for_type = {"c": Datum.CDS_START, "n": Datum.SEQ_START}
+
+# Accessions of variants returned by Parser.parse and parse_lazy are
+# interned, so that variants on the same sequence share one string;
+# see hgvs.utils.accessions for the limits
+_intern_ac = hgvs.utils.accessions.registry.intern
+
+# Header (accession, optional gene, and type) for Parser.parse_lazy
+_lazy_header_re = re.compile(r"(" + _accn_re + r")(?:\((" + _gene_re + r")\))?:([cgmnpr])\.")
+
+
+def _fast_parse_position(type, star, base, offset):
+    """returns a position for the matched groups, or None if the
+    groups are not valid for the sequence type"""
+    if type in "gm":
+        if star or offset or base[0] in "-+":
+            return None
+        return hgvs.location.SimplePosition(int(base))
+    if star:
+        if type != "c" or base[0] in "-+":
+            return None
+        datum = Datum.CDS_END
+    else:
+        datum = _datum_for_type[type]
+    return hgvs.location.BaseOffsetPosition(int(base), int(offset) if offset else 0, datum=datum)
+
+
+def _fast_parse_hgvs_variant(s):
+    """parse common, simple variants without the grammar
+
+    Returns a SequenceVariant identical to the one that the
+    `hgvs_variant` rule would return, or None if `s` is not one of the
+    shapes handled here (which does not imply that `s` is invalid).
+
+    """
+    m = _fast_variant_re.match(s)
+    if m is None:
+        return None
+    (
+        ac,
+        gene,
+        type,
+        s_star,
+        s_base,
+        s_offset,
+        e_star,
+        e_base,
+        e_offset,
+        sub_ref,
+        sub_alt,
+        ident,
+        del_,
+        delins,
+        ins,
+        dup,
+    ) = m.groups()
+
+    start = _fast_parse_position(type, s_star, s_base, s_offset)
+    if start is None:
+        return None
+    if e_base is None:
+        end = _fast_parse_position(type, s_star, s_base, s_offset)
+    else:
+        end = _fast_parse_position(type, e_star, e_base, e_offset)
+        if end is None:
+            return None
+    if type in "gm":
+        pos = hgvs.location.Interval(start, end)
+    else:
+        pos = hgvs.location.BaseOffsetInterval(start, end)
+
+    if sub_ref is not None:
+        edit = hgvs.edit.NARefAlt(ref=sub_ref, alt=sub_alt)
+    elif ident is not None:
+        edit = hgvs.edit.NARefAlt(ref=ident, alt=ident)
+    elif del_ is not None:
+        edit = hgvs.edit.NARefAlt(ref=del_, alt=delins)
+    elif ins is not None:
+        edit = hgvs.edit.NARefAlt(ref=None, alt=ins)
+    else:
+        edit = hgvs.edit.Dup(ref=dup)
+
+    return hgvs.sequencevariant.SequenceVariant(
+        ac=ac, gene=gene, type=type, posedit=hgvs.posedit.PosEdit(pos=pos, edit=edit)
+    )
+
+
+# Lexical pre-check for rules that parse a complete variant or
+# position (accn, optional gene, ':', type, '.', posedit).  The
+# expressions are deliberately more permissive than the grammar: they
+# reject only strings that the grammar cannot possibly accept, such
+# as free text or variants without an accession, and leave everything
+# else to the grammar.
+_precheck_header_re = r"[^\W\d_][\w.()-]*:"
+_precheck_body_re = r"\.[\w()*+.:=>?-]+\Z"
+_precheck_res = {}
+for _t in "cgmnpr":
+    _precheck_res[_t + "_variant"] = _precheck_res[_t + "_hgvs_position"] = re.compile(
+        _precheck_header_re + _t + _precheck_body_re
+    )
+_precheck_res["hgvs_variant"] = _precheck_res["hgvs_position"] = re.compile(
+    _precheck_header_re + "[cgmnpr]" + _precheck_body_re
+)
+del _t
+
 
 class Parser:
     """Provides comprehensive parsing of HGVS variant strings (*i.e.*,
@@ -84,20 +229,102 @@ class Parser:
       >>> hp.parse_c_interval("22+1")
       BaseOffsetInterval(start=22+1, end=22+1, uncertain=False)
 
+    When `fast_path` is True, `parse_hgvs_variant` (and therefore
+    `parse`) first tries a precompiled recognizer for the most common
+    variant shapes (substitutions, del, dup, ins, delins, and
+    identity on g., m., c., and n. sequences) and falls back to the
+    grammar for everything else.  Results are identical to those from
+    the grammar.  The fast path assumes the default grammar and is
+    ignored when `grammar_fn` is given.
+
+      >>> fp = Parser(fast_path=True)
+      >>> fp.parse("NM_000014.4:c.2126-7_2126-3delACCAT") == hp.parse("NM_000014.4:c.2126-7_2126-3delACCAT")
+      True
+
+    The `backend` argument selects the implementation of the grammar
+    rules.  "ometa" (the default) uses the parser generated from the
+    OMeta grammar.  "rd" uses a hand-written recursive-descent parser
+    (:mod:`hgvs.utils.rdparser`) that implements the same grammar
+    without backtracking across variant types.  Results are identical;
+    the rd backend is considerably faster.
+
+      >>> rp = Parser(backend="rd")
+      >>> rp.parse("NP_012345.6:p.Ala22Trp")
+      SequenceVariant(ac=NP_012345.6, type=p, posedit=Ala22Trp, gene=None)
+
+    When `precheck` is True, the variant and position parse functions
+    (`parse`, `parse_hgvs_variant`, `parse_c_variant`,
+    `parse_hgvs_position`, etc.) first apply a lexical check of the
+    accession, ':', type, and permitted characters, and raise
+    HGVSParseError immediately for strings that cannot be HGVS, such
+    as free text.  This is much cheaper than a failed grammar parse.
+    Strings that pass are parsed by the grammar as usual.
+
+      >>> Parser(precheck=True).parse("BRCA1 exon 11 deletion")
+      Traceback (most recent call last):
+      ...
+      hgvs.exceptions.HGVSParseError: BRCA1 exon 11 deletion: failed lexical pre-check for hgvs_variant
+
+    When `cache_size` is a positive integer, results of all parse
+    functions are memoized in a shared LRU cache of that size, keyed
+    by rule and input string.  Each call returns a fresh copy of the
+    cached result, so callers may modify parsed variants freely.
+    Statistics are available with `cache_info()`.
+
+      >>> cp = Parser(cache_size=1000)
+      >>> v1 = cp.parse("NM_01234.5:c.22+1A>T")
+      >>> v2 = cp.parse("NM_01234.5:c.22+1A>T")
+      >>> v1 == v2 and v1 is not v2
+      True
+      >>> cp.cache_info()
+      CacheInfo(hits=1, misses=1, maxsize=1000, currsize=1)
+
     """
 
-    def __init__(self, grammar_fn=None, expose_all_rules=False):
-        bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
-        if grammar_fn is None:
-            self._grammar = parsley.wrapGrammar(
-                createParserClass(ometa.runtime.OMetaGrammarBase, bindings)
+    backends = ("ometa", "rd")
+
+    def __init__(
+        self,
+        grammar_fn=None,
+        expose_all_rules=False,
+        fast_path=False,
+        backend="ometa",
+        cache_size=None,
+        precheck=False,
+    ):
+        if backend not in self.backends:
+            raise HGVSUsageError(
+                "backend must be one of {}; got {}".format(", ".join(self.backends), backend)
             )
+        if backend != "ometa" and grammar_fn is not None:
+            raise HGVSUsageError("grammar_fn may be used only with the ometa backend")
+        self.backend = backend
+        self._init_kwargs = dict(
+            grammar_fn=grammar_fn,
+            expose_all_rules=expose_all_rules,
+            fast_path=fast_path,
+            backend=backend,
+            cache_size=cache_size,
+            precheck=precheck,
+        )
+        if grammar_fn is None:
+            # the default grammar and its rule functions are built once
+            # per process and shared by all Parser instances
+            self._grammar = _default_grammar()
         else:
             # Still allow other grammars if you want
+            bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
             with open(grammar_fn, "r") as grammar_file:
                 self._grammar = parsley.makeGrammar(grammar_file.read(), bindings)
-        self._logger = logging.getLogger(__name__)
+        self._logger = _logger
         self._expose_rule_functions(expose_all_rules)
+        if fast_path and grammar_fn is None:
+            self._install_fast_path()
+        self._parse_cache = None
+        if cache_size:
+            self._install_parse_cache(cache_size)
+        if precheck and grammar_fn is None:
+            self._install_precheck()
 
     def parse(self, v):
         """parse HGVS variant `v`, returning a SequenceVariant
@@ -106,7 +333,177 @@ class Parser:
         :rtype: SequenceVariant
 
         """
-        return self.parse_hgvs_variant(v)
+        var = self.parse_hgvs_variant(v)
+        var.ac = _intern_ac(var.ac)
+        return var
+
+    def parse_lazy(self, v):
+        """parse HGVS variant `v`, deferring parsing of the posedit
+
+        :param str v: an HGVS-formatted variant as a string
+        :rtype: SequenceVariant
+
+        The accession, gene, and type are split from `v` immediately;
+        the posedit is parsed with the `<type>_posedit` rule when it is
+        first used.  The result is a
+        :class:`hgvs.sequencevariant.LazySequenceVariant`, which
+        behaves like (and turns into) an ordinary SequenceVariant.
+        This is useful when many variants are read but only some are
+        used, or only their accessions are needed.  Errors in the
+        posedit are raised when it is first accessed.  Strings whose
+        header is not a simple accession and gene are parsed eagerly.
+
+        >>> hp = Parser()
+        >>> v = hp.parse_lazy("NM_01234.5:c.22+1A>T")
+        >>> v.ac, v.type
+        ('NM_01234.5', 'c')
+        >>> v.posedit
+        PosEdit(pos=22+1, edit=A>T, uncertain=False)
+        >>> v == hp.parse("NM_01234.5:c.22+1A>T")
+        True
+
+        """
+        m = _lazy_header_re.match(v)
+        if m is None:
+            return self.parse(v)
+        ac, gene, type = m.groups()
+        unparsed = hgvs.sequencevariant._UnparsedPosEdit(
+            v[m.end() :], getattr(self, "parse_" + type + "_posedit")
+        )
+        return hgvs.sequencevariant.LazySequenceVariant(
+            ac=_intern_ac(ac), type=type, posedit=unparsed, gene=gene
+        )
+
+    def parse_many(self, variants, on_error="collect", workers=None, chunk_size=1000):
+        """parse an iterable of HGVS strings, yielding results in input order
+
+        :param variants: iterable of HGVS-formatted variant strings
+        :param str on_error: "collect" to yield a `ParseFailure` record in
+          place of each unparseable input, or "raise" to raise
+          HGVSParseError at the first failure
+        :param int workers: number of worker processes; None or 1
+          parses in this process
+        :param int chunk_size: number of inputs sent to a worker at a time
+        :rtype: generator of SequenceVariant or ParseFailure
+
+        Inputs are consumed lazily.  With workers, at most 2 * workers
+        chunks are in flight at any time, so memory use is bounded
+        regardless of the length of `variants`.
+
+        >>> hp = Parser()
+        >>> for r in hp.parse_many(["NM_01234.5:c.22+1A>T", "junk"]):
+        ...     print(repr(r))
+        SequenceVariant(ac=NM_01234.5, type=c, posedit=22+1A>T, gene=None)
+        ParseFailure(input='junk', message='junk: char 5: end of input')
+
+        """
+        if on_error not in ("collect", "raise"):
+            raise HGVSUsageError("on_error must be 'collect' or 'raise'; got {}".format(on_error))
+        if chunk_size < 1:
+            raise HGVSUsageError("chunk_size must be a positive integer")
+        if workers is None or workers <= 1:
+            results = (_parse_or_fail(self, s) for s in variants)
+        else:
+            results = self._parse_many_parallel(variants, workers, chunk_size)
+        return _check_results(results, on_error)
+
+    def _parse_many_parallel(self, variants, workers, chunk_size):
+        """parse `variants` in ordered chunks in a pool of worker processes"""
+
+        it = iter(variants)
+        chunks = iter(lambda: list(itertools.islice(it, chunk_size)), [])
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self._init_kwargs,)
+        ) as executor:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_parse_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def cache_info(self):
+        """return parse cache statistics as a named tuple (hits, misses,
+        maxsize, currsize); all fields are 0 when caching is disabled
+
+        """
+        if self._parse_cache is None:
+            return _CacheInfo(0, 0, 0, 0)
+        return self._parse_cache.cache_info()
+
+    def cache_clear(self):
+        """clear the parse cache and its statistics"""
+        if self._parse_cache is not None:
+            self._parse_cache.cache_clear()
+
+    def _install_parse_cache(self, maxsize):
+        """wrap the exposed parse functions with a shared LRU cache
+
+        The cache is keyed by (rule name, input string).  Parse results
+        are mutable (e.g., VariantMapper.fill_ref updates variants in
+        place), so callers receive a clone() of the cached result.
+        """
+
+        rule_fxns = {
+            att_name[len("parse_") :]: fxn
+            for att_name, fxn in vars(self).items()
+            if att_name.startswith("parse_")
+        }
+
+        @lru_cache(maxsize=maxsize, name="Parser.parse")
+        def parse_rule(rule_name, s):
+            return rule_fxns[rule_name](s)
+
+        def make_cached_rule_function(rule_name):
+            def rule_fxn(s):
+                result = parse_rule(rule_name, s)
+                # results without clone() (e.g., str, int) are immutable
+                return result.clone() if hasattr(result, "clone") else result
+
+            rule_fxn.__doc__ = rule_fxns[rule_name].__doc__
+            return rule_fxn
+
+        for rule_name in rule_fxns:
+            self.__setattr__("parse_" + rule_name, make_cached_rule_function(rule_name))
+        self._parse_cache = parse_rule
+
+    def _install_precheck(self):
+        """wrap variant and position parse functions with a lexical
+        pre-check that cheaply rejects strings that cannot be valid
+
+        """
+
+        def make_prechecked_rule_function(rule_name, rule_fxn):
+            match = _precheck_res[rule_name].match
+
+            def prechecked_rule_fxn(s):
+                if match(s) is None:
+                    raise HGVSParseError(
+                        "{s}: failed lexical pre-check for {rule}".format(s=s, rule=rule_name)
+                    )
+                return rule_fxn(s)
+
+            prechecked_rule_fxn.__doc__ = rule_fxn.__doc__
+            return prechecked_rule_fxn
+
+        for rule_name in _precheck_res:
+            att_name = "parse_" + rule_name
+            self.__setattr__(
+                att_name, make_prechecked_rule_function(rule_name, getattr(self, att_name))
+            )
+
+    def _install_fast_path(self):
+        """wrap `parse_hgvs_variant` so that simple variants bypass the grammar"""
+
+        grammar_fxn = self.parse_hgvs_variant
+
+        def parse_hgvs_variant(s):
+            var = _fast_parse_hgvs_variant(s)
+            return grammar_fxn(s) if var is None else var
+
+        parse_hgvs_variant.__doc__ = grammar_fxn.__doc__
+        self.parse_hgvs_variant = parse_hgvs_variant
 
     def _expose_rule_functions(self, expose_all_rules=False):
         """add parse functions for public grammar rules
@@ -118,46 +515,348 @@ class Parser:
           Parser.parse_c_interval('26+2_57-3') -> Interval(...)
 
         """
+        if self._grammar is _default_grammar():
+            key = (self.backend, expose_all_rules)
+            with _shared_lock:
+                rule_fxns = _shared_rule_fxns.get(key)
+                if rule_fxns is None:
+                    rule_fxns = _shared_rule_fxns[key] = _make_rule_functions(
+                        self._grammar, self.backend, expose_all_rules
+                    )
+        else:
+            rule_fxns = _make_rule_functions(self._grammar, self.backend, expose_all_rules)
+        self.__dict__.update(rule_fxns)
+
+
+class ParserPool:
+    """thread-safe pool of Parser instances
+
+    Parser instances may be shared between threads, but a parser with
+    a parse cache serializes lookups on the cache lock.  A pool gives
+    each concurrent caller a parser of its own.  Parsers are cheap to
+    create because the grammar and rule functions are shared.
+
+    >>> pool = ParserPool(size=2, backend="rd")
+    >>> with pool.parser() as hp:
+    ...     hp.parse("NM_01234.5:c.22+1A>T")
+    SequenceVariant(ac=NM_01234.5, type=c, posedit=22+1A>T, gene=None)
+    >>> pool.parse("NP_012345.6:p.Ala22Trp")
+    SequenceVariant(ac=NP_012345.6, type=p, posedit=Ala22Trp, gene=None)
+
+    """
+
+    def __init__(self, size=4, **parser_kwargs):
+        if size < 1:
+            raise HGVSUsageError("size must be a positive integer")
+        self.size = size
+        # LIFO reuse keeps recently used parsers (and their caches) warm
+        self._parsers = queue.LifoQueue()
+        for _ in range(size):
+            self._parsers.put(Parser(**parser_kwargs))
+
+    @contextlib.contextmanager
+    def parser(self, timeout=None):
+        """context manager that checks out a parser for exclusive use,
+        waiting up to `timeout` seconds (forever if None) for one to
+        become available
+
+        """
+        try:
+            hp = self._parsers.get(timeout=timeout)
+        except queue.Empty:
+            raise HGVSUsageError("no parser available within {} seconds".format(timeout))
+        try:
+            yield hp
+        finally:
+            self._parsers.put(hp)
+
+    def parse(self, v):
+        """parse HGVS variant `v` with a pooled parser"""
+        with self.parser() as hp:
+            return hp.parse(v)
+
+
+# Record yielded by parse_file for each input line
+ParsedLine = collections.namedtuple("ParsedLine", ["line", "input", "result"])
+
+
+def parse_file(
+    source,
+    column=None,
+    header=False,
+    delimiter="\t",
+    parser=None,
+    workers=None,
+    chunk_size=1000,
+):
+    """parse HGVS strings from a text file, yielding a ParsedLine
+    (line, input, result) for each input in file order
+
+    :param source: file name, "-" for stdin, or an open file; plain,
+      gzip, and bgzip files are recognized by content
+    :param column: None to use the whole line, otherwise the 0-based
+      index or (with `header`) the name of the column to parse
+    :param bool header: True if the first non-comment line names columns
+    :param str delimiter: column delimiter
+    :param Parser parser: parser to use; defaults to Parser(backend="rd")
+    :param int workers: number of worker processes (see Parser.parse_many)
+    :param int chunk_size: number of inputs per worker chunk
+
+    `line` is the 1-based line number in `source`, and `result` is a
+    SequenceVariant or a ParseFailure.  Comment lines (starting with
+    "#") and lines with an empty or missing column are skipped.  The
+    file is read incrementally, so memory use does not depend on file
+    size.
+
+    """
+    if parser is None:
+        parser = Parser(backend="rd")
+    pending = collections.deque()
+
+    def inputs():
+        for line, s in _read_column(source, column, header, delimiter):
+            pending.append((line, s))
+            yield s
+
+    for result in parser.parse_many(inputs(), workers=workers, chunk_size=chunk_size):
+        line, s = pending.popleft()
+        yield ParsedLine(line, s, result)
+
+
+@contextlib.contextmanager
+def _open_text(source):
+    """context manager for a text stream for file name, "-", or file
+    object `source`, decompressing gzip (and therefore bgzip) content;
+    files opened by name are closed on exit, others are left open
+
+    """
+    if isinstance(source, io.TextIOBase):
+        yield source
+        return
+    opened = not (source == "-" or hasattr(source, "read"))
+    if source == "-":
+        fh = sys.stdin.buffer
+    elif opened:
+        fh = open(source, "rb")
+    else:
+        fh = source
+    try:
+        if not hasattr(fh, "peek"):
+            fh = io.BufferedReader(fh)
+        if fh.peek(2)[:2] == b"\x1f\x8b":
+            fh = gzip.GzipFile(fileobj=fh)
+        text = io.TextIOWrapper(fh, encoding="utf-8")
+    except BaseException:
+        if opened:
+            fh.close()
+        raise
+    try:
+        yield text
+    finally:
+        if opened:
+            text.close()
+        else:
+            text.detach()  # leave the caller's stream open
+
 
-        def make_parse_rule_function(rule_name):
-            "builds a wrapper function that parses a string with the specified rule"
+def _read_column(source, column, header, delimiter):
+    """generate (line number, value) for `column` of non-comment lines in `source`"""
+    if column is not None and not isinstance(column, int) and not header:
+        raise HGVSUsageError(
+            "column {} is not an index; column names require header".format(column)
+        )
+    col_idx = column
+    with _open_text(source) as text:
+        for line_number, line in enumerate(text, start=1):
+            line = line.rstrip("\r\n")
+            if line.startswith("#") or not line:
+                continue
+            if header:
+                header = False
+                if column is not None and not isinstance(column, int):
+                    try:
+                        col_idx = line.split(delimiter).index(column)
+                    except ValueError:
+                        raise HGVSUsageError("column {} not found in header".format(column))
+                continue
+            if col_idx is None:
+                value = line.strip()
+            else:
+                fields = line.split(delimiter)
+                value = fields[col_idx].strip() if col_idx < len(fields) else ""
+            if value:
+                yield line_number, value
+
+
+def _format_tsv(parsed_line):
+    line, s, result = parsed_line
+    if isinstance(result, ParseFailure):
+        return "{}\t{}\terror\t{}\n".format(line, s, result.message)
+    return "{}\t{}\tok\t{}\n".format(line, s, result)
+
+
+def _format_jsonl(parsed_line):
+    line, s, result = parsed_line
+    rec = {"line": line, "input": s}
+    if isinstance(result, ParseFailure):
+        rec["error"] = result.message
+    else:
+        rec.update(ac=result.ac, type=result.type, hgvs=str(result))
+    return json.dumps(rec) + "\n"
+
+
+def main(argv=None):
+    """command line interface to parse_file; see `hgvs-parse --help`"""
+    ap = argparse.ArgumentParser(
+        prog="hgvs-parse",
+        description="parse HGVS strings from a (gzip/bgzip) text file, "
+        "writing one result per input line as TSV or JSON lines",
+    )
+    ap.add_argument("file", nargs="?", default="-", help="input file; default stdin")
+    ap.add_argument("--column", "-c", help="0-based column index or (with --header) column name")
+    ap.add_argument("--header", action="store_true", help="first non-comment line names columns")
+    ap.add_argument("--delimiter", "-d", default="\t", help="column delimiter; default tab")
+    ap.add_argument("--format", "-f", choices=("tsv", "jsonl"), default="tsv")
+    ap.add_argument("--output", "-o", default="-", help="output file; default stdout")
+    ap.add_argument("--workers", "-w", type=int, help="number of worker processes")
+    ap.add_argument("--chunk-size", type=int, default=1000)
+    ap.add_argument("--backend", choices=Parser.backends, default="rd")
+    ap.add_argument("--fast-path", action="store_true")
+    opts = ap.parse_args(argv)
+
+    column = opts.column
+    if column is not None and column.isdigit():
+        column = int(column)
+    elif column is not None and not opts.header:
+        ap.error("--column {} is not an index; column names require --header".format(column))
+    parser = Parser(backend=opts.backend, fast_path=opts.fast_path)
+    format_line = _format_tsv if opts.format == "tsv" else _format_jsonl
+    parsed_lines = parse_file(
+        opts.file,
+        column=column,
+        header=opts.header,
+        delimiter=opts.delimiter,
+        parser=parser,
+        workers=opts.workers,
+        chunk_size=opts.chunk_size,
+    )
+    out = sys.stdout if opts.output == "-" else open(opts.output, "w")
+    try:
+        for parsed_line in parsed_lines:
+            out.write(format_line(parsed_line))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+_logger = logging.getLogger(__name__)
+
+# Default grammar and rule function tables, shared across Parser
+# instances; see _default_grammar and Parser._expose_rule_functions.
+_shared_lock = threading.Lock()
+_shared_grammar = None
+_shared_rule_fxns = {}
+
+
+def _default_grammar():
+    """return the wrapped default grammar, building it on first use"""
+    global _shared_grammar
+    if _shared_grammar is None:
+        with _shared_lock:
+            if _shared_grammar is None:
+                bindings = {"hgvs": hgvs, "bioutils": bioutils, "copy": copy}
+                _shared_grammar = parsley.wrapGrammar(
+                    createParserClass(ometa.runtime.OMetaGrammarBase, bindings)
+                )
+    return _shared_grammar
+
+
+def _make_rule_functions(grammar, backend, expose_all_rules):
+    """return dict of parse_<rule> name to parse function for rules in `grammar`
+
+    The functions hold no reference to a Parser instance, so they may
+    be shared by any number of parsers.
+    """
+
+    def make_parse_rule_function(rule_name):
+        "builds a wrapper function that parses a string with the specified rule"
+
+        if backend == "rd" and rule_name in hgvs.utils.rdparser.rule_names:
 
             def rule_fxn(s):
-                try:
-                    return self._grammar(s).__getattr__(rule_name)()
-                except ometa.runtime.ParseError as exc:
-                    raise HGVSParseError(
-                        "{s}: char {exc.position}: {reason}".format(
-                            s=s, exc=exc, reason=exc.formatReason()
-                        )
-                    )
+                return hgvs.utils.rdparser.parse(rule_name, s)
 
             rule_fxn.__doc__ = "parse string s using `%s' rule" % rule_name
             return rule_fxn
 
-        exposed_rule_re = re.compile(
-            r"hgvs_(variant|position)|(c|g|m|n|p|r)"
-            r"_(edit|hgvs_position|interval|pos|posedit|variant)"
-        )
+        def rule_fxn(s):
+            try:
+                return grammar(s).__getattr__(rule_name)()
+            except ometa.runtime.ParseError as exc:
+                raise HGVSParseError(
+                    "{s}: char {exc.position}: {reason}".format(
+                        s=s, exc=exc, reason=exc.formatReason()
+                    )
+                )
+
+        rule_fxn.__doc__ = "parse string s using `%s' rule" % rule_name
+        return rule_fxn
+
+    exposed_rule_re = re.compile(
+        r"hgvs_(variant|position)|(c|g|m|n|p|r)"
+        r"_(edit|hgvs_position|interval|pos|posedit|variant)"
+    )
+    exposed_rules = [
+        m.replace("rule_", "") for m in dir(grammar._grammarClass) if m.startswith("rule_")
+    ]
+    if not expose_all_rules:
         exposed_rules = [
-            m.replace("rule_", "")
-            for m in dir(self._grammar._grammarClass)
-            if m.startswith("rule_")
+            rule_name for rule_name in exposed_rules if exposed_rule_re.match(rule_name)
         ]
-        if not expose_all_rules:
-            exposed_rules = [
-                rule_name for rule_name in exposed_rules if exposed_rule_re.match(rule_name)
-            ]
-        for rule_name in exposed_rules:
-            att_name = "parse_" + rule_name
-            rule_fxn = make_parse_rule_function(rule_name)
-            self.__setattr__(att_name, rule_fxn)
-        self._logger.debug(
-            "Exposed {n} rules ({rules})".format(
-                n=len(exposed_rules), rules=", ".join(exposed_rules)
-            )
-        )
+    rule_fxns = {
+        "parse_" + rule_name: make_parse_rule_function(rule_name) for rule_name in exposed_rules
+    }
+    _logger.debug(
+        "Exposed {n} rules ({rules})".format(n=len(exposed_rules), rules=", ".join(exposed_rules))
+    )
+    return rule_fxns
+
+
+def _parse_or_fail(parser, s):
+    """return parser.parse(s), or a ParseFailure if s cannot be parsed"""
+    try:
+        return parser.parse(s)
+    except HGVSParseError as exc:
+        return ParseFailure(s, str(exc))
+
+
+def _check_results(results, on_error):
+    for result in results:
+        if on_error == "raise" and isinstance(result, ParseFailure):
+            raise HGVSParseError(result.message)
+        yield result
+
+
+# Per-process parser used by parse_many workers
+_worker_parser = None
+
+
+def _init_worker(init_kwargs):
+    global _worker_parser
+    _worker_parser = Parser(**init_kwargs)
+
+
+def _parse_chunk(chunk):
+    return [_parse_or_fail(_worker_parser, s) for s in chunk]
+
+
+if __name__ == "__main__":
+    # run main from the importable module so that worker processes can
+    # find the functions they are sent
+    from hgvs.parser import main as _main
 
+    sys.exit(_main())
 
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
@@ -5,6 +5,7 @@
 
 import attr
 
+import hgvs.utils.binary
 from hgvs.enums import ValidationLevel
 from hgvs.exceptions import HGVSUnsupportedOperationError
 
@@ -41,6 +42,31 @@ class PosEdit:
             ", ".join((a.name + "=" + str(getattr(self, a.name))) for a in self.__attrs_attrs__),
         )
 
+    def clone(self):
+        """return a deep copy of this posedit
+
+        This is much faster than copy.deepcopy, which is significant
+        in mapping and normalization.  String edits (e.g., "=" in
+        p.=) are immutable and are shared.
+
+        """
+        new = object.__new__(type(self))
+        pos = self.pos
+        new.pos = None if pos is None else pos.clone()
+        edit = self.edit
+        new.edit = edit if edit is None or isinstance(edit, str) else edit.clone()
+        new.uncertain = self.uncertain
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
     def _set_uncertain(self):
         """sets the uncertain flag to True; used primarily by the HGVS grammar
 
@@ -4,8 +4,6 @@ via a common reference sequence.
 
 """
 
-import copy
-
 import hgvs
 import hgvs.alignmentmapper
 
@@ -72,7 +70,7 @@ class Projector:
             raise RuntimeError(
                 "variant accession does not match that used to initialize " + __name__
             )
-        new_c_variant = copy.deepcopy(c_variant)
+        new_c_variant = c_variant.clone()
         new_c_variant.ac = self.dst_tm.tx_ac
         new_c_variant.posedit.pos = self.project_interval_forward(c_variant.posedit.pos)
         return new_c_variant
@@ -88,7 +86,7 @@ class Projector:
             raise RuntimeError(
                 "variant accession does not match that used to initialize " + __name__
             )
-        new_c_variant = copy.deepcopy(c_variant)
+        new_c_variant = c_variant.clone()
         new_c_variant.ac = self.src_tm.tx_ac
         new_c_variant.posedit.pos = self.project_interval_backward(c_variant.posedit.pos)
         return new_c_variant
@@ -3,9 +3,11 @@
 
 import attr
 
+import hgvs.utils.accessions
+import hgvs.utils.binary
 import hgvs.variantmapper
 from hgvs.enums import ValidationLevel
-from hgvs.utils.validation import validate_type_ac_pair
+from hgvs.utils.tracing import traced
 
 
 @attr.s(slots=True, repr=False)
@@ -53,6 +55,29 @@ class SequenceVariant:
             ", ".join((a.name + "=" + str(getattr(self, a.name))) for a in self.__attrs_attrs__),
         )
 
+    def clone(self):
+        """return a deep copy of this variant
+
+        The posedit of a LazySequenceVariant is parsed first.
+        """
+        posedit = self.posedit
+        new = object.__new__(type(self))
+        new.ac = self.ac
+        new.type = self.type
+        new.posedit = posedit if posedit is None or isinstance(posedit, str) else posedit.clone()
+        new.gene = self.gene
+        return new
+
+    def to_bytes(self):
+        """return compact binary encoding of this object (see :mod:`hgvs.utils.binary`)"""
+        return hgvs.utils.binary.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """return object decoded from `data`, as returned by `to_bytes()`"""
+        return hgvs.utils.binary.loads(data, cls)
+
+    @traced
     def fill_ref(self, hdp):
         # TODO: Refactor. SVs should not operate on themselves when
         # external resources are required
@@ -75,7 +100,7 @@ class SequenceVariant:
     def validate(self):
         (res, msg) = (ValidationLevel.VALID, None)
         if self.ac and self.type:
-            (res, msg) = validate_type_ac_pair(self.type, self.ac)
+            (res, msg) = hgvs.utils.accessions.registry.validate_type_ac_pair(self.type, self.ac)
             if res == ValidationLevel.ERROR:
                 return (res, msg)
         if self.posedit is None:
@@ -86,6 +111,57 @@ class SequenceVariant:
         return (pe_res, pe_msg)
 
 
+class LazySequenceVariant(SequenceVariant):
+    """SequenceVariant whose posedit is parsed from text on first access
+
+    Instances are created by :meth:`hgvs.parser.Parser.parse_lazy`.
+    Until `posedit` is accessed, the posedit slot holds the unparsed
+    text and the function that parses it (an _UnparsedPosEdit).  On first access (or on
+    assignment, comparison, repr, copy, or pickling) the posedit is
+    parsed and the instance becomes an ordinary SequenceVariant.
+    Parse errors in the posedit are therefore raised on first access.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def posedit(self):
+        posedit = _posedit_slot.__get__(self)
+        if posedit.__class__ is _UnparsedPosEdit:
+            posedit = posedit.parse(posedit.text)
+            _posedit_slot.__set__(self, posedit)
+            self.__class__ = SequenceVariant
+        return posedit
+
+    @posedit.setter
+    def posedit(self, posedit):
+        _posedit_slot.__set__(self, posedit)
+        if posedit.__class__ is not _UnparsedPosEdit:
+            self.__class__ = SequenceVariant
+
+    def __eq__(self, other):
+        self.posedit
+        return self == other
+
+    def __repr__(self):
+        self.posedit
+        return repr(self)
+
+    def __reduce_ex__(self, protocol):
+        self.posedit
+        return self.__reduce_ex__(protocol)
+
+
+_posedit_slot = SequenceVariant.__dict__["posedit"]
+
+
+@attr.s(slots=True, frozen=True)
+class _UnparsedPosEdit:
+    text = attr.ib()
+    parse = attr.ib()
+
+
 # <LICENSE>
 # Copyright 2023 HGVS Contributors (https://github.com/biocommons/hgvs)
 #
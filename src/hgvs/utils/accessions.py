@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""registry of accessions: interning, compact ids, and cached validation
+
+Every parsed variant carries its own accession string, and data
+provider cache keys repeat the same accessions many times.  An
+`AccessionRegistry` keeps one canonical instance of each distinct
+accession, assigns each a small integer id (in order of first use),
+and caches the result of `validate_type_ac_pair`, so that the regular
+expressions in :mod:`hgvs.utils.validation` are evaluated once per
+distinct (type, accession) pair rather than once per variant.
+
+>>> reg = AccessionRegistry()
+>>> reg.get_id("NM_01234.5"), reg.get_id("NC_000001.10"), reg.get_id("NM_01234.5")
+(0, 1, 0)
+>>> reg.get_ac(1)
+'NC_000001.10'
+>>> ac = reg.intern("".join(["NM_", "01234.5"]))
+>>> ac is reg.intern("NM_01234.5")
+True
+>>> reg.validate_type_ac_pair("c", "NM_01234.5")[0]
+<ValidationLevel.VALID: 1>
+
+The package-wide registry is `hgvs.utils.accessions.registry`.  The
+parser interns the accessions of variants returned by Parser.parse
+and parse_lazy (and so parse_many and parse_file) in it, and
+SequenceVariant.validate uses its cached validation.  Ids are
+specific to a registry and to a process; they are not stable across
+runs and should not be stored.
+
+Accessions come from arbitrary input, so both tables are bounded.
+Ids must remain valid, so registered accessions are never evicted:
+once `maxsize` accessions are registered, `intern` returns new
+accessions unchanged and `get_id` raises HGVSUsageError.  Validation
+results are kept in an LRU cache of `validations_maxsize` entries.
+
+>>> reg = AccessionRegistry(maxsize=1)
+>>> reg.intern("NM_01234.5"), reg.intern("NM_99999.9"), len(reg)
+('NM_01234.5', 'NM_99999.9', 1)
+
+"""
+
+from threading import Lock
+
+from hgvs.decorators.lru_cache import lru_cache
+from hgvs.exceptions import HGVSUsageError
+from hgvs.utils.validation import validate_type_ac_pair
+
+
+class AccessionRegistry:
+    """interns accessions, assigns them integer ids, and caches
+    `validate_type_ac_pair` results
+
+    All methods are thread-safe.
+
+    :param maxsize: maximum number of registered accessions (None for
+        no limit)
+    :param validations_maxsize: maximum number of cached validation
+        results (None for no limit); the cache is registered as
+        "AccessionRegistry.validate" in `hgvs.utils.cachestats`
+
+    """
+
+    def __init__(self, maxsize=None, validations_maxsize=None):
+        self.maxsize = maxsize
+        self._ids = {}  # ac -> id
+        self._acs = []  # id -> ac
+        self._lock = Lock()
+        self._validate = lru_cache(maxsize=validations_maxsize, name="AccessionRegistry.validate")(
+            validate_type_ac_pair
+        )
+
+    def __len__(self):
+        return len(self._acs)
+
+    def __contains__(self, ac):
+        return ac in self._ids
+
+    def intern(self, ac):
+        """return the canonical instance of the string `ac`, registering
+        it if necessary
+
+        None is returned unchanged.
+
+        """
+        if ac is None:
+            return None
+        id_ = self._ids.get(ac)
+        if id_ is None:
+            if self.maxsize is not None and len(self._acs) >= self.maxsize:
+                return ac  # full
+            id_ = self.get_id(ac)
+        return self._acs[id_]
+
+    def get_id(self, ac):
+        """return the integer id of accession `ac`, assigning one if necessary
+
+        Raises HGVSUsageError if `ac` is new and the registry is full.
+
+        """
+        try:
+            return self._ids[ac]
+        except KeyError:
+            with self._lock:
+                id_ = self._ids.get(ac)
+                if id_ is None:
+                    id_ = len(self._acs)
+                    if self.maxsize is not None and id_ >= self.maxsize:
+                        raise HGVSUsageError(
+                            "accession registry is full ({n} accessions)".format(n=id_)
+                        )
+                    self._acs.append(ac)
+                    self._ids[ac] = id_
+                return id_
+
+    def get_ac(self, id_):
+        """return the accession with integer id `id_`"""
+        if id_ < 0:
+            raise IndexError("accession ids are non-negative")
+        return self._acs[id_]
+
+    def validate_type_ac_pair(self, type, ac):
+        """return the cached result of
+        :func:`hgvs.utils.validation.validate_type_ac_pair`"""
+        return self._validate(type, ac)
+
+
+# package-wide registry
+registry = AccessionRegistry(maxsize=100000, validations_maxsize=10000)
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
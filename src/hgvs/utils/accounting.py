@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""accounting of data provider calls and cache hits per high-level
+operation
+
+A `CallAccountant` counts the data provider calls (`get_seq`,
+`get_tx_info`, `get_tx_exons`, `get_tx_mapping_options`, etc.) made
+during each high-level operation, such as `AssemblyMapper.c_to_p` or
+`VariantMapper.g_to_c`, and how many of those calls were answered by
+the data provider's cache.  The operation is the outermost
+instrumented mapper, normalizer, or validator call on the current
+thread; calls made outside any operation are attributed to None.
+
+The accountant is a tracer (see :mod:`hgvs.utils.tracing`) that
+counts the "hdp.<method>" spans of the cached data provider methods
+and the "hdp.<method>.fetch" spans that occur only on cache misses;
+it does not record individual spans.  Calls that raise a cached
+exception ("hdp.<method>.negative" spans; see negative caching in
+:mod:`hgvs.decorators.lru_cache`) did no work, so they are counted as
+hits, and also as negative hits, rather than as errors.
+
+>>> import hgvs.utils.tracing
+>>> with accounting() as accountant:
+...     with hgvs.utils.tracing.span("AssemblyMapper.c_to_p"):
+...         for _ in range(3):
+...             with hgvs.utils.tracing.span("hdp.get_seq"):
+...                 pass
+>>> accountant.report()["AssemblyMapper.c_to_p"]["methods"]["get_seq"]["hits"]
+3
+
+`CallAccountant.rows` returns the same data as a flat list of dicts
+for querying, and `CallAccountant.format_report` renders it as a
+table with calls per operation, which is the number to watch for
+redundant round-trips and regressions.
+
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import hgvs.utils.tracing
+
+# span kinds
+_OPERATION, _CALL, _FETCH, _NEGATIVE = 0, 1, 2, 3
+
+# indexes of per-(operation, method) counters
+_CALLS, _HITS, _MISSES, _ERRORS, _MISS_TIME, _NEGATIVE_HITS = 0, 1, 2, 3, 4, 5
+
+
+@contextmanager
+def accounting(accountant=None):
+    """enable call accounting with `accountant` (a new `CallAccountant`
+    by default) for the duration of a with block
+
+    Accounting uses the tracing hook, so any tracer that is enabled is
+    suspended within the block.
+
+    """
+    if accountant is None:
+        accountant = CallAccountant()
+    with hgvs.utils.tracing.tracing(accountant):
+        yield accountant
+
+
+class _AccountingSpan:
+    __slots__ = ("accountant", "kind", "name", "fetched", "negative", "is_root", "start")
+
+    def __init__(self, accountant, kind, name):
+        self.accountant = accountant
+        self.kind = kind
+        self.name = name
+        self.fetched = False
+        self.negative = False
+        self.is_root = False
+        self.start = None
+
+    def __enter__(self):
+        self.accountant._enter(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.accountant._exit(self, exc_type is not None)
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+class CallAccountant:
+    """counts data provider calls, cache hits (including negative
+    hits), cache misses, and errors per high-level operation and method
+
+    All methods are thread-safe.
+
+    """
+
+    def __init__(self):
+        self._operations = {}  # operation -> number of calls
+        self._counts = {}  # (operation, method) -> counters
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def span(self, name, **attributes):
+        if name.startswith("hdp."):
+            if name.endswith(".fetch"):
+                return _AccountingSpan(self, _FETCH, name[4:-6])
+            if name.endswith(".negative"):
+                return _AccountingSpan(self, _NEGATIVE, name[4:-9])
+            return _AccountingSpan(self, _CALL, name[4:])
+        return _AccountingSpan(self, _OPERATION, name)
+
+    def clear(self):
+        """discard all counts"""
+        with self._lock:
+            self._operations = {}
+            self._counts = {}
+
+    def _state(self):
+        local = self._local
+        try:
+            return local.stack
+        except AttributeError:
+            local.operation = None
+            stack = local.stack = []
+            return stack
+
+    def _enter(self, span):
+        stack = self._state()
+        if span.kind == _OPERATION and self._local.operation is None:
+            self._local.operation = span.name
+            span.is_root = True
+        elif span.kind == _FETCH:
+            span.start = time.perf_counter()
+        stack.append(span)
+
+    def _exit(self, span, failed):
+        stack = self._local.stack
+        stack.pop()
+        operation = self._local.operation
+        if span.kind == _OPERATION:
+            if span.is_root:
+                self._local.operation = None
+                with self._lock:
+                    self._operations[span.name] = self._operations.get(span.name, 0) + 1
+            return
+        if span.kind == _NEGATIVE:
+            if stack and stack[-1].kind == _CALL:
+                stack[-1].negative = True
+            return
+        with self._lock:
+            counts = self._counts.get((operation, span.name))
+            if counts is None:
+                counts = self._counts[(operation, span.name)] = [0, 0, 0, 0, 0.0, 0]
+            if span.kind == _FETCH:
+                counts[_MISSES] += 1
+                counts[_MISS_TIME] += time.perf_counter() - span.start
+            else:
+                counts[_CALLS] += 1
+                if span.negative and not span.fetched:
+                    counts[_HITS] += 1
+                    counts[_NEGATIVE_HITS] += 1
+                elif failed:
+                    counts[_ERRORS] += 1
+                elif not span.fetched:
+                    counts[_HITS] += 1
+        if span.kind == _FETCH and stack and stack[-1].kind == _CALL:
+            stack[-1].fetched = True
+
+    def rows(self):
+        """return list of dicts, one per (operation, method), with keys
+        operation, operations (the number of times the operation ran),
+        method, calls, hits, negative_hits (hits that raised a cached
+        exception), misses, errors, miss_time (seconds), and
+        calls_per_operation"""
+        with self._lock:
+            operations = dict(self._operations)
+            counts = {k: list(v) for k, v in self._counts.items()}
+        rows = []
+        for (operation, method), c in sorted(counts.items(), key=lambda i: (str(i[0][0]), i[0][1])):
+            n = operations.get(operation, 0)
+            rows.append(
+                {
+                    "operation": operation,
+                    "operations": n,
+                    "method": method,
+                    "calls": c[_CALLS],
+                    "hits": c[_HITS],
+                    "negative_hits": c[_NEGATIVE_HITS],
+                    "misses": c[_MISSES],
+                    "errors": c[_ERRORS],
+                    "miss_time": c[_MISS_TIME],
+                    "calls_per_operation": c[_CALLS] / n if n else None,
+                }
+            )
+        return rows
+
+    def report(self):
+        """return dict of operation -> {"count": number of times the
+        operation ran, "methods": {method -> dict of calls, hits,
+        negative_hits, misses, errors, miss_time, and
+        calls_per_operation}}"""
+        with self._lock:
+            operations = dict(self._operations)
+        report = {op: {"count": n, "methods": {}} for op, n in operations.items()}
+        for row in self.rows():
+            r = report.setdefault(row["operation"], {"count": 0, "methods": {}})
+            r["methods"][row["method"]] = {
+                k: row[k]
+                for k in (
+                    "calls",
+                    "hits",
+                    "negative_hits",
+                    "misses",
+                    "errors",
+                    "miss_time",
+                    "calls_per_operation",
+                )
+            }
+        return report
+
+    def format_report(self):
+        """return `rows()` as a text table, with miss time in
+        milliseconds"""
+        rows = self.rows()
+        width = max([len("operation")] + [len(str(r["operation"])) for r in rows])
+        mwidth = max([len("method")] + [len(r["method"]) for r in rows])
+        line = "{:<{w}s} {:>6} {:<{mw}s} {:>8} {:>8} {:>8} {:>6} {:>12} {:>8}"
+        lines = [
+            line.format(
+                "operation",
+                "ops",
+                "method",
+                "calls",
+                "hits",
+                "misses",
+                "errors",
+                "miss_ms",
+                "per_op",
+                w=width,
+                mw=mwidth,
+            )
+        ]
+        for r in rows:
+            per_op = r["calls_per_operation"]
+            lines.append(
+                line.format(
+                    str(r["operation"]),
+                    r["operations"],
+                    r["method"],
+                    r["calls"],
+                    r["hits"],
+                    r["misses"],
+                    r["errors"],
+                    "{:.3f}".format(1e3 * r["miss_time"]),
+                    "-" if per_op is None else "{:.2f}".format(per_op),
+                    w=width,
+                    mw=mwidth,
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -131,7 +131,11 @@ class AltSeqBuilder:
         variant_location = self._get_variant_region()
 
         if variant_location == self.EXON:
-            edit_type = type(self._var_c.posedit.edit)
+            # first class in the MRO, so that subclasses (e.g., frozen edits) are handled
+            edit_type = next(
+                (t for t in type(self._var_c.posedit.edit).__mro__ if t in type_map),
+                type(self._var_c.posedit.edit),
+            )
         elif variant_location == self.INTRON:
             edit_type = NOT_CDS
         elif variant_location == self.T_UTR:
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""columnar storage of many variants
+
+A SequenceVariant is a graph of 6-8 Python objects.  `VariantBatch`
+stores the same information for many variants in a few flat arrays,
+which typically takes a small fraction of the memory:
+
+>>> import hgvs.parser
+>>> hp = hgvs.parser.Parser()
+>>> variants = [hp.parse(s) for s in ("NM_01234.5:c.22+1A>T", "NM_01234.5:c.*5_*7del")]
+>>> batch = VariantBatch.from_variants(variants)
+>>> len(batch)
+2
+>>> batch.strings[batch.ac[1]]
+'NM_01234.5'
+>>> list(batch.start_offset)
+[1, 0]
+>>> batch.alt_at(0)
+'T'
+>>> [str(v) for v in batch.to_variants()]
+['NM_01234.5:c.22+1A>T', 'NM_01234.5:c.*5_*7del']
+
+Columns are `array.array` instances, which support the buffer
+protocol; e.g., ``numpy.frombuffer(batch.start_base, dtype="q")``
+provides a NumPy view without copying.  Row i is described by:
+
+* ac[i], gene[i]: indexes into `strings`, the interned accessions and
+  gene symbols (gene is -1 if there is no gene)
+* type[i]: index into `TYPES`
+* start_base[i], start_offset[i], end_base[i], end_offset[i]
+* flags[i]: datums, position and interval classes, uncertainty, and
+  edit kind (see the `F_` constants)
+* ref and alt: ref_buffer[ref_offsets[i]:ref_offsets[i+1]], and
+  likewise for alt
+
+Nucleotide variants whose edit is a ref/alt pair (substitutions,
+deletions, insertions, delins and identity), a dup, or an inversion
+are stored in columns.  Other variants (e.g., p. variants, repeats,
+uncertain positions, or unknown extents) are kept as objects in
+`others`, keyed by row; their column values are undefined and
+`is_columnar(i)` is False.  Conversion is lossless in both cases.
+
+"""
+
+import array
+
+import hgvs
+import hgvs.edit
+import hgvs.location
+import hgvs.posedit
+import hgvs.sequencevariant
+from hgvs.enums import Datum
+from hgvs.exceptions import HGVSUnsupportedOperationError
+
+TYPES = ("g", "m", "c", "n", "r", "o", "p")
+
+# bit layout of flags
+F_START_DATUM = 0x0003  # Datum value (1-3) of start position
+F_END_DATUM = 0x000C  # Datum value (1-3) of end position, shifted by 2
+F_BASE_OFFSET = 0x0010  # positions are BaseOffsetPositions, not SimplePositions
+F_BASE_OFFSET_INTERVAL = 0x0020  # interval is a BaseOffsetInterval
+F_INTERVAL_UNCERTAIN = 0x0040
+F_POSEDIT_UNCERTAIN = 0x0080
+F_EDIT_UNCERTAIN = 0x0100
+F_EDIT_KIND = 0x0600  # index into EDIT_KINDS, shifted by 9
+F_REF_NONE = 0x0800
+F_ALT_NONE = 0x1000
+F_OTHER = 0x8000  # variant is stored in others
+
+EDIT_KINDS = ("NARefAlt", "Dup", "Inv")
+
+_type_codes = {t: i for i, t in enumerate(TYPES)}
+_edit_kinds = {getattr(hgvs.edit, name): i for i, name in enumerate(EDIT_KINDS)}
+_datums = {d.value: d for d in Datum}
+_new = object.__new__
+
+
+class VariantBatch:
+    """columnar container for many SequenceVariants; see module
+    documentation
+
+    Batches are created with `from_variants` and are not modified
+    afterwards.
+
+    """
+
+    __slots__ = (
+        "strings",
+        "ac",
+        "gene",
+        "type",
+        "start_base",
+        "start_offset",
+        "end_base",
+        "end_offset",
+        "flags",
+        "ref_buffer",
+        "ref_offsets",
+        "alt_buffer",
+        "alt_offsets",
+        "others",
+    )
+
+    def __init__(self):
+        self.strings = []
+        self.ac = array.array("i")
+        self.gene = array.array("i")
+        self.type = array.array("b")
+        self.start_base = array.array("q")
+        self.start_offset = array.array("q")
+        self.end_base = array.array("q")
+        self.end_offset = array.array("q")
+        self.flags = array.array("H")
+        self.ref_buffer = ""
+        self.ref_offsets = array.array("q", [0])
+        self.alt_buffer = ""
+        self.alt_offsets = array.array("q", [0])
+        self.others = {}
+
+    @classmethod
+    def from_variants(cls, variants):
+        """return a new VariantBatch containing `variants`, an iterable
+        of SequenceVariants (frozen and lazy variants are accepted)
+
+        """
+        batch = cls()
+        string_codes = {}
+        strings = batch.strings
+        refs = []
+        alts = []
+        ref_len = alt_len = 0
+
+        def intern(s):
+            try:
+                return string_codes[s]
+            except KeyError:
+                code = string_codes[s] = len(strings)
+                strings.append(s)
+                return code
+
+        for var in variants:
+            if not isinstance(var, hgvs.sequencevariant.SequenceVariant):
+                raise HGVSUnsupportedOperationError(
+                    "VariantBatch cannot store objects of type {}".format(type(var).__name__)
+                )
+            row = _columns(var)
+            if row is None:
+                batch.others[len(batch.flags)] = var
+                row = (0, 0, 0, 0, F_OTHER, None, None)
+                ac_code = gene_code = type_code = -1
+            else:
+                ac_code = intern(var.ac)
+                gene_code = -1 if var.gene is None else intern(var.gene)
+                type_code = _type_codes[var.type]
+            start_base, start_offset, end_base, end_offset, flags, ref, alt = row
+            batch.ac.append(ac_code)
+            batch.gene.append(gene_code)
+            batch.type.append(type_code)
+            batch.start_base.append(start_base)
+            batch.start_offset.append(start_offset)
+            batch.end_base.append(end_base)
+            batch.end_offset.append(end_offset)
+            batch.flags.append(flags)
+            if ref:
+                refs.append(ref)
+                ref_len += len(ref)
+            if alt:
+                alts.append(alt)
+                alt_len += len(alt)
+            batch.ref_offsets.append(ref_len)
+            batch.alt_offsets.append(alt_len)
+
+        batch.ref_buffer = "".join(refs)
+        batch.alt_buffer = "".join(alts)
+        return batch
+
+    def to_variants(self):
+        """return a list of new, mutable SequenceVariants"""
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        return len(self.flags)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """return row `i` as a new, mutable SequenceVariant"""
+        if i < 0:
+            i += len(self)
+        flags = self.flags[i]
+        if flags & F_OTHER:
+            return self.others[i].clone()
+
+        if flags & F_BASE_OFFSET:
+            start = _new(hgvs.location.BaseOffsetPosition)
+            start.base = self.start_base[i]
+            start.offset = self.start_offset[i]
+            start.datum = _datums[flags & F_START_DATUM]
+            start.uncertain = False
+            end = _new(hgvs.location.BaseOffsetPosition)
+            end.base = self.end_base[i]
+            end.offset = self.end_offset[i]
+            end.datum = _datums[(flags & F_END_DATUM) >> 2]
+            end.uncertain = False
+        else:
+            start = _new(hgvs.location.SimplePosition)
+            start.base = self.start_base[i]
+            start.uncertain = False
+            end = _new(hgvs.location.SimplePosition)
+            end.base = self.end_base[i]
+            end.uncertain = False
+        if flags & F_BASE_OFFSET_INTERVAL:
+            pos = _new(hgvs.location.BaseOffsetInterval)
+        else:
+            pos = _new(hgvs.location.Interval)
+        pos.start = start
+        pos.end = end
+        pos.uncertain = bool(flags & F_INTERVAL_UNCERTAIN)
+
+        kind = (flags & F_EDIT_KIND) >> 9
+        edit = _new(getattr(hgvs.edit, EDIT_KINDS[kind]))
+        edit.ref = None if flags & F_REF_NONE else self.ref_at(i)
+        if kind == 0:
+            edit.alt = None if flags & F_ALT_NONE else self.alt_at(i)
+        edit.uncertain = bool(flags & F_EDIT_UNCERTAIN)
+
+        posedit = _new(hgvs.posedit.PosEdit)
+        posedit.pos = pos
+        posedit.edit = edit
+        posedit.uncertain = bool(flags & F_POSEDIT_UNCERTAIN)
+
+        var = _new(hgvs.sequencevariant.SequenceVariant)
+        var.ac = self.strings[self.ac[i]]
+        var.type = TYPES[self.type[i]]
+        var.posedit = posedit
+        gene = self.gene[i]
+        var.gene = None if gene < 0 else self.strings[gene]
+        return var
+
+    def is_columnar(self, i):
+        """return True if row `i` is stored in columns (rather than in `others`)"""
+        return not self.flags[i] & F_OTHER
+
+    def ref_at(self, i):
+        """return the ref sequence of row `i` ("" if None)"""
+        return self.ref_buffer[self.ref_offsets[i] : self.ref_offsets[i + 1]]
+
+    def alt_at(self, i):
+        """return the alt sequence of row `i` ("" if None)"""
+        return self.alt_buffer[self.alt_offsets[i] : self.alt_offsets[i + 1]]
+
+    def nbytes(self):
+        """return the approximate memory used by the columns, in bytes
+
+        Interned strings and objects in `others` are not included.
+
+        """
+        arrays = (
+            self.ac,
+            self.gene,
+            self.type,
+            self.start_base,
+            self.start_offset,
+            self.end_base,
+            self.end_offset,
+            self.flags,
+            self.ref_offsets,
+            self.alt_offsets,
+        )
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + len(self.ref_buffer.encode("utf-8"))
+            + len(self.alt_buffer.encode("utf-8"))
+        )
+
+    def __repr__(self):
+        return "{0}(n={1}, others={2})".format(self.__class__.__name__, len(self), len(self.others))
+
+
+def _columns(var):
+    """return (start base, start offset, end base, end offset, flags,
+    ref, alt) for var, or None if var can't be stored in columns"""
+    if var.type not in _type_codes or not isinstance(var.ac, str):
+        return None
+    if var.gene is not None and not isinstance(var.gene, str):
+        return None
+    posedit = var.posedit
+    if not isinstance(posedit, hgvs.posedit.PosEdit):
+        return None
+    pos = posedit.pos
+    edit = posedit.edit
+
+    flags = 0
+    if isinstance(pos, hgvs.location.BaseOffsetInterval):
+        flags |= F_BASE_OFFSET_INTERVAL
+    elif not isinstance(pos, hgvs.location.Interval):
+        return None
+    start = pos.start
+    end = pos.end
+    if isinstance(start, hgvs.location.BaseOffsetPosition):
+        if not isinstance(end, hgvs.location.BaseOffsetPosition):
+            return None
+        flags |= F_BASE_OFFSET | start.datum.value | end.datum.value << 2
+        start_offset = start.offset
+        end_offset = end.offset
+    elif isinstance(start, hgvs.location.SimplePosition):
+        if not isinstance(end, hgvs.location.SimplePosition):
+            return None
+        start_offset = end_offset = 0
+    else:
+        return None
+    if (
+        start.uncertain
+        or end.uncertain
+        or start.base is None
+        or end.base is None
+        or start_offset is None
+        or end_offset is None
+    ):
+        return None
+
+    kind = _edit_kinds.get(_base_class(type(edit)))
+    if kind is None:
+        return None
+    ref = edit.ref
+    alt = edit.alt if kind == 0 else None
+    if ref is None:
+        flags |= F_REF_NONE
+    elif not isinstance(ref, str):
+        return None
+    if alt is None:
+        flags |= F_ALT_NONE
+    elif not isinstance(alt, str):
+        return None
+    if kind == 0 and ref is None and alt is None:
+        return None
+
+    if pos.uncertain:
+        flags |= F_INTERVAL_UNCERTAIN
+    if posedit.uncertain:
+        flags |= F_POSEDIT_UNCERTAIN
+    if edit.uncertain:
+        flags |= F_EDIT_UNCERTAIN
+    flags |= kind << 9
+    return (start.base, start_offset, end.base, end_offset, flags, ref, alt)
+
+
+def _base_class(cls):
+    # frozen classes (see hgvs.utils.frozen) subclass the class they freeze
+    if cls in _edit_kinds:
+        return cls
+    for base in cls.__mro__[1:]:
+        if base in _edit_kinds:
+            return base
+    return None
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""compact, versioned binary encoding of hgvs objects
+
+Encodes trees of SequenceVariant, HGVSPosition, PosEdit, and all
+hgvs.location and hgvs.edit classes, e.g., for transfer between
+processes or for on-disk caches.  Encodings are several times smaller
+than pickles and faster to produce.
+
+>>> import hgvs.parser
+>>> var = hgvs.parser.Parser().parse("NM_01234.5:c.22+1A>T")
+>>> data = dumps(var)
+>>> len(data)
+46
+>>> loads(data) == var
+True
+
+Lists are encoded together with `dumps_list`, which stores each
+distinct string (such as an accession) only once:
+
+>>> loads_list(dumps_list([var, var])) == [var, var]
+True
+
+An encoding consists of a version byte followed by one value (or, for
+lists, a count and that many values).  Each value starts with a tag
+byte.  Tags below 16 identify None, booleans, integers, strings, and
+Datum values; tag 16+i identifies the i-th class in `_class_names`,
+and is followed by the encoded values of the class's attrs fields in
+declaration order.  Classes must only ever be appended to
+`_class_names`; changing the meaning of an existing tag requires a new
+format version.
+
+"""
+
+import attr
+
+import hgvs
+from hgvs.exceptions import HGVSUnsupportedOperationError, HGVSUsageError
+
+VERSION = 1
+
+_NONE, _FALSE, _TRUE, _INT, _NEGINT, _STR, _STRREF, _DATUM = range(8)
+_CLASS_TAG_BASE = 16
+
+# (module, class name) for each class tag; append only
+_class_names = (
+    ("location", "SimplePosition"),
+    ("location", "BaseOffsetPosition"),
+    ("location", "AAPosition"),
+    ("location", "Interval"),
+    ("location", "BaseOffsetInterval"),
+    ("edit", "NARefAlt"),
+    ("edit", "AARefAlt"),
+    ("edit", "AASub"),
+    ("edit", "AAFs"),
+    ("edit", "AAExt"),
+    ("edit", "Dup"),
+    ("edit", "Repeat"),
+    ("edit", "NACopy"),
+    ("edit", "Inv"),
+    ("edit", "Conv"),
+    ("posedit", "PosEdit"),
+    ("sequencevariant", "SequenceVariant"),
+    ("hgvsposition", "HGVSPosition"),
+)
+
+# class -> (tag, field names) and tag -> (class, field names); built on
+# first use because the hgvs modules import this one
+_encode_table = None
+_decode_table = None
+_datums = {}
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def dumps(obj):
+    """return binary encoding of `obj`
+
+    :param obj: a SequenceVariant, HGVSPosition, PosEdit, or
+      hgvs.location or hgvs.edit instance
+    :rtype: bytes
+
+    """
+    enc = _Encoder()
+    enc.buf.append(VERSION)
+    enc.encode(obj)
+    return bytes(enc.buf)
+
+
+def loads(data, cls=None):
+    """return object decoded from `data`, as produced by `dumps`
+
+    If `cls` is given, the decoded object must be an instance of it.
+
+    """
+    dec = _Decoder(data)
+    try:
+        obj = dec.decode()
+    except (IndexError, KeyError, UnicodeDecodeError):
+        raise HGVSUsageError("malformed or truncated hgvs binary data")
+    dec.check_end()
+    if cls is not None and not isinstance(obj, cls):
+        raise HGVSUsageError(
+            "encoded object is a {}, not a {}".format(type(obj).__name__, cls.__name__)
+        )
+    return obj
+
+
+def dumps_list(objs):
+    """return binary encoding of the objects in iterable `objs`
+
+    Strings that occur in more than one object are stored only once.
+
+    """
+    objs = list(objs)
+    enc = _Encoder()
+    enc.buf.append(VERSION)
+    enc.write_uint(len(objs))
+    for obj in objs:
+        enc.encode(obj)
+    return bytes(enc.buf)
+
+
+def loads_list(data):
+    """return list of objects decoded from `data`, as produced by `dumps_list`"""
+    dec = _Decoder(data)
+    try:
+        objs = [dec.decode() for _ in range(dec.read_uint())]
+    except (IndexError, KeyError, UnicodeDecodeError):
+        raise HGVSUsageError("malformed or truncated hgvs binary data")
+    dec.check_end()
+    return objs
+
+
+def _build_tables():
+    global _encode_table, _decode_table
+    import hgvs.edit
+    import hgvs.hgvsposition
+    import hgvs.location
+    import hgvs.posedit
+    import hgvs.sequencevariant
+    import hgvs.utils.frozen
+
+    encode_table = {}
+    decode_table = []
+    for tag, (module_name, class_name) in enumerate(_class_names, start=_CLASS_TAG_BASE):
+        cls = getattr(getattr(hgvs, module_name), class_name)
+        names = tuple(a.name for a in attr.fields(cls))
+        encode_table[cls] = (tag, names)
+        decode_table.append((cls, names))
+    lazy_cls = hgvs.sequencevariant.LazySequenceVariant
+    encode_table[lazy_cls] = encode_table[hgvs.sequencevariant.SequenceVariant]
+    for cls, frozen_cls in hgvs.utils.frozen.frozen_classes().items():
+        encode_table[frozen_cls] = encode_table[cls]
+    _datums.update((d.value, d) for d in hgvs.enums.Datum)
+    _decode_table = decode_table
+    _encode_table = encode_table
+
+
+class _Encoder:
+    __slots__ = ("buf", "strings")
+
+    def __init__(self):
+        if _encode_table is None:
+            _build_tables()
+        self.buf = bytearray()
+        self.strings = {}
+
+    def write_uint(self, n):
+        buf = self.buf
+        while n > 0x7F:
+            buf.append((n & 0x7F) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def encode(self, obj):
+        buf = self.buf
+        if obj is None:
+            buf.append(_NONE)
+        elif obj is True:
+            buf.append(_TRUE)
+        elif obj is False:
+            buf.append(_FALSE)
+        elif type(obj) is str:
+            idx = self.strings.get(obj)
+            if idx is None:
+                self.strings[obj] = len(self.strings)
+                b = obj.encode("utf-8")
+                buf.append(_STR)
+                self.write_uint(len(b))
+                buf += b
+            else:
+                buf.append(_STRREF)
+                self.write_uint(idx)
+        elif type(obj) is int:
+            if obj < 0:
+                buf.append(_NEGINT)
+                self.write_uint(-obj)
+            else:
+                buf.append(_INT)
+                self.write_uint(obj)
+        elif type(obj) is hgvs.enums.Datum:
+            buf.append(_DATUM)
+            buf.append(obj.value)
+        else:
+            try:
+                tag, names = _encode_table[type(obj)]
+            except KeyError:
+                raise HGVSUnsupportedOperationError(
+                    "cannot binary-encode objects of type {}".format(type(obj).__name__)
+                )
+            buf.append(tag)
+            for name in names:
+                self.encode(getattr(obj, name))
+
+
+class _Decoder:
+    __slots__ = ("data", "pos", "strings")
+
+    def __init__(self, data):
+        if _decode_table is None:
+            _build_tables()
+        if not data or data[0] != VERSION:
+            raise HGVSUsageError("data is not in hgvs binary format version {}".format(VERSION))
+        self.data = bytes(data)
+        self.pos = 1
+        self.strings = []
+
+    def check_end(self):
+        if self.pos != len(self.data):
+            raise HGVSUsageError("unexpected data after end of encoded object")
+
+    def read_uint(self):
+        """read varint at the current position"""
+        data = self.data
+        n = shift = 0
+        while True:
+            b = data[self.pos]
+            self.pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+
+    def decode(self):
+        data = self.data
+        pos = self.pos
+        tag = data[pos]
+        pos += 1
+        if tag >= _CLASS_TAG_BASE:
+            try:
+                cls, names = _decode_table[tag - _CLASS_TAG_BASE]
+            except IndexError:
+                raise HGVSUsageError("unknown tag {} in hgvs binary data".format(tag))
+            self.pos = pos
+            # set slots directly: the encoded object was already
+            # initialized and validated, and must be reproduced exactly
+            obj = _new(cls)
+            decode = self.decode
+            for name in names:
+                _setattr(obj, name, decode())
+            return obj
+        if tag <= _FALSE:
+            self.pos = pos
+            return None if tag == _NONE else False
+        if tag == _TRUE:
+            self.pos = pos
+            return True
+        if tag == _DATUM:
+            self.pos = pos + 1
+            return _datums[data[pos]]
+        # remaining tags are followed by an unsigned varint
+        n = data[pos]
+        if n < 0x80:
+            self.pos = pos + 1
+        else:
+            self.pos = pos
+            n = self.read_uint()
+        if tag == _STRREF:
+            return self.strings[n]
+        if tag == _INT:
+            return n
+        if tag == _NEGINT:
+            return -n
+        if tag == _STR:
+            pos = self.pos
+            s = data[pos : pos + n].decode("utf-8")
+            self.pos = pos + n
+            self.strings.append(s)
+            return s
+        raise HGVSUsageError("unknown tag {} in hgvs binary data".format(tag))
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
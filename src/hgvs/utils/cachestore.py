@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""persistent stores for data provider caches
+
+`hgvs.dataproviders.interface.Interface(mode=..., cache=...)` keeps
+the results of data provider calls in a persistent store when `mode`
+is "learn", "run", or "verify".  `open_cache` selects the store from
+the cache file name:
+
+* ``*.sqlite``, ``*.sqlite3``, ``*.db``: `SQLiteDict`, an indexed
+  single-file store.  Each new entry is one insert, so learning N
+  entries costs O(N) I/O.
+* ``*.hdpm``: `MMapDict`, a read-only, memory-mapped store for run
+  mode.  Opening it reads nothing but a header; values are decoded
+  on access, and forked worker processes share the mapped pages
+  through the OS page cache.  Create it from another cache with
+  `MMapDict.create` or ``sbin/hdp-cache-convert``.
+* anything else (e.g., ``*.hdp``): `hgvs.utils.PersistentDict`, a
+  pickled dict that is rewritten in full on every sync, so learning
+  N entries costs O(N²) I/O.
+
+Existing ``.hdp`` pickles can be imported into a `SQLiteDict`:
+
+>>> import os, tempfile
+>>> fn = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+>>> with SQLiteDict(fn) as store:
+...     n = store.import_pickle("tests/data/cache-py3.hdp")
+>>> store = open_cache(fn, flag="r")
+>>> len(store) == n
+True
+
+or with ``sbin/hdp-cache-convert cache-py3.hdp cache.sqlite``, and
+converted to a memory-mapped store for run mode:
+
+>>> mfn = os.path.join(tempfile.mkdtemp(), "cache.hdpm")
+>>> MMapDict.create(mfn, store.items())
+2227
+>>> len(open_cache(mfn, flag="r"))
+2227
+
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+from collections.abc import Mapping, MutableMapping
+
+from hgvs.utils.PersistentDict import PersistentDict, protocol
+
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+MMAP_EXTENSION = ".hdpm"
+
+
+def key_text(key):
+    """return a canonical text representation of an lru_cache key
+
+    Keys are tuples (or lists, as `_HashedSeq`) of the call arguments
+    and the function name, which are str, int, or None for data
+    provider methods.  Unlike pickles, their reprs do not depend on
+    object identity, so equal keys have equal text.
+
+    """
+    if isinstance(key, list):
+        key = tuple(key)
+    return repr(key)
+
+
+def key_digest(key):
+    """return 16-byte digest of `key_text(key)`"""
+    return hashlib.blake2b(key_text(key).encode("utf-8"), digest_size=16).digest()
+
+
+def open_cache(filename, flag="c"):
+    """open the persistent cache store for `filename`, choosing the
+    store type by file extension
+
+    :param str filename: cache file name
+    :param str flag: "c" to create, read, and write; "r" for read-only
+
+    """
+    filename = os.fspath(filename)
+    if filename.endswith(SQLITE_EXTENSIONS):
+        return SQLiteDict(filename, flag=flag)
+    if filename.endswith(MMAP_EXTENSION):
+        if flag != "r":
+            raise ValueError(
+                "{fn}: {ext} caches are read-only; learn into a .sqlite cache and convert it"
+                " with sbin/hdp-cache-convert".format(fn=filename, ext=MMAP_EXTENSION)
+            )
+        return MMapDict(filename)
+    return PersistentDict(filename, flag=flag)
+
+
+class SQLiteDict(MutableMapping):
+    """persistent mapping stored in a SQLite database
+
+    Keys may be any picklable lru_cache key (see `key_text`); values
+    are pickled.  Writes are committed by `sync()`, which
+    `hgvs.decorators.lru_cache` calls after every miss in learn mode;
+    the database uses write-ahead logging, so commits are appends to
+    the log and do not rewrite the store.
+
+    The store may be shared by threads and used across fork(); each
+    process opens its own connection.
+
+    """
+
+    def __init__(self, filename, flag="c"):
+        if flag not in ("c", "r"):
+            raise ValueError("flag must be 'c' or 'r'")
+        if flag == "r" and not os.path.exists(filename):
+            raise IOError("Cannot open file " + filename)
+        self.filename = filename
+        self.flag = flag
+        self._lock = threading.RLock()
+        self._db = None
+        self._pid = None
+        self._connect()
+
+    def _connect(self):
+        if self.flag == "r":
+            db = sqlite3.connect(
+                "file:{fn}?mode=ro".format(fn=self.filename), uri=True, check_same_thread=False
+            )
+        else:
+            db = sqlite3.connect(self.filename, check_same_thread=False)
+            db.execute("pragma journal_mode=wal")
+            db.execute("pragma synchronous=normal")
+            db.execute(
+                "create table if not exists cache"
+                " (k text primary key, key blob not null, value blob not null) without rowid"
+            )
+            db.commit()
+        self._db = db
+        self._pid = os.getpid()
+
+    def _conn(self):
+        if self._pid != os.getpid():
+            # connections must not be used across fork()
+            self._connect()
+        return self._db
+
+    def __getitem__(self, key):
+        with self._lock:
+            row = (
+                self._conn()
+                .execute("select value from cache where k = ?", (key_text(key),))
+                .fetchone()
+            )
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])  # noqa: B301,BAN-B301
+
+    def __setitem__(self, key, value):
+        if self.flag == "r":
+            raise TypeError("cache {fn} is read-only".format(fn=self.filename))
+        with self._lock:
+            self._conn().execute(
+                "insert or replace into cache (k, key, value) values (?, ?, ?)",
+                (key_text(key), pickle.dumps(key, protocol), pickle.dumps(value, protocol)),
+            )
+
+    def __delitem__(self, key):
+        if self.flag == "r":
+            raise TypeError("cache {fn} is read-only".format(fn=self.filename))
+        with self._lock:
+            cur = self._conn().execute("delete from cache where k = ?", (key_text(key),))
+        if cur.rowcount == 0:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            row = (
+                self._conn().execute("select 1 from cache where k = ?", (key_text(key),)).fetchone()
+            )
+        return row is not None
+
+    def __iter__(self):
+        with self._lock:
+            rows = self._conn().execute("select key from cache").fetchall()
+        return (pickle.loads(r[0]) for r in rows)  # noqa: B301,BAN-B301
+
+    def __len__(self):
+        with self._lock:
+            return self._conn().execute("select count(*) from cache").fetchone()[0]
+
+    def items(self):
+        with self._lock:
+            rows = self._conn().execute("select key, value from cache").fetchall()
+        return [(pickle.loads(k), pickle.loads(v)) for k, v in rows]  # noqa: B301,BAN-B301
+
+    def clear(self):
+        with self._lock:
+            self._conn().execute("delete from cache")
+
+    def sync(self):
+        """commit pending writes"""
+        if self.flag == "r":
+            return
+        with self._lock:
+            self._conn().commit()
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            if self.flag != "r":
+                # leave a self-contained file that can be opened read-only
+                # where the -wal and -shm files cannot be created
+                self._conn().execute("pragma journal_mode=delete")
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def import_pickle(self, filename):
+        """add all entries of the pickled cache `filename` (e.g., an
+        ``.hdp`` file written by `PersistentDict`), and return the
+        number of entries added"""
+        entries = PersistentDict(filename, flag="r")
+        with self._lock:
+            for key, value in entries.items():
+                self[key] = value
+            self.sync()
+        return len(entries)
+
+    def compact(self):
+        """reclaim space of deleted and replaced entries"""
+        self.sync()
+        with self._lock:
+            self._conn().execute("vacuum")
+
+
+class OverlayDict(MutableMapping):
+    """mapping that reads from a read-only store and keeps writes in
+    memory
+
+    In verify mode, `hgvs.decorators.lru_cache` stores the results of
+    misses in the cache, as it does in learn mode, but never syncs
+    them.  `PersistentDict` keeps such writes in memory; a read-only
+    `SQLiteDict` or `MMapDict` is wrapped in an OverlayDict so that it
+    behaves the same way.
+
+    >>> store = OverlayDict({"a": 1})
+    >>> store["b"] = 2
+    >>> store["a"], store["b"], len(store)
+    (1, 2, 2)
+
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.overlay = {}
+        self.flag = "r"
+
+    def __getitem__(self, key):
+        try:
+            return self.overlay[key]
+        except KeyError:
+            return self.store[key]
+
+    def __setitem__(self, key, value):
+        self.overlay[key] = value
+
+    def __delitem__(self, key):
+        del self.overlay[key]
+
+    def __contains__(self, key):
+        return key in self.overlay or key in self.store
+
+    def __iter__(self):
+        yield from self.overlay
+        for key in self.store:
+            if key not in self.overlay:
+                yield key
+
+    def __len__(self):
+        return len(self.store) + sum(1 for key in self.overlay if key not in self.store)
+
+    def sync(self):
+        pass
+
+    def close(self):
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class MMapDict(Mapping):
+    """read-only persistent mapping in a memory-mapped file
+
+    The file consists of a header (magic, number of entries, index
+    offset), the data (for each entry, the length of the pickled key,
+    the pickled key, and the pickled value), and an index of
+    fixed-size records (key digest, data offset, data length) sorted
+    by key digest.  A lookup
+    is a binary search of the index followed by unpickling of one
+    value; nothing is read or decoded in advance.  Keys are identified
+    by their 128-bit `key_digest` only.
+
+    In verify mode, `Interface` wraps the store in an `OverlayDict`, so
+    that results of misses are kept in memory.  The lru_cache
+    statistics do not read persistent stores, so polling
+    `hgvs.utils.cachestats` does not decode entries either.
+
+    """
+
+    MAGIC = b"HGVSMMC1"
+    _header = struct.Struct("<8sQQ")
+    _record = struct.Struct("<16sQI")
+    _key_len = struct.Struct("<I")
+
+    # sync() is called by hgvs.decorators.lru_cache in learn mode only
+    flag = "r"
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self._header.size:
+                raise IOError("{fn}: not an {ext} cache".format(fn=filename, ext=MMAP_EXTENSION))
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n, self._index_offset = self._header.unpack_from(self._mm, 0)
+        if magic != self.MAGIC:
+            raise IOError("{fn}: not an {ext} cache".format(fn=filename, ext=MMAP_EXTENSION))
+        self._digests = _Digests(self._mm, self._index_offset, self._record.size, self._n)
+
+    @classmethod
+    def create(cls, filename, items):
+        """write `items`, an iterable of (key, value) pairs, to a new
+        file `filename`, and return the number of entries
+
+        Entries are written as they are read, so only the index is
+        held in memory.  The file is written under a temporary name
+        and renamed, so processes that have the previous file open
+        are unaffected.
+
+        """
+        tmp_fn = "{fn}.tmp{pid}".format(fn=filename, pid=os.getpid())
+        index = {}  # digest -> (offset, length); later entries replace earlier ones
+        try:
+            with open(tmp_fn, "wb") as f:
+                # the header is rewritten once the index offset is known
+                f.write(cls._header.pack(cls.MAGIC, 0, 0))
+                offset = cls._header.size
+                for key, value in items:
+                    kp = pickle.dumps(key, protocol)
+                    vp = pickle.dumps(value, protocol)
+                    f.write(cls._key_len.pack(len(kp)))
+                    f.write(kp)
+                    f.write(vp)
+                    length = cls._key_len.size + len(kp) + len(vp)
+                    index[key_digest(key)] = (offset, length)
+                    offset += length
+                for digest in sorted(index):
+                    f.write(cls._record.pack(digest, *index[digest]))
+                f.seek(0)
+                f.write(cls._header.pack(cls.MAGIC, len(index), offset))
+            os.replace(tmp_fn, filename)
+        finally:
+            if os.path.exists(tmp_fn):
+                os.remove(tmp_fn)
+        return len(index)
+
+    def _find(self, key):
+        digest = key_digest(key)
+        i = bisect.bisect_left(self._digests, digest)
+        if i < self._n and self._digests[i] == digest:
+            return i
+        return None
+
+    def _entry(self, i):
+        _, offset, length = self._record.unpack_from(
+            self._mm, self._index_offset + i * self._record.size
+        )
+        (key_len,) = self._key_len.unpack_from(self._mm, offset)
+        start = offset + self._key_len.size
+        return self._mm, start, start + key_len, offset + length
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i is None:
+            raise KeyError(key)
+        mm, _, value_start, end = self._entry(i)
+        return pickle.loads(mm[value_start:end])  # noqa: B301,BAN-B301
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        for i in range(self._n):
+            mm, start, value_start, _ = self._entry(i)
+            yield pickle.loads(mm[start:value_start])  # noqa: B301,BAN-B301
+
+    def __len__(self):
+        return self._n
+
+    def items(self):
+        for i in range(self._n):
+            mm, start, value_start, end = self._entry(i)
+            yield (
+                pickle.loads(mm[start:value_start]),  # noqa: B301,BAN-B301
+                pickle.loads(mm[value_start:end]),  # noqa: B301,BAN-B301
+            )
+
+    def sync(self):
+        pass
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _Digests:
+    """sequence view of the key digests in an `MMapDict` index, for bisect"""
+
+    __slots__ = ("mm", "offset", "record_size", "n")
+
+    def __init__(self, mm, offset, record_size, n):
+        self.mm = mm
+        self.offset = offset
+        self.record_size = record_size
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        start = self.offset + i * self.record_size
+        return self.mm[start : start + 16]
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""immutable, hashable versions of hgvs objects
+
+`freeze` converts a SequenceVariant, HGVSPosition, PosEdit, or any
+hgvs.location or hgvs.edit object (and everything it contains) into
+an instance of a frozen subclass of the same class.  Frozen objects
+cannot be modified, compare by value, and cache their hash, so they
+may be used as dict keys and set members, e.g., to deduplicate
+variants or to memoize results:
+
+>>> import hgvs.parser
+>>> hp = hgvs.parser.Parser()
+>>> var = freeze(hp.parse("NM_01234.5:c.22+1A>T"))
+>>> type(var).__name__
+'FrozenSequenceVariant'
+>>> var == freeze(hp.parse("NM_01234.5:c.22+1A>T"))
+True
+>>> len({var, freeze(hp.parse("NM_01234.5:c.22+1A>T"))})
+1
+>>> var.ac = "NM_99999.1"
+Traceback (most recent call last):
+...
+attr.exceptions.FrozenInstanceError
+
+Frozen objects are instances of the original classes, so all
+non-mutating methods (formatting, validation, length_change, etc.)
+work as usual.  Changes are made by creating new objects with
+`evolve`, which shares all unchanged components with the original:
+
+>>> var2 = evolve(var, posedit=evolve(var.posedit, edit=evolve(var.posedit.edit, alt="G")))
+>>> str(var2)
+'NM_01234.5:c.22+1A>G'
+>>> var2.posedit.pos is var.posedit.pos
+True
+
+`thaw` (or the clone() method) returns an ordinary, mutable copy.
+
+VariantMapper and Normalizer accept frozen variants and never modify
+them; because the inputs cannot change, they are not copied
+defensively.  Mapping results are new, mutable variants.
+Normalizing a frozen variant returns a frozen variant.  Mutable
+inputs are handled as before: a missing reference sequence is filled
+in place (see `SequenceVariant.fill_ref`), so freeze variants that
+must not change.
+
+"""
+
+import attr
+
+import hgvs
+from hgvs.exceptions import HGVSUnsupportedOperationError, HGVSUsageError
+
+# (module, class name) of classes that have frozen counterparts
+_class_names = (
+    ("location", "SimplePosition"),
+    ("location", "BaseOffsetPosition"),
+    ("location", "AAPosition"),
+    ("location", "Interval"),
+    ("location", "BaseOffsetInterval"),
+    ("edit", "NARefAlt"),
+    ("edit", "AARefAlt"),
+    ("edit", "AASub"),
+    ("edit", "AAFs"),
+    ("edit", "AAExt"),
+    ("edit", "Dup"),
+    ("edit", "Repeat"),
+    ("edit", "NACopy"),
+    ("edit", "Inv"),
+    ("edit", "Conv"),
+    ("posedit", "PosEdit"),
+    ("sequencevariant", "SequenceVariant"),
+    ("hgvsposition", "HGVSPosition"),
+)
+
+# built on first use because the hgvs modules must be importable first
+_frozen_classes = None  # mutable class -> frozen class
+_base_classes = None  # mutable or frozen class -> mutable class
+_frozen_bases = None  # frozen class -> mutable class
+_fields = None  # mutable or frozen class -> tuple of attrs field names
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def freeze(obj):
+    """return a frozen (immutable and hashable) version of `obj`
+
+    `obj` itself is returned if it is already frozen.  Otherwise, a
+    frozen copy of `obj` and of all hgvs objects it contains is
+    returned; strings and other immutable values are shared.
+
+    """
+    if _frozen_classes is None:
+        _build_tables()
+    if type(obj) not in _base_classes:
+        raise HGVSUnsupportedOperationError(
+            "cannot freeze objects of type {}".format(type(obj).__name__)
+        )
+    return _freeze(obj)
+
+
+def thaw(obj):
+    """return a new, mutable copy of `obj` and all hgvs objects it contains
+
+    `obj` may be frozen or mutable.  For mutable objects, this is
+    equivalent to obj.clone() (or copy.deepcopy).
+
+    """
+    if _frozen_classes is None:
+        _build_tables()
+    if type(obj) not in _base_classes:
+        raise HGVSUnsupportedOperationError(
+            "cannot thaw objects of type {}".format(type(obj).__name__)
+        )
+    return _thaw(obj)
+
+
+def evolve(obj, **changes):
+    """return a shallow copy of `obj` with the attributes in `changes` replaced
+
+    The result is frozen if `obj` is frozen, in which case the new
+    values are frozen as well.  Unchanged attributes are shared with
+    `obj`.  As with copy and deepcopy, validation performed by the
+    class initializer is not repeated.
+
+    """
+    if _frozen_classes is None:
+        _build_tables()
+    cls = type(obj)
+    try:
+        names = _fields[cls]
+    except KeyError:
+        raise HGVSUnsupportedOperationError("cannot evolve objects of type {}".format(cls.__name__))
+    unknown = set(changes).difference(names)
+    if unknown:
+        raise HGVSUsageError(
+            "{} has no attribute(s) {}".format(cls.__name__, ", ".join(sorted(unknown)))
+        )
+    frozen = cls in _frozen_bases
+    new = _new(cls if frozen else _base_classes[cls])
+    for name in names:
+        if name in changes:
+            value = changes[name]
+            if frozen:
+                value = _freeze(value)
+        else:
+            value = getattr(obj, name)
+        _setattr(new, name, value)
+    return new
+
+
+def is_frozen(obj):
+    """return True if `obj` is a frozen hgvs object"""
+    if _frozen_classes is None:
+        _build_tables()
+    return type(obj) in _frozen_bases
+
+
+def _freeze(obj):
+    cls = type(obj)
+    if cls in _frozen_bases:
+        return obj
+    fcls = _frozen_classes.get(_base_classes.get(cls))
+    if fcls is None:
+        return obj
+    new = _new(fcls)
+    for name in _fields[cls]:
+        _setattr(new, name, _freeze(getattr(obj, name)))
+    return new
+
+
+def _thaw(obj):
+    cls = _base_classes.get(type(obj))
+    if cls is None:
+        return obj
+    new = _new(cls)
+    for name in _fields[cls]:
+        _setattr(new, name, _thaw(getattr(obj, name)))
+    return new
+
+
+class _FrozenMixin:
+    """methods shared by all frozen classes"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __delattr__(self, name):
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            h = hash((self._base,) + tuple(getattr(self, name) for name in self._names))
+            _setattr(self, "_hash", h)
+            return h
+
+    def __eq__(self, other):
+        # value comparison of all fields; unlike the position classes'
+        # __eq__, this also works for uncertain positions and for
+        # frozen/mutable pairs
+        if self is other:
+            return True
+        if _base_classes.get(type(other)) is not self._base:
+            return NotImplemented
+        if type(other) is type(self) and hash(self) != hash(other):
+            return False
+        for name in self._names:
+            if not getattr(self, name) == getattr(other, name):
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def clone(self):
+        """return a mutable copy (see `thaw`)"""
+        return _thaw(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _set_uncertain(self):
+        raise attr.exceptions.FrozenInstanceError()
+
+
+def _fill_ref(self, hdp):
+    """return variant with reference sequence filled in from `hdp`
+
+    Unlike SequenceVariant.fill_ref, the variant is not modified.  If
+    the reference changes, a new frozen variant is returned.
+
+    """
+    var = _thaw(self).fill_ref(hdp)
+    return self if var == self else _freeze(var)
+
+
+def _build_tables():
+    global _frozen_classes, _base_classes, _fields, _frozen_bases
+    import hgvs.edit
+    import hgvs.hgvsposition
+    import hgvs.location
+    import hgvs.posedit
+    import hgvs.sequencevariant
+
+    frozen_classes = {}
+    base_classes = {}
+    fields = {}
+    for module_name, class_name in _class_names:
+        cls = getattr(getattr(hgvs, module_name), class_name)
+        names = tuple(a.name for a in attr.fields(cls))
+        ns = {
+            "__slots__": ("_hash",),
+            "__module__": __name__,
+            "__qualname__": "Frozen" + class_name,
+            "_base": cls,
+            "_names": names,
+        }
+        if cls is hgvs.sequencevariant.SequenceVariant:
+            ns["fill_ref"] = _fill_ref
+        fcls = type("Frozen" + class_name, (_FrozenMixin, cls), ns)
+        globals()[fcls.__name__] = fcls
+        frozen_classes[cls] = fcls
+        base_classes[cls] = base_classes[fcls] = cls
+        fields[cls] = fields[fcls] = names
+    lazy_cls = hgvs.sequencevariant.LazySequenceVariant
+    base_classes[lazy_cls] = hgvs.sequencevariant.SequenceVariant
+    fields[lazy_cls] = fields[hgvs.sequencevariant.SequenceVariant]
+    _frozen_bases = {fcls: cls for cls, fcls in frozen_classes.items()}
+    _base_classes = base_classes
+    _fields = fields
+    _frozen_classes = frozen_classes
+
+
+def frozen_classes():
+    """return dict of mutable class -> frozen class"""
+    if _frozen_classes is None:
+        _build_tables()
+    return dict(_frozen_classes)
+
+
+def __getattr__(name):
+    # frozen classes are created on first use; this makes them
+    # available by name, e.g., for unpickling in a new process
+    if name.startswith("Frozen") and _frozen_classes is None:
+        _build_tables()
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
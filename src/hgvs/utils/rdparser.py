@@ -0,0 +1,899 @@
+# -*- coding: utf-8 -*-
+"""Hand-written recursive-descent implementation of the HGVS grammar
+
+This module implements the rules in `hgvs/_data/hgvs.pymeta` directly
+in Python.  Each rule `foo` in the grammar corresponds to a method
+`rule_foo(i)` of :class:`RDParser` that attempts to match the rule at
+offset `i` of the input and returns a `(value, next_i)` tuple on
+success or None on failure.  Ordered choice, greediness, and the
+semantic actions are the same as in the grammar, so results are
+identical to those of the generated OMeta parser.
+
+The main difference is that variant rules (`hgvs_variant`,
+`hgvs_position`) parse the accession and gene expression once and
+then dispatch on the sequence type character rather than trying each
+variant type in turn.
+
+>>> parse("c_interval", "22+1_23-2")
+BaseOffsetInterval(start=22+1, end=23-2, uncertain=False)
+
+"""
+
+from functools import partialmethod
+
+from bioutils.sequences import aa_to_aa1
+
+import hgvs.edit
+import hgvs.hgvsposition
+import hgvs.location
+import hgvs.posedit
+import hgvs.sequencevariant
+from hgvs.enums import Datum
+from hgvs.exceptions import HGVSParseError
+
+_dna_chars = frozenset("ACGTRYMKWSBDHVNacgtrymkwsbdhvn")
+_na_chars = frozenset("ACGTURYMKWSBDHVNacgturymkwsbdhvn")
+_rna_chars = frozenset("ACGURYMKWSBDHVNacgurymkwsbdhvn")
+_aa1_chars = frozenset("ACDEFGHIKLMNPQRSTVWYBZXU")
+_term1_chars = frozenset("X*")
+_pm_chars = frozenset("-+")
+_aa3 = frozenset(
+    [
+        "Ala",
+        "Cys",
+        "Asp",
+        "Glu",
+        "Phe",
+        "Gly",
+        "His",
+        "Ile",
+        "Lys",
+        "Leu",
+        "Met",
+        "Asn",
+        "Pro",
+        "Gln",
+        "Arg",
+        "Ser",
+        "Thr",
+        "Val",
+        "Trp",
+        "Tyr",
+        "Asx",
+        "Glx",
+        "Xaa",
+        "Sec",
+    ]
+)
+
+
+class RDParser:
+    """recursive-descent parser for a single input string
+
+    Instances hold the input and the furthest failure seen so far
+    (for error messages), and are therefore not reusable across
+    inputs.  Use :func:`parse` to parse a string with a named rule.
+
+    """
+
+    __slots__ = ("s", "n", "err_pos", "expected")
+
+    def __init__(self, s):
+        self.s = s
+        self.n = len(s)
+        self.err_pos = -1
+        self.expected = set()
+
+    def _fail(self, i, expected):
+        """record a failure to match `expected` at `i`; returns None"""
+        if i > self.err_pos:
+            self.err_pos = i
+            self.expected = {expected}
+        elif i == self.err_pos:
+            self.expected.add(expected)
+        return None
+
+    def _literal(self, i, lit):
+        """match literal `lit` at `i`; returns next offset or None"""
+        if self.s.startswith(lit, i):
+            return i + len(lit)
+        return self._fail(i, repr(lit))
+
+    def _span(self, i, chars):
+        """returns the end of the run of `chars` that starts at `i`"""
+        s = self.s
+        n = self.n
+        while i < n and s[i] in chars:
+            i += 1
+        return i
+
+    def _span_digits(self, i):
+        s = self.s
+        n = self.n
+        while i < n and s[i].isdigit():
+            i += 1
+        return i
+
+    def _char_in(self, i, chars, expected):
+        if i < self.n and self.s[i] in chars:
+            return self.s[i], i + 1
+        return self._fail(i, expected)
+
+    ############################################################################
+    ## HGVS Sequence Variant and Position
+
+    def _header(self, i):
+        """parses `accn opt_gene_expr ':'`; returns (ac, gene, next_i) or None"""
+        r = self.rule_accn(i)
+        if r is None:
+            return None
+        ac, i = r
+        gene, i = self.rule_opt_gene_expr(i)
+        i = self._literal(i, ":")
+        if i is None:
+            return None
+        return ac, gene, i
+
+    def _variant(self, i, types):
+        r = self._header(i)
+        if r is None:
+            return None
+        ac, gene, i = r
+        if i >= self.n or self.s[i] not in types:
+            return self._fail(i, "one of " + ", ".join(repr(t) for t in types))
+        type = self.s[i]
+        j = self._literal(i + 1, ".")
+        if j is None:
+            return None
+        r = getattr(self, "rule_" + type + "_posedit")(j)
+        if r is None:
+            return None
+        posedit, j = r
+        return (
+            hgvs.sequencevariant.SequenceVariant(ac=ac, gene=gene, type=type, posedit=posedit),
+            j,
+        )
+
+    def _hgvs_position(self, i, types):
+        r = self._header(i)
+        if r is None:
+            return None
+        ac, gene, i = r
+        if i >= self.n or self.s[i] not in types:
+            return self._fail(i, "one of " + ", ".join(repr(t) for t in types))
+        type = self.s[i]
+        j = self._literal(i + 1, ".")
+        if j is None:
+            return None
+        r = getattr(self, "rule_" + type + "_interval")(j)
+        if r is None:
+            return None
+        pos, j = r
+        return hgvs.hgvsposition.HGVSPosition(ac=ac, gene=gene, type=type, pos=pos), j
+
+    rule_hgvs_variant = partialmethod(_variant, types="gmcnrp")
+    rule_c_variant = partialmethod(_variant, types="c")
+    rule_g_variant = partialmethod(_variant, types="g")
+    rule_m_variant = partialmethod(_variant, types="m")
+    rule_n_variant = partialmethod(_variant, types="n")
+    rule_p_variant = partialmethod(_variant, types="p")
+    rule_r_variant = partialmethod(_variant, types="r")
+
+    rule_hgvs_position = partialmethod(_hgvs_position, types="gmcnrp")
+    rule_c_hgvs_position = partialmethod(_hgvs_position, types="c")
+    rule_g_hgvs_position = partialmethod(_hgvs_position, types="g")
+    rule_m_hgvs_position = partialmethod(_hgvs_position, types="m")
+    rule_n_hgvs_position = partialmethod(_hgvs_position, types="n")
+    rule_p_hgvs_position = partialmethod(_hgvs_position, types="p")
+    rule_r_hgvs_position = partialmethod(_hgvs_position, types="r")
+
+    ############################################################################
+    ## HGVS Edit (without accession)
+
+    def _typed_posedit(self, i, type):
+        j = self._literal(i, type)
+        if j is None:
+            return None
+        j = self._literal(j, ".")
+        if j is None:
+            return None
+        r = getattr(self, "rule_" + type + "_posedit")(j)
+        if r is None:
+            return None
+        posedit, j = r
+        return hgvs.sequencevariant.SequenceVariant(None, type, posedit), j
+
+    rule_c_typed_posedit = partialmethod(_typed_posedit, type="c")
+    rule_g_typed_posedit = partialmethod(_typed_posedit, type="g")
+    rule_m_typed_posedit = partialmethod(_typed_posedit, type="m")
+    rule_n_typed_posedit = partialmethod(_typed_posedit, type="n")
+    rule_p_typed_posedit = partialmethod(_typed_posedit, type="p")
+    rule_r_typed_posedit = partialmethod(_typed_posedit, type="r")
+
+    ############################################################################
+    ## PosEdits
+
+    def _na_posedit(self, i, type):
+        r = getattr(self, "rule_" + type + "_interval")(i)
+        if r is None:
+            return None
+        pos, i = r
+        r = self.rule_dna_edit(i)
+        if r is None:
+            return None
+        edit, i = r
+        return hgvs.posedit.PosEdit(pos=pos, edit=edit), i
+
+    rule_c_posedit = partialmethod(_na_posedit, type="c")
+    rule_g_posedit = partialmethod(_na_posedit, type="g")
+    rule_m_posedit = partialmethod(_na_posedit, type="m")
+    rule_n_posedit = partialmethod(_na_posedit, type="n")
+
+    def _maybe_uncertain_posedit(self, i, interval_rule, edit_rule):
+        r = interval_rule(i)
+        if r is not None:
+            pos, j = r
+            r = edit_rule(j)
+            if r is not None:
+                edit, j = r
+                return hgvs.posedit.PosEdit(pos=pos, edit=edit), j
+        if i < self.n and self.s[i] == "(":
+            r = interval_rule(i + 1)
+            if r is not None:
+                pos, j = r
+                r = edit_rule(j)
+                if r is not None:
+                    edit, j = r
+                    if self._literal(j, ")") is not None:
+                        return hgvs.posedit.PosEdit(pos=pos, edit=edit, uncertain=True), j + 1
+        else:
+            self._fail(i, "'('")
+        return None
+
+    def rule_r_posedit(self, i):
+        return self._maybe_uncertain_posedit(i, self.rule_r_interval, self.rule_rna_edit)
+
+    def rule_p_posedit(self, i):
+        r = self._maybe_uncertain_posedit(i, self.rule_p_interval, self.rule_pro_edit)
+        if r is not None:
+            return r
+        return self.rule_p_posedit_special(i)
+
+    def rule_p_posedit_special(self, i):
+        s = self.s
+        if s.startswith("=", i):
+            return hgvs.posedit.PosEdit(pos=None, edit="=", uncertain=False), i + 1
+        if s.startswith("(=)", i):
+            return hgvs.posedit.PosEdit(pos=None, edit="=", uncertain=True), i + 3
+        if s.startswith("0?", i):
+            return hgvs.posedit.PosEdit(pos=None, edit="0", uncertain=True), i + 2
+        if s.startswith("0", i):
+            return hgvs.posedit.PosEdit(pos=None, edit="0", uncertain=False), i + 1
+        if s.startswith("?", i):
+            return None, i + 1
+        if s.startswith("(", i):
+            return self._fail(i + 1, "'='")
+        return self._fail(i, "one of '=', '(', '0', '?'")
+
+    ############################################################################
+    ## Edits
+
+    def _edit_mu(self, i, edit_rule):
+        r = edit_rule(i)
+        if r is not None:
+            return r
+        if self._literal(i, "(") is None:
+            return None
+        r = edit_rule(i + 1)
+        if r is None:
+            return None
+        edit, j = r
+        if self._literal(j, ")") is None:
+            return None
+        return edit._set_uncertain(), j + 1
+
+    def rule_dna_edit_mu(self, i):
+        return self._edit_mu(i, self.rule_dna_edit)
+
+    def rule_rna_edit_mu(self, i):
+        return self._edit_mu(i, self.rule_rna_edit)
+
+    def rule_pro_edit_mu(self, i):
+        return self._edit_mu(i, self.rule_pro_edit)
+
+    def rule_dna_edit(self, i):
+        return (
+            self._na_ident(i, _dna_chars)
+            or self._na_subst(i, _dna_chars)
+            or self._na_delins(i, _dna_chars)
+            or self._na_ins(i, _dna_chars)
+            or self._na_del(i, _dna_chars)
+            or self._na_dup(i, _dna_chars)
+            or self._na_inv(i, _dna_chars)
+            or self.rule_dna_con(i)
+            or self.rule_dna_copy(i)
+        )
+
+    def rule_rna_edit(self, i):
+        return (
+            self._na_ident(i, _rna_chars)
+            or self._na_subst(i, _rna_chars)
+            or self._na_delins(i, _rna_chars)
+            or self._na_ins(i, _rna_chars)
+            or self._na_del(i, _rna_chars)
+            or self._na_dup(i, _rna_chars)
+            or self._na_inv(i, _rna_chars)
+            or self.rule_rna_con(i)
+        )
+
+    def _na_ident(self, i, chars):
+        j = self._span(i, chars)
+        if self._literal(j, "=") is None:
+            return None
+        ref = self.s[i:j]
+        return hgvs.edit.NARefAlt(ref=ref, alt=ref), j + 1
+
+    def _na_subst(self, i, chars):
+        s = self.s
+        if i + 2 < self.n and s[i] in chars and s[i + 1] == ">" and s[i + 2] in chars:
+            return hgvs.edit.NARefAlt(ref=s[i], alt=s[i + 2]), i + 3
+        return self._fail(i, "a substitution")
+
+    def _na_num_or_seq(self, i, chars):
+        """matches `(<num>|<dna*>)`, which cannot fail"""
+        j = self._span_digits(i)
+        if j == i:
+            j = self._span(i, chars)
+        return self.s[i:j], j
+
+    def _na_delins(self, i, chars):
+        j = self._literal(i, "del")
+        if j is None:
+            return None
+        ref, j = self._na_num_or_seq(j, chars)
+        j = self._literal(j, "ins")
+        if j is None:
+            return None
+        k = self._span(j, chars)
+        if k == j:
+            return self._fail(j, "a nucleotide")
+        return hgvs.edit.NARefAlt(ref=ref, alt=self.s[j:k]), k
+
+    def _na_del(self, i, chars):
+        j = self._literal(i, "del")
+        if j is None:
+            return None
+        ref, j = self._na_num_or_seq(j, chars)
+        return hgvs.edit.NARefAlt(ref=ref, alt=None), j
+
+    def _na_ins(self, i, chars):
+        j = self._literal(i, "ins")
+        if j is None:
+            return None
+        k = self._span(j, chars)
+        if k == j:
+            return self._fail(j, "a nucleotide")
+        return hgvs.edit.NARefAlt(ref=None, alt=self.s[j:k]), k
+
+    def _na_dup(self, i, chars):
+        j = self._literal(i, "dup")
+        if j is None:
+            return None
+        k = self._span(j, chars)
+        return hgvs.edit.Dup(ref=self.s[j:k]), k
+
+    def _na_inv(self, i, chars):
+        j = self._literal(i, "inv")
+        if j is None:
+            return None
+        _, j = self._na_num_or_seq(j, chars)
+        return hgvs.edit.Inv(ref=None), j
+
+    def _na_con(self, i):
+        j = self._literal(i, "con")
+        if j is None:
+            return None
+        r = self.rule_hgvs_position(j)
+        if r is None:
+            return None
+        pos, j = r
+        return hgvs.edit.Conv(from_ac=pos.ac, from_type=pos.type, from_pos=pos.pos), j
+
+    def rule_dna_copy(self, i):
+        j = self._literal(i, "copy")
+        if j is None:
+            return None
+        r = self.rule_num(j)
+        if r is None:
+            return None
+        n, j = r
+        return hgvs.edit.NACopy(copy=n), j
+
+    rule_dna_ident = partialmethod(_na_ident, chars=_dna_chars)
+    rule_dna_subst = partialmethod(_na_subst, chars=_dna_chars)
+    rule_dna_delins = partialmethod(_na_delins, chars=_dna_chars)
+    rule_dna_del = partialmethod(_na_del, chars=_dna_chars)
+    rule_dna_ins = partialmethod(_na_ins, chars=_dna_chars)
+    rule_dna_dup = partialmethod(_na_dup, chars=_dna_chars)
+    rule_dna_inv = partialmethod(_na_inv, chars=_dna_chars)
+    rule_dna_con = _na_con
+
+    rule_rna_ident = partialmethod(_na_ident, chars=_rna_chars)
+    rule_rna_subst = partialmethod(_na_subst, chars=_rna_chars)
+    rule_rna_delins = partialmethod(_na_delins, chars=_rna_chars)
+    rule_rna_del = partialmethod(_na_del, chars=_rna_chars)
+    rule_rna_ins = partialmethod(_na_ins, chars=_rna_chars)
+    rule_rna_dup = partialmethod(_na_dup, chars=_rna_chars)
+    rule_rna_inv = partialmethod(_na_inv, chars=_rna_chars)
+    rule_rna_con = _na_con
+
+    def rule_pro_edit(self, i):
+        return (
+            self.rule_pro_fs(i)
+            or self.rule_pro_ext(i)
+            or self.rule_pro_subst(i)
+            or self.rule_pro_delins(i)
+            or self.rule_pro_ins(i)
+            or self.rule_pro_del(i)
+            or self.rule_pro_dup(i)
+            or self.rule_pro_ident(i)
+        )
+
+    def rule_pro_subst(self, i):
+        r = self.rule_aat13(i)
+        if r is None:
+            r = self._char_in(i, "?", "'?'")
+            if r is None:
+                return None
+        alt, j = r
+        return hgvs.edit.AASub(ref="", alt=alt), j
+
+    def rule_pro_delins(self, i):
+        j = self._literal(i, "delins")
+        if j is None:
+            return None
+        r = self.rule_aat13_seq(j)
+        if r is None:
+            return None
+        alt, j = r
+        return hgvs.edit.AARefAlt(ref="", alt=alt), j
+
+    def rule_pro_del(self, i):
+        j = self._literal(i, "del")
+        if j is None:
+            return None
+        return hgvs.edit.AARefAlt(ref="", alt=None), j
+
+    def rule_pro_ins(self, i):
+        j = self._literal(i, "ins")
+        if j is None:
+            return None
+        r = self.rule_aat13_seq(j)
+        if r is None:
+            return None
+        alt, j = r
+        return hgvs.edit.AARefAlt(ref=None, alt=alt), j
+
+    def rule_pro_dup(self, i):
+        j = self._literal(i, "dup")
+        if j is None:
+            return None
+        return hgvs.edit.Dup(ref=""), j
+
+    def rule_pro_fs(self, i):
+        r = self.rule_aat13(i)
+        alt, j = ("", i) if r is None else r
+        r = self.rule_fs(j)
+        if r is None:
+            return None
+        length, j = r
+        return hgvs.edit.AAFs(ref="", alt=alt, length=length), j
+
+    def rule_pro_ext(self, i):
+        r = self.rule_aat13(i)
+        alt, j = (None, i) if r is None else r
+        r = self.rule_ext(j)
+        if r is None:
+            return None
+        (aaterm, length), j = r
+        return hgvs.edit.AAExt(ref="", alt=alt, aaterm=aaterm, length=length), j
+
+    def rule_pro_ident(self, i):
+        j = self._literal(i, "=")
+        if j is None:
+            return None
+        return hgvs.edit.AARefAlt(ref="", alt=""), j
+
+    ############################################################################
+    ## Locations
+
+    def _interval(self, i, def_interval_rule):
+        r = def_interval_rule(i)
+        if r is not None:
+            return r
+        if self._literal(i, "(") is None:
+            return None
+        r = def_interval_rule(i + 1)
+        if r is None:
+            return None
+        iv, j = r
+        if self._literal(j, ")") is None:
+            return None
+        return iv._set_uncertain(), j + 1
+
+    def rule_c_interval(self, i):
+        return self._interval(i, self.rule_def_c_interval)
+
+    def rule_g_interval(self, i):
+        return self._interval(i, self.rule_def_g_interval)
+
+    def rule_m_interval(self, i):
+        return self._interval(i, self.rule_def_m_interval)
+
+    def rule_n_interval(self, i):
+        return self._interval(i, self.rule_def_n_interval)
+
+    def rule_p_interval(self, i):
+        return self._interval(i, self.rule_def_p_interval)
+
+    def rule_r_interval(self, i):
+        return self._interval(i, self.rule_def_r_interval)
+
+    def _def_interval(self, i, pos_rule, interval_class):
+        r = pos_rule(i)
+        if r is None:
+            return None
+        start, j = r
+        if self._literal(j, "_") is not None:
+            r = pos_rule(j + 1)
+            if r is not None:
+                end, k = r
+                return interval_class(start, end), k
+        # as in the grammar, end is a distinct but identical position
+        end, _ = pos_rule(i)
+        return interval_class(start, end), j
+
+    def rule_def_c_interval(self, i):
+        return self._def_interval(i, self.rule_def_c_pos, hgvs.location.BaseOffsetInterval)
+
+    def rule_def_g_interval(self, i):
+        return self._def_interval(i, self.rule_def_g_pos, hgvs.location.Interval)
+
+    def rule_def_m_interval(self, i):
+        return self._def_interval(i, self.rule_def_m_pos, hgvs.location.Interval)
+
+    def rule_def_n_interval(self, i):
+        return self._def_interval(i, self.rule_def_n_pos, hgvs.location.BaseOffsetInterval)
+
+    def rule_def_p_interval(self, i):
+        return self._def_interval(i, self.rule_def_p_pos, hgvs.location.Interval)
+
+    def rule_def_r_interval(self, i):
+        return self._def_interval(i, self.rule_def_r_pos, hgvs.location.Interval)
+
+    def _base_offset_pos(self, i, datum):
+        r = self.rule_snum(i)
+        if r is None:
+            return None
+        b, i = r
+        o, i = self.rule_offset(i)
+        return hgvs.location.BaseOffsetPosition(b, o, datum=datum), i
+
+    def rule_def_c_pos(self, i):
+        r = self._base_offset_pos(i, Datum.CDS_START)
+        if r is not None:
+            return r
+        if self._literal(i, "*") is None:
+            return None
+        r = self.rule_num(i + 1)
+        if r is None:
+            return None
+        b, i = r
+        o, i = self.rule_offset(i)
+        return hgvs.location.BaseOffsetPosition(b, o, datum=Datum.CDS_END), i
+
+    def rule_def_n_pos(self, i):
+        return self._base_offset_pos(i, Datum.SEQ_START)
+
+    def rule_def_r_pos(self, i):
+        return self._base_offset_pos(i, Datum.SEQ_START)
+
+    def rule_def_g_pos(self, i):
+        r = self.rule_num(i)
+        if r is None:
+            if self._literal(i, "?") is None:
+                return None
+            r = None, i + 1
+        pos, i = r
+        return hgvs.location.SimplePosition(pos), i
+
+    rule_def_m_pos = rule_def_g_pos
+
+    def rule_def_p_pos(self, i):
+        r = self.rule_term13(i) or self.rule_aa13(i)
+        if r is None:
+            return None
+        aa, j = r
+        r = self.rule_num(j)
+        if r is None:
+            return None
+        pos, j = r
+        return hgvs.location.AAPosition(pos, aa_to_aa1(aa)), j
+
+    rule_c_pos = rule_def_c_pos
+    rule_g_pos = rule_def_g_pos
+    rule_m_pos = rule_def_m_pos
+    rule_n_pos = rule_def_n_pos
+    rule_p_pos = rule_def_p_pos
+    rule_r_pos = rule_def_r_pos
+
+    ############################################################################
+    ## Basic types
+
+    def rule_fs(self, i):
+        j = self._literal(i, "fs")
+        if j is None:
+            return None
+        r = self.rule_aa13_fs(j)
+        return (None, j) if r is None else r
+
+    def rule_ext(self, i):
+        j = self._literal(i, "ext")
+        if j is None:
+            return None
+        r = self.rule_aa13_ext(j)
+        return ((None, None), j) if r is None else r
+
+    def rule_aa13_fs(self, i):
+        r = self.rule_term13(i)
+        if r is None:
+            return None
+        return self.rule_fsext_offset(r[1])
+
+    def rule_aa13_ext(self, i):
+        r = self.rule_term13(i)
+        if r is not None:
+            aat, j = r
+            n, j = self.rule_fsext_offset(j)
+            return (aat, n), j
+        r = self.rule_aa13(i)
+        aat, j = (None, i) if r is None else r
+        r = self.rule_nnum(j)
+        if r is None:
+            return None
+        n, j = r
+        return (aat, n), j
+
+    def rule_fsext_offset(self, i):
+        r = self.rule_num(i)
+        if r is not None:
+            return r
+        if self._literal(i, "?") is not None:
+            return "?", i + 1
+        return None, i
+
+    def _seq_rule(self, i, one_rule, seq_rule, term_rule):
+        """matches `<one_rule> | <seq_rule+ term_rule?>`"""
+        r = one_rule(i)
+        if r is not None:
+            return self.s[i : r[1]], r[1]
+        j = i
+        while True:
+            r = seq_rule(j)
+            if r is None:
+                break
+            j = r[1]
+        if j == i:
+            return None
+        if term_rule is not None:
+            r = term_rule(j)
+            if r is not None:
+                j = r[1]
+        return self.s[i:j], j
+
+    def rule_dna_seq(self, i):
+        j = self._span(i, _dna_chars)
+        if j == i:
+            return self._fail(i, "a nucleotide")
+        return self.s[i:j], j
+
+    def rule_rna_seq(self, i):
+        j = self._span(i, _rna_chars)
+        if j == i:
+            return self._fail(i, "a nucleotide")
+        return self.s[i:j], j
+
+    def rule_aat13_seq(self, i):
+        return self.rule_aat3_seq(i) or self.rule_aat1_seq(i)
+
+    def rule_aat1_seq(self, i):
+        return self._seq_rule(i, self.rule_term1, self.rule_aa1, self.rule_term1)
+
+    def rule_aat3_seq(self, i):
+        return self._seq_rule(i, self.rule_term3, self.rule_aa3, self.rule_term3)
+
+    def rule_aa13_seq(self, i):
+        return self.rule_aa3_seq(i) or self.rule_aa1_seq(i)
+
+    def rule_aa1_seq(self, i):
+        return self._seq_rule(i, self._never, self.rule_aa1, None)
+
+    def rule_aa3_seq(self, i):
+        return self._seq_rule(i, self._never, self.rule_aa3, None)
+
+    def _never(self, i):
+        return None
+
+    def rule_aa1(self, i):
+        return self._char_in(i, _aa1_chars, "an amino acid")
+
+    def rule_aa13(self, i):
+        return self.rule_aa3(i) or self.rule_aa1(i)
+
+    def rule_aa3(self, i):
+        aa = self.s[i : i + 3]
+        if aa in _aa3:
+            return aa, i + 3
+        return self._fail(i, "an amino acid")
+
+    def rule_aat1(self, i):
+        return self.rule_term1(i) or self.rule_aa1(i)
+
+    def rule_aat13(self, i):
+        return self.rule_aat3(i) or self.rule_aat1(i)
+
+    def rule_aat3(self, i):
+        return self.rule_term3(i) or self.rule_aa3(i)
+
+    def rule_dna(self, i):
+        return self._char_in(i, _dna_chars, "a nucleotide")
+
+    rule_dna_iupac = rule_dna
+
+    def rule_na_iupac(self, i):
+        return self._char_in(i, _na_chars, "a nucleotide")
+
+    def rule_rna(self, i):
+        return self._char_in(i, _rna_chars, "a nucleotide")
+
+    rule_rna_iupac = rule_rna
+
+    def rule_term1(self, i):
+        return self._char_in(i, _term1_chars, "a terminator")
+
+    def rule_term13(self, i):
+        return self.rule_term3(i) or self.rule_term1(i)
+
+    def rule_term3(self, i):
+        j = self._literal(i, "Ter")
+        if j is None:
+            return None
+        return "Ter", j
+
+    # position primitives
+
+    def rule_num(self, i):
+        j = self._span_digits(i)
+        if j == i:
+            return self._fail(i, "a digit")
+        return int(self.s[i:j]), j
+
+    def rule_nnum(self, i):
+        if self._literal(i, "-") is None:
+            return None
+        r = self.rule_num(i + 1)
+        if r is None:
+            return None
+        return int(self.s[i : r[1]]), r[1]
+
+    def rule_snum(self, i):
+        j = i + 1 if i < self.n and self.s[i] in _pm_chars else i
+        r = self.rule_num(j)
+        if r is None:
+            return None
+        return int(self.s[i : r[1]]), r[1]
+
+    rule_base = rule_snum
+
+    def rule_offset(self, i):
+        r = self.rule_snum(i)
+        return (0, i) if r is None else r
+
+    def rule_pm(self, i):
+        return self._char_in(i, _pm_chars, "one of '-', '+'")
+
+    # accessions and gene symbols
+
+    def _identifier(self, i, min_len):
+        """matches `letter (letterOrDigit | ('-'|'_') ~~letterOrDigit)*`"""
+        s = self.s
+        n = self.n
+        if i >= n or not s[i].isalpha():
+            return self._fail(i, "a letter")
+        j = i + 1
+        while j < n:
+            c = s[j]
+            if c.isalnum() or (c in "-_" and j + 1 < n and s[j + 1].isalnum()):
+                j += 1
+            else:
+                break
+        if j - i < min_len:
+            return self._fail(j, "a letter or digit")
+        return j
+
+    def rule_accn(self, i):
+        j = self._identifier(i, 1)
+        if j is None:
+            return None
+        s = self.s
+        if j + 1 < self.n and s[j] == "." and s[j + 1].isdigit():
+            j = self._span_digits(j + 1)
+        return s[i:j], j
+
+    def rule_gene_symbol(self, i):
+        j = self._identifier(i, 2)
+        if j is None:
+            return None
+        return self.s[i:j], j
+
+    def rule_paren_gene(self, i):
+        if self._literal(i, "(") is None:
+            return None
+        r = self.rule_gene_symbol(i + 1)
+        if r is None:
+            return None
+        symbol, j = r
+        if self._literal(j, ")") is None:
+            return None
+        return symbol, j + 1
+
+    def rule_opt_gene_expr(self, i):
+        r = self.rule_paren_gene(i)
+        return (None, i) if r is None else r
+
+
+def _rule_names():
+    return frozenset(m[len("rule_") :] for m in dir(RDParser) if m.startswith("rule_"))
+
+
+rule_names = _rule_names()
+
+
+def parse(rule_name, s):
+    """parse all of `s` according to grammar rule `rule_name`
+
+    :raises HGVSParseError: if `s` does not match the rule
+
+    """
+    p = RDParser(s)
+    r = getattr(p, "rule_" + rule_name)(0)
+    if r is not None:
+        value, i = r
+        if i == p.n:
+            return value
+        p._fail(i, "end of input")
+    expected = sorted(p.expected)
+    if len(expected) > 1:
+        expected = "one of " + ", ".join(expected[:-1]) + ", or " + expected[-1]
+    else:
+        expected = expected[0]
+    raise HGVSParseError(
+        "{s}: char {pos}: expected {expected}".format(s=s, pos=p.err_pos, expected=expected)
+    )
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""pluggable tracing of mapping, normalization, validation, and data
+provider calls
+
+VariantMapper, AssemblyMapper, Normalizer, the validators,
+SequenceVariant.fill_ref, and the data provider methods wrapped by `hgvs.dataproviders.interface.Interface`
+are instrumented with `traced`.  Tracing is disabled by default; in
+that case, an instrumented call costs one global lookup and one extra
+function call.  When a tracer is enabled, each instrumented call is
+recorded as a `Span` with a name (e.g., "AssemblyMapper.c_to_p" or
+"hdp.get_tx_info"), optional attributes, its duration, and its parent
+span.  A data provider call that misses the cache contains an
+"hdp.<method>.fetch" span for the underlying query.
+
+>>> tracer = Tracer()
+>>> with tracing(tracer):
+...     with span("outer", ac="NM_01234.5"):
+...         with span("inner"):
+...             pass
+>>> [(s.name, s.parent_id) for s in tracer.spans]
+[('inner', 1), ('outer', None)]
+>>> sorted(tracer.report())
+['inner', 'outer']
+
+Spans are recorded when they finish, so children precede their
+parents.  `Tracer.to_json` and `Tracer.to_csv` export the spans;
+`Tracer.report` aggregates them by name into counts and total,
+exclusive ("self"), mean, and maximum times, and
+`Tracer.format_report` renders that report as a table.
+
+Any object with a `span(name, **attributes)` method that returns a
+context manager may be enabled as a tracer, which allows spans to be
+forwarded to other tracing systems.
+
+"""
+
+import csv
+import functools
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# the active tracer, or None when tracing is disabled
+_tracer = None
+
+
+def get_tracer():
+    """return the active tracer, or None if tracing is disabled"""
+    return _tracer
+
+
+def enable(tracer=None):
+    """enable tracing with `tracer` (a new `Tracer` by default) and
+    return it"""
+    global _tracer
+    if tracer is None:
+        tracer = Tracer()
+    _tracer = tracer
+    return tracer
+
+
+def disable():
+    """disable tracing"""
+    global _tracer
+    _tracer = None
+
+
+@contextmanager
+def tracing(tracer=None):
+    """enable tracing with `tracer` (a new `Tracer` by default) for the
+    duration of a with block, and restore the previous tracer after"""
+    global _tracer
+    prev = _tracer
+    tracer = enable(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer = prev
+
+
+class _NullSpan:
+    """span that records nothing; returned by `span` when tracing is
+    disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+_null_span = _NullSpan()
+
+
+def span(name, **attributes):
+    """return a context manager that records a span named `name` with
+    `attributes` in the active tracer; a no-op when tracing is disabled"""
+    tracer = _tracer
+    if tracer is None:
+        return _null_span
+    return tracer.span(name, **attributes)
+
+
+def traced(name=None, record_args=False):
+    """decorator that records each call of the decorated function as a
+    span
+
+    :param str name: span name; defaults to the function's qualified
+        name (e.g., "VariantMapper.c_to_g")
+    :param bool record_args: if True, record positional arguments as
+        the "args" attribute and keyword arguments (if any) as a dict
+        in the "kwargs" attribute
+
+    May be used as `@traced` or `@traced(...)`.  Attributes of the
+    decorated function (e.g., `cache_info` of an lru_cache) are copied
+    to the wrapper.
+
+    """
+    if callable(name):
+        return traced()(name)
+
+    def decorator(fn):
+        span_name = name or fn.__qualname__
+
+        if record_args:
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                tracer = _tracer
+                if tracer is None:
+                    return fn(*args, **kwargs)
+                if kwargs:
+                    attributes = {"args": args, "kwargs": kwargs}
+                else:
+                    attributes = {"args": args}
+                with tracer.span(span_name, **attributes):
+                    return fn(*args, **kwargs)
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                tracer = _tracer
+                if tracer is None:
+                    return fn(*args, **kwargs)
+                with tracer.span(span_name):
+                    return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Span:
+    """a timed, named operation recorded by a `Tracer`
+
+    `start` is a `time.perf_counter()` value; `duration` and
+    `self_time` (duration minus the duration of child spans) are in
+    seconds.  `error` is the exception class name if the operation
+    raised.
+
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "thread_id",
+        "start",
+        "duration",
+        "child_time",
+        "error",
+    )
+
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span_id = None
+        self.parent_id = None
+        self.thread_id = None
+        self.start = None
+        self.duration = None
+        self.child_time = 0.0
+        self.error = None
+
+    def __repr__(self):
+        return "Span(name={s.name!r}, span_id={s.span_id}, parent_id={s.parent_id})".format(s=self)
+
+    @property
+    def self_time(self):
+        return self.duration - self.child_time
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self.tracer._push(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        self.tracer._pop(self)
+        return False
+
+    def as_dict(self):
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "thread_id": self.thread_id,
+            "name": self.name,
+            "start": self.start,
+            "duration": self.duration,
+            "self_time": self.self_time,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Tracer:
+    """records spans in memory, with per-thread nesting
+
+    All methods are thread-safe; spans opened in different threads
+    are never parents of one another.
+
+    """
+
+    csv_fields = (
+        "span_id",
+        "parent_id",
+        "thread_id",
+        "name",
+        "start",
+        "duration",
+        "self_time",
+        "error",
+        "attributes",
+    )
+
+    def __init__(self):
+        self.spans = []
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def span(self, name, **attributes):
+        """return a new `Span`; the span is recorded when its with
+        block exits"""
+        return Span(self, name, attributes)
+
+    def clear(self):
+        """discard recorded spans"""
+        with self._lock:
+            self.spans = []
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+    def _push(self, span):
+        stack = self._stack()
+        span.span_id = next(self._ids)
+        span.parent_id = stack[-1].span_id if stack else None
+        span.thread_id = threading.get_ident()
+        stack.append(span)
+
+    def _pop(self, span):
+        stack = self._stack()
+        stack.pop()
+        if stack:
+            stack[-1].child_time += span.duration
+        with self._lock:
+            self.spans.append(span)
+
+    def report(self):
+        """return dict of span name -> dict of count, errors, total,
+        self, mean, and max (times in seconds)"""
+        report = {}
+        for s in list(self.spans):
+            r = report.get(s.name)
+            if r is None:
+                r = report[s.name] = {
+                    "count": 0,
+                    "errors": 0,
+                    "total": 0.0,
+                    "self": 0.0,
+                    "mean": 0.0,
+                    "max": 0.0,
+                }
+            r["count"] += 1
+            r["errors"] += s.error is not None
+            r["total"] += s.duration
+            r["self"] += s.self_time
+            r["max"] = max(r["max"], s.duration)
+        for r in report.values():
+            r["mean"] = r["total"] / r["count"]
+        return report
+
+    def format_report(self):
+        """return `report()` as a text table, ordered by decreasing
+        self time, with times in milliseconds"""
+        report = self.report()
+        width = max([len("name")] + [len(n) for n in report])
+        line = "{:<{w}s} {:>8} {:>6} {:>12} {:>12} {:>10} {:>10}"
+        lines = [
+            line.format(
+                "name", "count", "errors", "total_ms", "self_ms", "mean_ms", "max_ms", w=width
+            )
+        ]
+        for n, r in sorted(report.items(), key=lambda i: -i[1]["self"]):
+            lines.append(
+                "{:<{w}s} {:>8d} {:>6d} {:>12.3f} {:>12.3f} {:>10.3f} {:>10.3f}".format(
+                    n,
+                    r["count"],
+                    r["errors"],
+                    1e3 * r["total"],
+                    1e3 * r["self"],
+                    1e3 * r["mean"],
+                    1e3 * r["max"],
+                    w=width,
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+    def to_json(self, fp):
+        """write recorded spans to file object `fp` as a JSON list;
+        attribute values that are not JSON types are written as strings"""
+        json.dump([s.as_dict() for s in list(self.spans)], fp, default=str)
+
+    def to_csv(self, fp):
+        """write recorded spans to file object `fp` as CSV, one row per
+        span, with attributes as a JSON object"""
+        writer = csv.DictWriter(fp, fieldnames=self.csv_fields)
+        writer.writeheader()
+        for s in list(self.spans):
+            row = s.as_dict()
+            row["attributes"] = json.dumps(row["attributes"], default=str)
+            writer.writerow(row)
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
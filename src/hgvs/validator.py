@@ -11,6 +11,7 @@ import hgvs.parser
 import hgvs.variantmapper
 from hgvs.enums import Datum, ValidationLevel
 from hgvs.exceptions import HGVSInvalidVariantError
+from hgvs.utils.tracing import traced
 
 SEQ_ERROR_MSG = (
     "Variant reference ({var_ref_seq}) does not agree with reference sequence ({ref_seq})"
@@ -33,6 +34,7 @@ class Validator:
         self._ivr = IntrinsicValidator(strict)
         self._evr = ExtrinsicValidator(hdp, strict)
 
+    @traced
     def validate(self, var, strict=None):
         if strict is None:
             strict = self.strict
@@ -48,6 +50,7 @@ class IntrinsicValidator:
     def __init__(self, strict=hgvs.global_config.validator.strict):
         self.strict = strict
 
+    @traced
     def validate(self, var, strict=None):
         assert isinstance(
             var, hgvs.sequencevariant.SequenceVariant
@@ -71,6 +74,7 @@ class ExtrinsicValidator:
         self.hdp = hdp
         self.vm = hgvs.variantmapper.VariantMapper(self.hdp, prevalidation_level=None)
 
+    @traced
     def validate(self, var, strict=None):
         assert isinstance(
             var, hgvs.sequencevariant.SequenceVariant
@@ -88,7 +92,7 @@ class ExtrinsicValidator:
         if var_n is not None:
             res, msg = self._n_within_transcript_bounds(var_n)
             if res != ValidationLevel.VALID:
-                if hgvs.global_config.mapping.strict_bounds:
+                if hgvs.global_config.snapshot().mapping.strict_bounds:
                     raise HGVSInvalidVariantError(msg)
                 _logger.warning(
                     "{}: Variant outside transcript bounds;" " no validation provided".format(var)
@@ -3,7 +3,6 @@
 
 """
 
-import copy
 import logging
 
 from bioutils.sequences import reverse_complement
@@ -17,11 +16,13 @@ import hgvs.posedit
 import hgvs.sequencevariant
 import hgvs.utils.altseq_to_hgvsp as altseq_to_hgvsp
 import hgvs.utils.altseqbuilder as altseqbuilder
+import hgvs.utils.frozen
 import hgvs.validator
 from hgvs.decorators.lru_cache import lru_cache
 from hgvs.enums import PrevalidationLevel
 from hgvs.exceptions import HGVSInvalidVariantError, HGVSUnsupportedOperationError
 from hgvs.utils.reftranscriptdata import RefTranscriptData
+from hgvs.utils.tracing import traced
 
 _logger = logging.getLogger(__name__)
 
@@ -96,12 +97,13 @@ class VariantMapper:
 
     # ############################################################################
     # g⟷t
+    @traced
     def g_to_t(self, var_g, tx_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         if not (var_g.type == "g"):
             raise HGVSInvalidVariantError("Expected a g. variant; got " + str(var_g))
         if self._validator:
             self._validator.validate(var_g)
-        var_g.fill_ref(self.hdp)
+        var_g = var_g.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=tx_ac, alt_ac=var_g.ac, alt_aln_method=alt_aln_method
         )
@@ -115,12 +117,13 @@ class VariantMapper:
             )
         return var_out
 
+    @traced
     def t_to_g(self, var_t, alt_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         if var_t.type not in "cn":
             raise HGVSInvalidVariantError("Expected a c. or n. variant; got " + str(var_t))
         if self._validator:
             self._validator.validate(var_t)
-        var_t.fill_ref(self.hdp)
+        var_t = var_t.fill_ref(self.hdp)
         if var_t.type == "c":
             var_out = VariantMapper.c_to_g(
                 self, var_c=var_t, alt_ac=alt_ac, alt_aln_method=alt_aln_method
@@ -133,6 +136,7 @@ class VariantMapper:
 
     # ############################################################################
     # g⟷n
+    @traced
     def g_to_n(self, var_g, tx_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         """Given a parsed g. variant, return a n. variant on the specified
         transcript using the specified alignment method (default is
@@ -156,13 +160,13 @@ class VariantMapper:
 
         if (
             mapper.strand == -1
-            and not hgvs.global_config.mapping.strict_bounds
+            and not hgvs.global_config.snapshot().mapping.strict_bounds
             and not mapper.g_interval_is_inbounds(var_g.posedit.pos)
         ):
             _logger.info("Renormalizing out-of-bounds minus strand variant on genomic sequence")
             var_g = self.left_normalizer.normalize(var_g)
 
-        var_g.fill_ref(self.hdp)
+        var_g = var_g.fill_ref(self.hdp)
         pos_n = mapper.g_to_n(var_g.posedit.pos)
         if not pos_n.uncertain:
             edit_n = self._convert_edit_check_strand(mapper.strand, var_g.posedit.edit)
@@ -195,6 +199,7 @@ class VariantMapper:
             self._update_gene_symbol(var_n, var_g.gene)
         return var_n
 
+    @traced
     def n_to_g(self, var_n, alt_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         """Given a parsed n. variant, return a g. variant on the specified
         transcript using the specified alignment method (default is
@@ -212,7 +217,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a n. variant; got " + str(var_n))
         if self._validator:
             self._validator.validate(var_n)
-        var_n.fill_ref(self.hdp)
+        var_n = var_n.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_n.ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
         )
@@ -240,6 +245,7 @@ class VariantMapper:
 
     # ############################################################################
     # g⟷c
+    @traced
     def g_to_c(self, var_g, tx_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         """Given a parsed g. variant, return a c. variant on the specified
         transcript using the specified alignment method (default is
@@ -257,7 +263,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a g. variant; got " + str(var_g))
         if self._validator:
             self._validator.validate(var_g)
-        var_g.fill_ref(self.hdp)
+        var_g = var_g.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=tx_ac, alt_ac=var_g.ac, alt_aln_method=alt_aln_method
         )
@@ -289,6 +295,7 @@ class VariantMapper:
             self._update_gene_symbol(var_c, var_g.gene)
         return var_c
 
+    @traced
     def c_to_g(self, var_c, alt_ac, alt_aln_method=hgvs.global_config.mapping.alt_aln_method):
         """Given a parsed c. variant, return a g. variant on the specified
         transcript using the specified alignment method (default is
@@ -306,7 +313,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a cDNA (c.); got " + str(var_c))
         if self._validator:
             self._validator.validate(var_c)
-        var_c.fill_ref(self.hdp)
+        var_c = var_c.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_c.ac, alt_ac=alt_ac, alt_aln_method=alt_aln_method
         )
@@ -319,9 +326,13 @@ class VariantMapper:
                 edit_g.ref = ""
         else:
             # variant at alignment gap
-            var_n = copy.deepcopy(var_c)
-            var_n.posedit.pos = mapper.c_to_n(var_c.posedit.pos)
-            var_n.type = "n"
+            var_n = hgvs.utils.frozen.evolve(
+                var_c,
+                type="n",
+                posedit=hgvs.utils.frozen.evolve(
+                    var_c.posedit, pos=mapper.c_to_n(var_c.posedit.pos)
+                ),
+            )
             pos_n = mapper.g_to_n(pos_g)
             edit_g = hgvs.edit.NARefAlt(
                 ref="", alt=self._get_altered_sequence(mapper.strand, pos_n, var_n)
@@ -336,6 +347,7 @@ class VariantMapper:
 
     # ############################################################################
     # c⟷n
+    @traced
     def c_to_n(self, var_c):
         """Given a parsed c. variant, return a n. variant on the specified
         transcript using the specified alignment method (default is
@@ -351,7 +363,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected a cDNA (c.); got " + str(var_c))
         if self._validator:
             self._validator.validate(var_c)
-        var_c.fill_ref(self.hdp)
+        var_c = var_c.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_c.ac, alt_ac=var_c.ac, alt_aln_method="transcript"
         )
@@ -361,7 +373,7 @@ class VariantMapper:
             or isinstance(var_c.posedit.edit, hgvs.edit.Dup)
             or isinstance(var_c.posedit.edit, hgvs.edit.Inv)
         ):
-            edit_n = copy.deepcopy(var_c.posedit.edit)
+            edit_n = var_c.posedit.edit.clone()
         else:
             raise HGVSUnsupportedOperationError(
                 "Only NARefAlt/Dup/Inv types are currently implemented"
@@ -375,6 +387,7 @@ class VariantMapper:
             self._update_gene_symbol(var_n, var_c.gene)
         return var_n
 
+    @traced
     def n_to_c(self, var_n):
         """Given a parsed n. variant, return a c. variant on the specified
         transcript using the specified alignment method (default is
@@ -390,7 +403,7 @@ class VariantMapper:
             raise HGVSInvalidVariantError("Expected n. variant; got " + str(var_n))
         if self._validator:
             self._validator.validate(var_n)
-        var_n.fill_ref(self.hdp)
+        var_n = var_n.fill_ref(self.hdp)
         mapper = self._fetch_AlignmentMapper(
             tx_ac=var_n.ac, alt_ac=var_n.ac, alt_aln_method="transcript"
         )
@@ -400,7 +413,7 @@ class VariantMapper:
             or isinstance(var_n.posedit.edit, hgvs.edit.Dup)
             or isinstance(var_n.posedit.edit, hgvs.edit.Inv)
         ):
-            edit_c = copy.deepcopy(var_n.posedit.edit)
+            edit_c = var_n.posedit.edit.clone()
         else:
             raise HGVSUnsupportedOperationError(
                 "Only NARefAlt/Dup/Inv types are currently implemented"
@@ -416,6 +429,7 @@ class VariantMapper:
 
     # ############################################################################
     # c ⟶ p
+    @traced
     def c_to_p(self, var_c, pro_ac=None):
         """
         Converts a c. SequenceVariant to a p. SequenceVariant on the specified protein accession
@@ -455,6 +469,7 @@ class VariantMapper:
     ############################################################################
     # Internal methods
 
+    @traced
     def _replace_reference(self, var):
         """fetch reference sequence for variant and update (in-place) if necessary"""
 
@@ -506,7 +521,10 @@ class VariantMapper:
 
         return var
 
-    @lru_cache(maxsize=hgvs.global_config.lru_cache.maxsize)
+    @traced
+    @lru_cache(
+        maxsize=hgvs.global_config.lru_cache.maxsize, name="VariantMapper._fetch_AlignmentMapper"
+    )
     def _fetch_AlignmentMapper(self, tx_ac, alt_ac, alt_aln_method):
         """
         Get a new AlignmentMapper for the given transcript accession (ac),
@@ -523,7 +541,7 @@ class VariantMapper:
         """
         if isinstance(edit_in, hgvs.edit.NARefAlt):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = edit_in.clone()
             else:
                 try:
                     # if smells like an int, do nothing
@@ -538,12 +556,12 @@ class VariantMapper:
                 )
         elif isinstance(edit_in, hgvs.edit.Dup):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = edit_in.clone()
             else:
                 edit_out = hgvs.edit.Dup(ref=reverse_complement(edit_in.ref))
         elif isinstance(edit_in, hgvs.edit.Inv):
             if strand == 1:
-                edit_out = copy.deepcopy(edit_in)
+                edit_out = edit_in.clone()
             else:
                 try:
                     int(edit_in.ref)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import collections
+
+from hgvs.dataproviders.interface import Interface
+from hgvs.exceptions import HGVSDataNotAvailableError
+
+# Minimal in-memory data provider for testing the Interface wrappers
+# (caching, tracing, accounting) without a database.  Underlying
+# (uncached) calls are counted in `fetches`.
+
+
+class MockDataProvider(Interface):
+    required_version = "1.1"
+
+    def __init__(self, seqs=None, mode=None, cache=None):
+        self.seqs = seqs if seqs is not None else {"NM_01234.5": "ACGT" * 10}
+        self.fetches = collections.Counter()
+        super(MockDataProvider, self).__init__(mode=mode, cache=cache)
+
+    def _fetch(self, name, tx_ac=None):
+        self.fetches[name] += 1
+        if tx_ac is not None and tx_ac not in self.seqs:
+            raise HGVSDataNotAvailableError("No data for {tx_ac}".format(tx_ac=tx_ac))
+
+    def data_version(self):
+        return "mock"
+
+    def schema_version(self):
+        return "1.1"
+
+    def get_acs_for_protein_seq(self, seq):
+        self._fetch("get_acs_for_protein_seq")
+        return []
+
+    def get_assembly_map(self, assembly_name):
+        return {}
+
+    def get_gene_info(self, gene):
+        self._fetch("get_gene_info")
+        return None
+
+    def get_pro_ac_for_tx_ac(self, tx_ac):
+        self._fetch("get_pro_ac_for_tx_ac")
+        return None
+
+    def get_seq(self, ac, start_i=None, end_i=None):
+        self._fetch("get_seq", ac)
+        return self.seqs[ac][start_i:end_i]
+
+    def get_similar_transcripts(self, tx_ac):
+        self._fetch("get_similar_transcripts")
+        return []
+
+    def get_tx_exons(self, tx_ac, alt_ac, alt_aln_method):
+        self._fetch("get_tx_exons", tx_ac)
+        return [{"tx_ac": tx_ac, "alt_ac": alt_ac, "ord": 0}]
+
+    def get_tx_for_gene(self, gene):
+        self._fetch("get_tx_for_gene")
+        return []
+
+    def get_tx_for_region(self, alt_ac, alt_aln_method, start_i, end_i):
+        self._fetch("get_tx_for_region")
+        return []
+
+    def get_tx_identity_info(self, tx_ac):
+        self._fetch("get_tx_identity_info", tx_ac)
+        return {"tx_ac": tx_ac}
+
+    def get_tx_info(self, tx_ac, alt_ac, alt_aln_method):
+        self._fetch("get_tx_info", tx_ac)
+        return {"tx_ac": tx_ac, "alt_ac": alt_ac, "alt_aln_method": alt_aln_method}
+
+    def get_tx_mapping_options(self, tx_ac):
+        self._fetch("get_tx_mapping_options", tx_ac)
+        return []
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+import hgvs.config
+
+
+@pytest.fixture
+def config():
+    config = hgvs.config.Config()
+    config.read_stream(io.BytesIO(b"[mapping]\nstrict_bounds = True\nassembly = GRCh38\n"))
+    return config
+
+
+@pytest.mark.quick
+def test_snapshot(config):
+    snapshot = config.snapshot()
+    assert snapshot.mapping.strict_bounds is True
+    assert snapshot.mapping.assembly == "GRCh38"
+    assert snapshot["mapping"]["assembly"] == "GRCh38"
+    assert snapshot is config.snapshot()
+
+    with pytest.raises(AttributeError):
+        snapshot.mapping.strict_bounds = False
+    with pytest.raises(AttributeError):
+        snapshot.mapping = None
+
+
+@pytest.mark.quick
+def test_snapshot_invalidation(config):
+    snapshot = config.snapshot()
+
+    config.mapping.strict_bounds = False
+    assert config.snapshot() is not snapshot
+    assert config.snapshot().mapping.strict_bounds is False
+    assert snapshot.mapping.strict_bounds is True
+
+    config.read_stream(io.BytesIO(b"[normalizer]\nwindow_size = 7\n"))
+    assert config.snapshot().normalizer.window_size == 7
+
+    # direct changes to the ConfigParser require explicit invalidation
+    snapshot = config.snapshot()
+    config._cp["mapping"]["assembly"] = "GRCh37"
+    assert config.snapshot() is snapshot
+    config.invalidate()
+    assert config.snapshot().mapping.assembly == "GRCh37"
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pytest
+from support.mock_data_provider import MockDataProvider
+
+import hgvs
+from hgvs.decorators.lru_cache import LEARN, RUN, VERIFY, lru_cache
+from hgvs.exceptions import HGVSDataNotAvailableError, HGVSVerifyFailedError
+from hgvs.utils.cachestore import open_cache
+
+
+@pytest.mark.quick
+class Test_LRUCacheMaxBytes(unittest.TestCase):
+    def test_evict_by_bytes(self):
+        calls = []
+
+        @lru_cache(maxsize=None, max_bytes=100, sizeof=len)
+        def seq(n):
+            calls.append(n)
+            return "A" * n
+
+        seq(40)
+        seq(40)
+        seq(50)
+        self.assertEqual([40, 50], calls)
+        self.assertEqual(2, seq.cache_info().currsize)
+
+        seq(40)  # 40 becomes most recent, so 50 is evicted next
+        seq(30)
+        stats = seq.cache_stats()
+        self.assertEqual((1, 2, 100), (stats["evictions"], stats["currsize"], stats["max_bytes"]))
+        seq(40)
+        self.assertEqual([40, 50, 30], calls)
+        seq(50)
+        self.assertEqual([40, 50, 30, 50], calls)
+
+        # results larger than max_bytes are not cached
+        seq(200)
+        seq(200)
+        self.assertEqual([40, 50, 30, 50, 200, 200], calls)
+        self.assertEqual(2, seq.cache_info().currsize)
+
+        seq.cache_clear()
+        self.assertEqual(0, seq.cache_info().currsize)
+        seq(100)
+        seq(100)
+        self.assertEqual(1, seq.cache_info().hits)
+
+    def test_maxsize_and_max_bytes(self):
+        @lru_cache(maxsize=2, max_bytes=1000, sizeof=len)
+        def seq(n):
+            return "A" * n
+
+        for n in (1, 2, 3, 4):
+            seq(n)
+        info = seq.cache_info()
+        self.assertEqual((0, 4, 2, 2), tuple(info))
+        self.assertEqual(2, seq.cache_stats()["evictions"])
+
+    def test_default_sizeof(self):
+        @lru_cache(maxsize=None, max_bytes=1000)
+        def seq(n):
+            return "A" * n
+
+        seq(900)
+        seq(100)
+        self.assertEqual(1, seq.cache_info().currsize)  # sys.getsizeof includes overhead
+
+    def test_threads(self):
+        @lru_cache(maxsize=None, max_bytes=500, sizeof=len)
+        def seq(n):
+            return "A" * n
+
+        def work():
+            for i in range(200):
+                seq(i % 37)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = seq.cache_stats()
+        self.assertEqual(800, stats["hits"] + stats["misses"])
+        self.assertGreater(stats["evictions"], 0)
+
+    def test_interface_limits(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("PYTEST_CURRENT_TEST", None)
+            hdp = MockDataProvider(seqs={"NM_01234.5": "ACGT" * 1000})
+        self.assertEqual(
+            (hgvs.global_config.lru_cache.seq_maxsize, hgvs.global_config.lru_cache.seq_max_bytes),
+            (hdp.get_seq.cache_stats()["maxsize"], hdp.get_seq.cache_stats()["max_bytes"]),
+        )
+        self.assertEqual(
+            (hgvs.global_config.lru_cache.maxsize, None),
+            (
+                hdp.get_tx_info.cache_stats()["maxsize"],
+                hdp.get_tx_info.cache_stats()["max_bytes"],
+            ),
+        )
+        for i in range(200):
+            hdp.get_seq("NM_01234.5", i, i + 10)
+        self.assertEqual(200, hdp.get_seq.cache_info().currsize)
+
+
+@pytest.mark.quick
+class Test_LRUCacheNegative(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def _fn(self, ac):
+        self.calls.append(ac)
+        if ac.startswith("NM_9"):
+            raise HGVSDataNotAvailableError("No data for " + ac)
+        if ac == "bad":
+            raise ValueError(ac)
+        return ac.lower()
+
+    def test_negative(self):
+        fn = lru_cache(maxsize=10, negative=(HGVSDataNotAvailableError,), negative_maxsize=2)(
+            self._fn
+        )
+        for _ in range(3):
+            with self.assertRaisesRegex(HGVSDataNotAvailableError, "No data for NM_9"):
+                fn("NM_9")
+            self.assertEqual("nm_1", fn("NM_1"))
+            with self.assertRaises(ValueError):
+                fn("bad")  # not cached
+        self.assertEqual(["NM_9", "NM_1", "bad", "bad", "bad"], self.calls)
+        stats = fn.cache_stats()
+        self.assertEqual(
+            (2, 1, 2, 2, 1),  # misses: NM_9 and NM_1
+            tuple(
+                stats[k]
+                for k in ("negative_hits", "negative_currsize", "hits", "misses", "currsize")
+            ),
+        )
+
+        # negative_maxsize is separate from maxsize
+        for ac in ("NM_91", "NM_92"):
+            with self.assertRaises(HGVSDataNotAvailableError):
+                fn(ac)
+        with self.assertRaises(HGVSDataNotAvailableError):
+            fn("NM_9")
+        self.assertEqual(["bad", "NM_91", "NM_92", "NM_9"], self.calls[-4:])  # NM_9 was evicted
+        self.assertEqual(2, fn.cache_stats()["negative_currsize"])
+        self.assertEqual(1, fn.cache_info().currsize)
+
+        fn.cache_clear()
+        self.assertEqual(
+            (0, 0), (fn.cache_stats()["negative_hits"], fn.cache_stats()["negative_currsize"])
+        )
+
+    def test_ttl(self):
+        fn = lru_cache(negative=(HGVSDataNotAvailableError,), negative_ttl=0)(self._fn)
+        for _ in range(2):
+            with self.assertRaises(HGVSDataNotAvailableError):
+                fn("NM_9")
+        self.assertEqual(["NM_9", "NM_9"], self.calls)
+
+        fn = lru_cache(negative=(HGVSDataNotAvailableError,), negative_ttl=3600)(self._fn)
+        for _ in range(2):
+            with self.assertRaises(HGVSDataNotAvailableError):
+                fn("NM_9")
+        self.assertEqual(3, len(self.calls))
+
+    def test_learn_in_memory(self):
+        negative = (HGVSDataNotAvailableError,)
+        with tempfile.TemporaryDirectory() as d:
+            cache = open_cache(os.path.join(d, "cache.sqlite"), flag="c")
+            learn = lru_cache(mode=LEARN, cache=cache, negative=negative)(self._fn)
+            for _ in range(2):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    learn("NM_9")
+            self.assertEqual(["NM_9"], self.calls)
+            self.assertEqual(0, len(cache))  # not written without negative_persistent
+            stats = learn.cache_stats()
+            self.assertEqual((1, 1), (stats["misses"], stats["negative_hits"]))
+
+            # errors in the cache file, written with negative_persistent,
+            # are counted once, as negative hits
+            persist = lru_cache(
+                mode=LEARN, cache=cache, negative_persistent=True, negative=negative
+            )
+            with self.assertRaises(HGVSDataNotAvailableError):
+                persist(self._fn)("NM_99")
+            learn = lru_cache(mode=LEARN, cache=cache, negative=negative)(self._fn)
+            for _ in range(2):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    learn("NM_99")
+            self.assertEqual(["NM_9", "NM_99"], self.calls)
+            self.assertEqual((0, 0, None, 1), tuple(learn.cache_info()))
+            stats = learn.cache_stats()
+            self.assertEqual((0, 2), (stats["misses"], stats["negative_hits"]))
+            cache.close()
+
+    def test_persistent(self):
+        negative = dict(negative=(HGVSDataNotAvailableError,), negative_persistent=True)
+        with tempfile.TemporaryDirectory() as d:
+            fn = os.path.join(d, "cache.sqlite")
+            cache = open_cache(fn, flag="c")
+            learn = lru_cache(mode=LEARN, cache=cache, **negative)(self._fn)
+            for _ in range(2):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    learn("NM_9")
+            self.assertEqual(["NM_9"], self.calls)
+            self.assertIsNone(learn.cache_stats()["negative_currsize"])
+            self.assertEqual((1, 1), (learn.cache_stats()["misses"], len(cache)))
+
+            # expired entries are fetched again in learn mode
+            learn = lru_cache(mode=LEARN, cache=cache, negative_ttl=0, **negative)(self._fn)
+            with self.assertRaises(HGVSDataNotAvailableError):
+                learn("NM_9")
+            self.assertEqual(["NM_9", "NM_9"], self.calls)
+            cache.close()
+
+            cache = open_cache(fn, flag="r")
+            run = lru_cache(mode=RUN, cache=cache, negative_ttl=0, **negative)(self._fn)
+            with self.assertRaisesRegex(HGVSDataNotAvailableError, "No data for NM_9"):
+                run("NM_9")
+            self.assertEqual(2, len(self.calls))
+            self.assertEqual(1, run.cache_stats()["negative_hits"])
+
+            verify = lru_cache(mode=VERIFY, cache=cache, **negative)(self._fn)
+            with self.assertRaisesRegex(HGVSDataNotAvailableError, "No data for NM_9"):
+                verify("NM_9")
+            self.assertEqual(3, len(self.calls))
+
+            # the function must raise the same exception type with the same args
+            def _fn(ac):
+                return ac
+
+            def _fn_other_args(ac):
+                raise HGVSDataNotAvailableError("No data at all")
+
+            def _fn_other_type(ac):
+                raise ValueError("No data for " + ac)
+
+            for f in (_fn, _fn_other_args, _fn_other_type):
+                f.__name__ = "_fn"  # same cache key
+                verify = lru_cache(mode=VERIFY, cache=cache, **negative)(f)
+                with self.assertRaises(HGVSVerifyFailedError):
+                    verify("NM_9")
+            cache.close()
+
+    def test_interface(self):
+        negative_maxsize = hgvs.global_config.lru_cache.negative_maxsize
+        hgvs.global_config.lru_cache.negative_maxsize = 10000
+        try:
+            hdp = MockDataProvider()
+        finally:
+            hgvs.global_config.lru_cache.negative_maxsize = negative_maxsize
+        for _ in range(3):
+            for method, args in (
+                (hdp.get_tx_exons, ("NM_99.9", "NC_1", "splign")),
+                (hdp.get_tx_info, ("NM_99.9", "NC_1", "splign")),
+                (hdp.get_tx_identity_info, ("NM_99.9",)),
+                (hdp.get_tx_mapping_options, ("NM_99.9",)),
+            ):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    method(*args)
+        self.assertEqual(1, hdp.fetches["get_tx_exons"])
+        self.assertEqual(1, hdp.fetches["get_tx_info"])
+        self.assertEqual(1, hdp.fetches["get_tx_identity_info"])
+        self.assertEqual(3, hdp.fetches["get_tx_mapping_options"])
+
+        # off by default
+        with mock.patch.dict(os.environ):
+            os.environ.pop("PYTEST_CURRENT_TEST", None)
+            hdp = MockDataProvider()
+        for _ in range(2):
+            with self.assertRaises(HGVSDataNotAvailableError):
+                hdp.get_tx_info("NM_99.9", "NC_1", "splign")
+        self.assertEqual(2, hdp.fetches["get_tx_info"])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
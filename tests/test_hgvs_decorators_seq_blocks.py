@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import unittest
+
+import pytest
+from support.mock_data_provider import MockDataProvider
+
+import hgvs
+from hgvs.decorators.lru_cache import lru_cache
+from hgvs.decorators.seq_blocks import seq_blocks
+
+SEQ = "".join("ACGT"[(i * 7) % 4] for i in range(1000))
+
+
+@pytest.mark.quick
+class Test_SeqBlocks(unittest.TestCase):
+    def setUp(self):
+        self.fetches = []
+
+        @seq_blocks(block_size=64)
+        @lru_cache(maxsize=None)
+        def get_seq(ac, start_i=None, end_i=None):
+            self.fetches.append((start_i, end_i))
+            return SEQ[start_i:end_i]
+
+        self.get_seq = get_seq
+
+    def test_subranges(self):
+        for start_i, end_i in ((0, 1), (10, 20), (60, 70), (63, 64), (64, 65), (None, 5)):
+            self.assertEqual(SEQ[start_i:end_i], self.get_seq("NC_1", start_i, end_i))
+        self.assertEqual([(0, 64), (64, 128)], self.fetches)
+
+        # overlapping windows are served from cached blocks
+        self.get_seq("NC_1", 100, 120)
+        self.get_seq("NC_1", 0, 64)
+        self.assertEqual(2, len(self.fetches))
+
+    def test_end_of_sequence(self):
+        self.assertEqual(SEQ[990:1010], self.get_seq("NC_1", 990, 1010))
+        self.assertEqual([(960, 1024)], self.fetches)
+        self.assertEqual("", self.get_seq("NC_1", 1000, 1001))
+        self.assertEqual("", self.get_seq("NC_1", 2000, 2010))
+        self.assertEqual([(960, 1024), (1984, 2048)], self.fetches)
+
+    def test_passthrough(self):
+        self.assertEqual("", self.get_seq("NC_1", 10, 10))
+        self.assertEqual(SEQ[-5:], self.get_seq("NC_1", -5))
+        self.assertEqual(SEQ[900:], self.get_seq("NC_1", 900))
+        self.assertEqual(SEQ, self.get_seq("NC_1"))
+        self.assertEqual(SEQ[5:200], self.get_seq("NC_1", 5, 200))
+        self.assertEqual([(10, 10), (-5, None), (900, None), (None, None), (5, 200)], self.fetches)
+
+    def test_interface(self):
+        hdp = MockDataProvider()
+        self.assertFalse(hasattr(hdp.get_seq.__wrapped__, "block_size"))  # off by default
+
+        seqs = {"NC_1": SEQ}
+        block_size = hgvs.global_config.lru_cache.seq_block_size
+        hgvs.global_config.lru_cache.seq_block_size = 64
+        try:
+            hdp = MockDataProvider(seqs=seqs)
+            with tempfile.TemporaryDirectory() as d:
+                # persistent caches keep exact ranges
+                learn_hdp = MockDataProvider(
+                    seqs=seqs, mode="learn", cache=os.path.join(d, "cache.sqlite")
+                )
+                self.assertFalse(hasattr(learn_hdp.get_seq.__wrapped__, "block_size"))
+                learn_hdp.cache.close()
+        finally:
+            hgvs.global_config.lru_cache.seq_block_size = block_size
+        self.assertIsNone(hdp.mode)
+        self.assertEqual(64, hdp.get_seq.__wrapped__.block_size)
+
+        self.assertEqual(SEQ[4:8], hdp.get_seq("NC_1", 4, 8))
+        self.assertEqual(SEQ[2:30], hdp.get_seq("NC_1", 2, 30))
+        self.assertEqual(1, hdp.fetches["get_seq"])
+
+        # whole sequences and long ranges are fetched as requested
+        self.assertEqual(SEQ, hdp.get_seq("NC_1"))
+        self.assertEqual(SEQ[0:500], hdp.get_seq("NC_1", 0, 500))
+        self.assertEqual(3, hdp.fetches["get_seq"])
+
+        # position probes, as in Normalizer.is_valid_pos: the last base
+        # exists, one past it does not
+        self.assertEqual(SEQ[-1], hdp.get_seq("NC_1", 999, 1000))
+        self.assertEqual("", hdp.get_seq("NC_1", 1000, 1001))
+        self.assertEqual(4, hdp.fetches["get_seq"])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
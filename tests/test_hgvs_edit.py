@@ -112,6 +112,38 @@ class Test_Edit(unittest.TestCase):
         # edit types
         self.assertEqual(str(hgvs.edit.Conv("NM_001166478.1", "c", pos).type), "con")
 
+    def test_clone(self):
+        pos = hgvs.location.Interval(
+            hgvs.location.BaseOffsetPosition(base=61, offset=-6, datum=Datum.CDS_START),
+            hgvs.location.BaseOffsetPosition(base=22, datum=Datum.CDS_END),
+        )
+        edits = [
+            hgvs.edit.NARefAlt("A", "T", uncertain=True),
+            hgvs.edit.AARefAlt("Ala", "Trp", init_met=True),
+            hgvs.edit.AASub("A", "W"),
+            hgvs.edit.AAFs("A", "W", length=10),
+            hgvs.edit.AAExt("*", "Q", aaterm="*", length=17),
+            hgvs.edit.Dup("AC"),
+            hgvs.edit.Repeat("CAG", min=3, max=5),
+            hgvs.edit.NACopy(4),
+            hgvs.edit.Inv("AC"),
+            hgvs.edit.Conv("NM_001166478.1", "c", pos),
+        ]
+        for edit in edits:
+            clone = edit.clone()
+            self.assertIs(type(edit), type(clone))
+            self.assertIsNot(edit, clone)
+            self.assertEqual(edit, clone)
+            self.assertEqual(str(edit), str(clone))
+            clone.uncertain = not clone.uncertain
+            self.assertNotEqual(edit, clone)
+
+        conv = edits[-1].clone()
+        self.assertIsNot(pos, conv.from_pos)
+        self.assertIsNot(pos.start, conv.from_pos.start)
+        conv.from_pos.start.base = 1
+        self.assertEqual(61, pos.start.base)
+
 
 if __name__ == "__main__":
     unittest.main()
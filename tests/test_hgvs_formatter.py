@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import gzip
+import io
+import itertools
+import os
+import unittest
+
+import pytest
+
+import hgvs
+import hgvs.edit
+import hgvs.location
+import hgvs.parser
+import hgvs.posedit
+import hgvs.sequencevariant
+from hgvs.enums import Datum
+from hgvs.formatter import Formatter
+from hgvs.utils.frozen import freeze
+
+confs = [
+    None,
+    {"max_ref_length": None},
+    {"max_ref_length": 3},
+    {"p_3_letter": False},
+    {"p_term_asterisk": True},
+    {"p_3_letter": False, "p_term_asterisk": True},
+    {"p_init_met": False},
+    {"p_3_letter": None, "max_ref_length": 1},
+]
+
+
+@pytest.mark.quick
+@pytest.mark.models
+class Test_Formatter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        hp = hgvs.parser.Parser()
+        data_dir = os.path.join(os.path.dirname(__file__), "data")
+        with open(os.path.join(data_dir, "gauntlet")) as fh:
+            lines = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        with gzip.open(os.path.join(data_dir, "clinvar.gz"), "rt") as fh:
+            next(fh)
+            for line in itertools.islice(fh, 500):
+                lines += line.rstrip("\n").split("\t")[-1].split()
+        with gzip.open(os.path.join(data_dir, "random-vars.gz"), "rt") as fh:
+            lines += [line.strip() for line in itertools.islice(fh, 1000)]
+        cls.variants = []
+        for line in lines:
+            try:
+                cls.variants.append(hp.parse(line))
+            except hgvs.exceptions.HGVSParseError:
+                pass
+        cls.hp = hp
+
+    def test_format(self):
+        for conf in confs:
+            formatter = Formatter(conf)
+            for var in self.variants:
+                self.assertEqual(var.format(conf), formatter.format(var))
+
+    def test_objects(self):
+        bop = hgvs.location.BaseOffsetPosition
+        posedits = [
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.BaseOffsetInterval(
+                    bop(5, None, Datum.CDS_START), bop(0, 3, Datum.CDS_END)
+                ),
+                edit=hgvs.edit.NARefAlt(ref="ACGT", alt="", uncertain=True),
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(
+                    hgvs.location.SimplePosition(None), hgvs.location.SimplePosition(7)
+                ),
+                edit=hgvs.edit.NARefAlt(ref="5"),
+                uncertain=True,
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(
+                    hgvs.location.SimplePosition(5), hgvs.location.SimplePosition(7)
+                ),
+                edit=hgvs.edit.Dup(ref="AC"),
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(
+                    hgvs.location.SimplePosition(5), hgvs.location.SimplePosition(7)
+                ),
+                edit=hgvs.edit.Repeat(ref="CAG", min=3, max=5),
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(hgvs.location.AAPosition(base=22, aa="*")),
+                edit=hgvs.edit.AAExt(ref="*", alt="Q", aaterm="*", length=17),
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(hgvs.location.AAPosition(base=22, aa="A")),
+                edit=hgvs.edit.AAFs(ref="A", alt="W", length="?", uncertain=True),
+            ),
+            hgvs.posedit.PosEdit(
+                pos=hgvs.location.Interval(hgvs.location.AAPosition(base=22, aa="A")),
+                edit=hgvs.edit.AASub(ref="A", alt="?"),
+            ),
+            hgvs.posedit.PosEdit(edit=hgvs.edit.AARefAlt(ref="M", alt="?", init_met=True)),
+            hgvs.posedit.PosEdit(edit="0", uncertain=True),
+            hgvs.posedit.PosEdit(edit="="),
+        ]
+        for conf in confs:
+            formatter = Formatter(conf)
+            for posedit in posedits:
+                self.assertEqual(posedit.format(conf), formatter.format_posedit(posedit))
+                var = hgvs.sequencevariant.SequenceVariant(
+                    ac="NM_01234.5", type="c", posedit=posedit, gene="GENE"
+                )
+                self.assertEqual(var.format(conf), formatter.format(var))
+
+        var = hgvs.sequencevariant.SequenceVariant(ac=None, type="g", posedit=None)
+        self.assertEqual("g.?", Formatter().format(var))
+
+    def test_frozen_and_lazy(self):
+        formatter = Formatter({"p_3_letter": False})
+        for s in ("NM_01234.5:c.22+1A>T", "NP_01234.1:p.(Ala22Trp)", "NC_000001.10:g.100_200dup"):
+            var = self.hp.parse(s)
+            expected = var.format({"p_3_letter": False})
+            self.assertEqual(expected, formatter.format(freeze(var)))
+            self.assertEqual(expected, formatter.format(self.hp.parse_lazy(s)))
+
+    def test_global_config(self):
+        var = self.hp.parse("NP_01234.1:p.Ala22Ter")
+        hgvs.global_config.formatting.p_term_asterisk = True
+        try:
+            formatter = Formatter()
+        finally:
+            hgvs.global_config.formatting.p_term_asterisk = False
+        self.assertEqual("NP_01234.1:p.Ala22*", formatter.format(var))
+        self.assertEqual("NP_01234.1:p.Ala22Ter", Formatter().format(var))
+
+    def test_format_many(self):
+        variants = self.variants
+        expected = "".join(str(var) + "\n" for var in variants)
+        formatter = Formatter()
+        self.assertEqual(expected, formatter.format_many(variants))
+        out = io.StringIO()
+        self.assertEqual(len(variants), formatter.format_many(variants, out, chunk_size=7))
+        self.assertEqual(expected, out.getvalue())
+        out = io.StringIO()
+        self.assertEqual(0, formatter.format_many([], out))
+        self.assertEqual("", out.getvalue())
+        expected = str(variants[0]) + " " + str(variants[1]) + " "
+        self.assertEqual(expected, formatter.format_many(variants[:2], end=" "))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
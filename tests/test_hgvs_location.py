@@ -6,7 +6,11 @@ import pytest
 import hgvs.location
 import hgvs.parser
 from hgvs.enums import Datum
-from hgvs.exceptions import HGVSError, HGVSUnsupportedOperationError
+from hgvs.exceptions import (
+    HGVSError,
+    HGVSInvalidIntervalError,
+    HGVSUnsupportedOperationError,
+)
 
 
 @pytest.mark.quick
@@ -197,6 +201,55 @@ class Test_Interval(unittest.TestCase):
         )
         self.assertEqual(ival._length(), 39)
 
+    def test_clone(self):
+        ival = hgvs.location.BaseOffsetInterval(
+            hgvs.location.BaseOffsetPosition(base=12, offset=+34, datum=Datum.CDS_END),
+            hgvs.location.BaseOffsetPosition(base=56, offset=-78, datum=Datum.CDS_END),
+            uncertain=True,
+        )
+        clone = ival.clone()
+        self.assertIs(type(clone), hgvs.location.BaseOffsetInterval)
+        self.assertIsNot(ival.start, clone.start)
+        self.assertIsNot(ival.end, clone.end)
+        self.assertEqual(repr(ival), repr(clone))
+        clone.start.base = 1
+        self.assertEqual(12, ival.start.base)
+
+        for pos in [
+            hgvs.location.SimplePosition(5, uncertain=True),
+            hgvs.location.AAPosition(22, "W"),
+        ]:
+            self.assertEqual(repr(pos), repr(pos.clone()))
+            self.assertIsNot(pos, pos.clone())
+
+        ival = hgvs.location.Interval(hgvs.location.SimplePosition(5))
+        self.assertIsNone(ival.clone().end)
+
+    def test_unchecked(self):
+        start = hgvs.location.BaseOffsetPosition(base=12, offset=+34, datum=Datum.CDS_START)
+        end = hgvs.location.BaseOffsetPosition(base=56, offset=-78, datum=Datum.CDS_END)
+        ival = hgvs.location.BaseOffsetInterval.unchecked(start, end, uncertain=True)
+        self.assertIs(type(ival), hgvs.location.BaseOffsetInterval)
+        self.assertEqual(
+            repr(hgvs.location.BaseOffsetInterval(start, end, uncertain=True)), repr(ival)
+        )
+        self.assertIs(start, ival.start)
+
+        # datums are neither adjusted nor checked
+        start = hgvs.location.BaseOffsetPosition(base=12, datum=Datum.CDS_END)
+        end = hgvs.location.BaseOffsetPosition(base=56, datum=Datum.CDS_START)
+        ival = hgvs.location.BaseOffsetInterval.unchecked(start, end)
+        self.assertEqual(Datum.CDS_START, ival.end.datum)
+        start = hgvs.location.BaseOffsetPosition(base=12, datum=Datum.SEQ_START)
+        hgvs.location.BaseOffsetInterval.unchecked(start, end)
+        with self.assertRaises(HGVSInvalidIntervalError):
+            hgvs.location.BaseOffsetInterval(start, end)
+
+        ival = hgvs.location.Interval.unchecked(
+            hgvs.location.SimplePosition(5), hgvs.location.SimplePosition(7)
+        )
+        self.assertEqual("5_7", str(ival))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from support import CACHE
 import hgvs.dataproviders.uta
 import hgvs.normalizer
 import hgvs.parser
+import hgvs.utils.frozen
 import hgvs.variantmapper
 from hgvs.exceptions import (
     HGVSError,
@@ -187,6 +188,23 @@ class Test_HGVSNormalizer(unittest.TestCase):
         with self.assertRaises(HGVSInvalidVariantError):
             self.norm.normalize(self.hp.parse_hgvs_variant("NM_000059.3:c.7790delAAG"))
 
+    def test_frozen(self):
+        """Frozen variants are normalized without modification and give frozen results"""
+        for hgvs_str, expected in [
+            ("NM_001166478.1:c.31del", "NM_001166478.1:c.35del"),
+            ("NM_001166478.1:c.35_36insT", "NM_001166478.1:c.35dup"),
+            ("NC_000006.11:g.49917122_49917123insA", "NC_000006.11:g.49917127dup"),
+            ("NC_000006.11:g.49917098delC", "NC_000006.11:g.49917099del"),
+            ("NM_001001656.1:c.935T>C", "NM_001001656.1:c.935T>C"),
+        ]:
+            var = hgvs.utils.frozen.freeze(self.hp.parse_hgvs_variant(hgvs_str))
+            var_repr = repr(var)
+            var_norm = self.norm.normalize(var)
+            self.assertEqual(expected, str(var_norm))
+            self.assertTrue(hgvs.utils.frozen.is_frozen(var_norm))
+            self.assertEqual(var_repr, repr(var))
+            self.assertEqual(var_norm, self.norm.normalize(self.hp.parse_hgvs_variant(hgvs_str)))
+
     def test_g_normalizer(self):
         """Test normalizer for variant type g."""
         # 3' shuffling
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
+import concurrent.futures
+import csv
+import gc
+import gzip
 import hashlib
+import itertools
+import json
 import os
 import pprint
 import re
@@ -8,7 +14,7 @@ import unittest
 import pytest
 
 import hgvs.parser
-from hgvs.exceptions import HGVSParseError
+from hgvs.exceptions import HGVSParseError, HGVSUsageError
 
 
 def test_parser_variants_with_gene_names(parser):
@@ -61,12 +67,75 @@ def test_parser_variants_with_no_transcript_gene_names(parser):
         parser.parse("BOGUS/EXCELLENT:c.22+1A>T")  # contains invalid character
 
 
+def test_parse_file(tmp_path):
+    fn = tmp_path / "variants.tsv.gz"
+    with gzip.open(fn, "wt") as fh:
+        fh.write("# comment\n")
+        fh.write("id\thgvs\n")
+        fh.write("1\tNM_01234.5:c.22+1A>T\n")
+        fh.write("2\t\n")
+        fh.write("3\tbogus\n")
+        fh.write("4\tNP_012345.6:p.Ala22Trp\r\n")
+
+    parsed = list(hgvs.parser.parse_file(str(fn), column="hgvs", header=True))
+    assert [3, 5, 6] == [pl.line for pl in parsed]
+    assert ["NM_01234.5:c.22+1A>T", "bogus", "NP_012345.6:p.Ala22Trp"] == [
+        pl.input for pl in parsed
+    ]
+    assert isinstance(parsed[1].result, hgvs.parser.ParseFailure)
+    assert "NP_012345.6:p.Ala22Trp" == str(parsed[2].result)
+
+    parsed_mp = list(hgvs.parser.parse_file(str(fn), column=1, workers=2, chunk_size=1))
+    assert parsed_mp[1:] == parsed
+
+    with pytest.raises(HGVSUsageError):
+        list(hgvs.parser.parse_file(str(fn), column="missing", header=True))
+
+    out = tmp_path / "out.jsonl"
+    assert 0 == hgvs.parser.main([str(fn), "-c", "1", "-f", "jsonl", "-o", str(out)])
+    recs = [json.loads(line) for line in out.read_text().splitlines()]
+    assert ["hgvs", "NM_01234.5:c.22+1A>T", "bogus", "NP_012345.6:p.Ala22Trp"] == [
+        r["input"] for r in recs
+    ]
+    assert "error" in recs[0] and "error" in recs[2]
+    assert "c" == recs[1]["type"]
+
+    out = tmp_path / "out.tsv"
+    assert 0 == hgvs.parser.main([str(fn), "--header", "-c", "hgvs", "-o", str(out)])
+    assert out.read_text().startswith("3\tNM_01234.5:c.22+1A>T\tok\tNM_01234.5:c.22+1A>T\n")
+
+    with pytest.raises(HGVSUsageError):
+        list(hgvs.parser.parse_file(str(fn), column="hgvs"))
+    with pytest.raises(SystemExit) as exc_info:
+        hgvs.parser.main([str(fn), "-c", "hgvs", "-o", str(out)])
+    assert 2 == exc_info.value.code
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_parse_file_closes(tmp_path):
+    fn = tmp_path / "variants.txt"
+    fn.write_text("NM_01234.5:c.22+1A>T\nNM_01234.5:c.22+2A>T\n")
+
+    assert 2 == len(list(hgvs.parser.parse_file(str(fn))))
+    parsed_lines = hgvs.parser.parse_file(str(fn), chunk_size=1)
+    next(parsed_lines)
+    parsed_lines.close()  # stopped early
+    gc.collect()
+
+    # files opened by the caller are left open
+    with open(fn, "rb") as fh:
+        assert 2 == len(list(hgvs.parser.parse_file(fh)))
+        assert not fh.closed
+
+
 class Test_Parser(unittest.TestCase):
     longMessage = True
 
     @classmethod
     def setUpClass(cls):
         cls.parser = hgvs.parser.Parser()
+        cls.fast_parser = hgvs.parser.Parser(fast_path=True)
 
     def test_parser_parse_shorthand(self):
         v = "NM_01234.5:c.22+1A>T"
@@ -96,6 +165,163 @@ class Test_Parser(unittest.TestCase):
                 self.parser.parse_hgvs_variant(var)
                 self.assertTrue(False, msg="expected HGVSParseError: %s (%s)" % (var, msg))
 
+    def test_parser_fast_path(self):
+        """fast path must return exactly what the grammar returns"""
+        data_dir = os.path.join(os.path.dirname(__file__), "data")
+        with gzip.open(os.path.join(data_dir, "random-vars.gz"), "rt") as f:
+            random_vars = [line.strip() for line in itertools.islice(f, 2000)]
+        with gzip.open(os.path.join(data_dir, "clinvar.gz"), "rt") as f:
+            lines = (line for line in f if not line.startswith("#"))
+            reader = csv.DictReader(lines, delimiter="\t")
+            clinvar_vars = [
+                v for rec in itertools.islice(reader, 700) for v in rec["hgvs_variants"].split()
+            ]
+        variants = (
+            random_vars
+            + clinvar_vars
+            + [
+                "NM_01234.5(BOGUS):c.*87_91del",
+                "NM_01234.5:c.-14+2_-14+3insAG",
+                "NC_012920.1:m.3243A=",
+                "NR_01234.5:n.22dup",
+                "NC_000001.10:g.100del5insT",
+            ]
+        )
+        n_fast = 0
+        for v in variants:
+            var_f = hgvs.parser._fast_parse_hgvs_variant(v)
+            if var_f is None:
+                continue
+            n_fast += 1
+            var_g = self.parser.parse_hgvs_variant(v)
+            self.assertEqual(var_g, var_f, v)
+            self.assertEqual(repr(var_g), repr(var_f), v)
+            self.assertIs(type(var_g.posedit.pos), type(var_f.posedit.pos), v)
+            self.assertEqual(var_g, self.fast_parser.parse(v), v)
+        self.assertGreater(n_fast, 0.9 * len(variants))
+
+    @pytest.mark.quick
+    def test_parser_fast_path_fallback(self):
+        for v in [
+            "NM_01234.5:c.22+1a>t",  # lowercase sequence
+            "NM_01234.5:c.(22+1)A>T",  # uncertain interval
+            "NP_012345.6:p.Ala22Trp",  # protein
+            "NM_01234.5:n.*22A>T",  # * is not valid for n.
+        ]:
+            self.assertIsNone(hgvs.parser._fast_parse_hgvs_variant(v), v)
+        v = "NM_01234.5:c.(22+1)A>T"
+        self.assertEqual(self.parser.parse(v), self.fast_parser.parse(v))
+        with self.assertRaises(HGVSParseError):
+            self.fast_parser.parse("NM_01234.5:n.*22A>T")
+
+    def test_parse_many(self):
+        inputs = ["NM_01234.5:c.22+1A>T", "bogus", "NP_012345.6:p.Ala22Trp"] * 5
+        expected = [self.parser.parse(v) for v in inputs if v != "bogus"]
+
+        results = list(self.parser.parse_many(iter(inputs)))
+        self.assertEqual(len(inputs), len(results))
+        failures = [r for r in results if isinstance(r, hgvs.parser.ParseFailure)]
+        self.assertEqual(5, len(failures))
+        self.assertTrue(all(f.input == "bogus" for f in failures))
+        self.assertEqual(expected, [r for r in results if r not in failures])
+
+        results_mp = list(self.parser.parse_many(inputs, workers=2, chunk_size=4))
+        self.assertEqual(results, results_mp)
+
+        with self.assertRaises(HGVSParseError):
+            list(self.parser.parse_many(inputs, on_error="raise"))
+        with self.assertRaises(HGVSParseError):
+            list(self.parser.parse_many(inputs, on_error="raise", workers=2))
+        with self.assertRaises(HGVSUsageError):
+            self.parser.parse_many(inputs, on_error="ignore")
+
+    def test_parse_cache(self):
+        cp = hgvs.parser.Parser(cache_size=2)
+        self.assertEqual((0, 0, 2, 0), tuple(cp.cache_info()))
+        v = "NM_01234.5:c.22+1_23-2delinsACGT"
+        v1 = cp.parse(v)
+        v2 = cp.parse(v)
+        self.assertEqual(self.parser.parse(v), v1)
+        self.assertEqual(v1, v2)
+        self.assertEqual((1, 1, 2, 1), tuple(cp.cache_info()))
+
+        # cached results must be independent of each other
+        v2.posedit.pos.start.base = 1
+        v2.posedit.edit.ref = "ACGT"
+        self.assertEqual(v1, cp.parse(v))
+        self.assertNotEqual(v1, v2)
+
+        # keyed by rule as well as string
+        self.assertEqual(str(cp.parse_c_interval("22+1")), "22+1")
+        self.assertEqual(str(cp.parse_n_interval("22+1")), "22+1")
+        self.assertEqual(2, cp.cache_info().currsize)
+        self.assertEqual(3, cp.cache_info().misses)
+
+        with self.assertRaises(HGVSParseError):
+            cp.parse("bogus")
+
+        hp = "NM_01234.5:c.22+1_23-2"
+        cp.parse_hgvs_position(hp).pos.start.base = 1
+        self.assertEqual(hp, str(cp.parse_hgvs_position(hp)))
+
+        cp.cache_clear()
+        self.assertEqual((0, 0, 2, 0), tuple(cp.cache_info()))
+        self.assertEqual((0, 0, 0, 0), tuple(self.parser.cache_info()))
+
+    def test_shared_grammar(self):
+        p1 = hgvs.parser.Parser()
+        p2 = hgvs.parser.Parser()
+        self.assertIs(p1._grammar, p2._grammar)
+        self.assertIs(p1.parse_c_variant, p2.parse_c_variant)
+        self.assertIsNot(p1.parse_c_variant, hgvs.parser.Parser(backend="rd").parse_c_variant)
+        self.assertIn("parse_offset", vars(hgvs.parser.Parser(expose_all_rules=True)))
+        self.assertNotIn("parse_offset", vars(p1))
+
+    def test_parser_pool(self):
+        pool = hgvs.parser.ParserPool(size=2, cache_size=10)
+        inputs = ["NM_01234.5:c.22+1A>T", "NP_012345.6:p.Ala22Trp"] * 50
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(pool.parse, inputs))
+        self.assertEqual([self.parser.parse(v) for v in inputs], results)
+
+        with pool.parser() as hp1, pool.parser() as hp2:
+            self.assertIsNot(hp1, hp2)
+            with self.assertRaises(HGVSUsageError):
+                with pool.parser(timeout=0.01):
+                    pass
+
+    def test_precheck(self):
+        pc = hgvs.parser.Parser(precheck=True)
+        for v in [
+            "BRCA1 exon 11 deletion",
+            "IVS2+1G>A",
+            "c.123A>G",
+            "NM_01234.5:c.22+1 A>T",
+            "NM_01234.5:x.22+1A>T",
+            "NM_01234.5:c.22+1A>T,",
+        ]:
+            with self.assertRaisesRegex(HGVSParseError, "pre-check"):
+                pc.parse(v)
+        with self.assertRaisesRegex(HGVSParseError, "pre-check"):
+            pc.parse_p_variant("NM_01234.5:c.22+1A>T")
+
+        # anything that passes is parsed by the grammar
+        with self.assertRaises(HGVSParseError) as ctx:
+            pc.parse("NM_01234.5:c.22+1AA")
+        self.assertNotIn("pre-check", str(ctx.exception))
+        for v in [
+            "NM_01234.5:c.22+1A>T",
+            "NM_01234.5(BOGUS):c.22+1A>T",
+            "NC_000001.10:g.(100_200)del",
+            "NP_012345.6:p.(Ter110GlnextTer17)",
+        ]:
+            self.assertEqual(self.parser.parse(v), pc.parse(v))
+
+        # precheck is off by default
+        with self.assertRaises(HGVSParseError) as ctx:
+            self.parser.parse("IVS2+1G>A")
+        self.assertNotIn("pre-check", str(ctx.exception))
+
     @pytest.mark.quick
     def test_parser_posedit_special(self):
         # See note in grammar about parsing p.=, p.?, and p.0
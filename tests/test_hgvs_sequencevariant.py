@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
+import copy
 import os
+import pickle
 import unittest
 
+import attr
 import pytest
 from support import CACHE
 
 import hgvs
+import hgvs.edit
 import hgvs.parser
 import hgvs.sequencevariant
 
@@ -95,6 +99,64 @@ class Test_SequenceVariant(unittest.TestCase):
         self.assertEqual(str(var), "NM_001166478.1:c.31=")
         self.assertEqual(var.format(conf={"max_ref_length": None}), "NM_001166478.1:c.31T=")
 
+    def test_clone(self):
+        hp = hgvs.parser.Parser()
+        fn = os.path.join(os.path.dirname(__file__), "data", "gauntlet")
+        with open(fn) as fh:
+            lines = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        for line in lines:
+            try:
+                var = hp.parse(line)
+            except hgvs.exceptions.HGVSParseError:
+                continue
+            clone = var.clone()
+            self.assertEqual(repr(copy.deepcopy(var)), repr(clone))
+            self.assertIsNot(var.posedit, clone.posedit)
+            if var.posedit.pos is not None:
+                self.assertIsNot(var.posedit.pos.start, clone.posedit.pos.start)
+            if isinstance(var.posedit.edit, hgvs.edit.Edit):
+                self.assertIsNot(var.posedit.edit, clone.posedit.edit)
+
+        var = hp.parse_lazy("NM_01234.5:c.22+1A>T").clone()
+        self.assertIs(type(var), hgvs.sequencevariant.SequenceVariant)
+        self.assertEqual("NM_01234.5:c.22+1A>T", str(var))
+
+    def test_lazy_sequence_variant(self):
+        hp = hgvs.parser.Parser()
+        s = "NM_01234.5(GENE):c.22+1_23delinsAT"
+        var = hp.parse(s)
+
+        lvar = hp.parse_lazy(s)
+        self.assertIs(type(lvar), hgvs.sequencevariant.LazySequenceVariant)
+        self.assertEqual(("NM_01234.5", "c", "GENE"), (lvar.ac, lvar.type, lvar.gene))
+        self.assertIs(type(lvar), hgvs.sequencevariant.LazySequenceVariant)
+        self.assertEqual(var.posedit, lvar.posedit)
+        self.assertIs(type(lvar), hgvs.sequencevariant.SequenceVariant)
+
+        # every operation that depends on the posedit materializes it
+        self.assertEqual(var, hp.parse_lazy(s))
+        self.assertEqual(hp.parse_lazy(s), var)
+        self.assertEqual(repr(var), repr(hp.parse_lazy(s)))
+        self.assertEqual(str(var), str(hp.parse_lazy(s)))
+        self.assertEqual(var, copy.deepcopy(hp.parse_lazy(s)))
+        self.assertEqual(var, pickle.loads(pickle.dumps(hp.parse_lazy(s))))
+        self.assertEqual(attr.asdict(var), attr.asdict(hp.parse_lazy(s)))
+        self.assertEqual("X", attr.evolve(hp.parse_lazy(s), gene="X").gene)
+
+        lvar = hp.parse_lazy(s)
+        lvar.posedit = var.posedit
+        self.assertIs(type(lvar), hgvs.sequencevariant.SequenceVariant)
+
+        # posedit errors are deferred
+        lvar = hp.parse_lazy("NM_01234.5:c.22+1A>")
+        self.assertEqual("NM_01234.5", lvar.ac)
+        with self.assertRaises(hgvs.exceptions.HGVSParseError):
+            lvar.posedit
+
+        # unusual headers are parsed eagerly
+        with self.assertRaises(hgvs.exceptions.HGVSParseError):
+            hp.parse_lazy("NM_01234.5:x.22+1A>T")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import re
+import unittest
+from unittest import mock
+
+import pytest
+
+import hgvs.parser
+import hgvs.sequencevariant
+import hgvs.utils.accessions
+import hgvs.utils.cachestats
+from hgvs.enums import ValidationLevel
+from hgvs.exceptions import HGVSUsageError
+from hgvs.utils.accessions import AccessionRegistry
+from hgvs.utils.validation import validate_type_ac_pair
+
+
+@pytest.mark.quick
+class Test_AccessionRegistry(unittest.TestCase):
+    def test_ids(self):
+        reg = AccessionRegistry()
+        acs = ["NM_01234.5", "NC_000001.10", "NP_01234.1"]
+        self.assertEqual([0, 1, 2, 0], [reg.get_id(ac) for ac in acs + acs[:1]])
+        self.assertEqual(acs, [reg.get_ac(i) for i in range(3)])
+        self.assertEqual(3, len(reg))
+        self.assertIn("NM_01234.5", reg)
+        self.assertNotIn("NM_99999.1", reg)
+        with self.assertRaises(IndexError):
+            reg.get_ac(3)
+        with self.assertRaises(IndexError):
+            reg.get_ac(-1)
+
+    def test_intern(self):
+        reg = AccessionRegistry()
+        ac = reg.intern("".join(["NM_", "01234.5"]))
+        ac2 = "".join(["NM_", "01234.5"])
+        self.assertIsNot(ac, ac2)
+        self.assertIs(ac, reg.intern(ac2))
+        self.assertIsNone(reg.intern(None))
+        self.assertEqual(1, len(reg))
+
+    def test_maxsize(self):
+        reg = AccessionRegistry(maxsize=2, validations_maxsize=2)
+        self.assertEqual([0, 1], [reg.get_id(ac) for ac in ("NM_1.1", "NM_2.1")])
+        ac = "".join(["NM_", "3.1"])
+        self.assertIs(ac, reg.intern(ac))
+        self.assertNotIn(ac, reg)
+        with self.assertRaises(HGVSUsageError):
+            reg.get_id(ac)
+        self.assertEqual("NM_1.1", reg.get_ac(0))
+        self.assertEqual(2, len(reg))
+
+        for i in range(5):
+            reg.validate_type_ac_pair("c", "NM_{i}.1".format(i=i))
+        self.assertEqual(2, reg._validate.cache_info().currsize)
+        self.assertEqual(100000, hgvs.utils.accessions.registry.maxsize)
+
+    def test_validate_type_ac_pair(self):
+        reg = AccessionRegistry()
+        for type, ac, level in [
+            ("c", "NM_01234.5", ValidationLevel.VALID),
+            ("g", "NM_01234.5", ValidationLevel.ERROR),
+            ("c", "XYZ_01234.5", ValidationLevel.WARNING),
+        ]:
+            result = reg.validate_type_ac_pair(type, ac)
+            self.assertEqual(validate_type_ac_pair(type, ac), result)
+            self.assertEqual(level, result[0])
+            self.assertIs(result, reg.validate_type_ac_pair(type, ac))
+
+        names = [
+            n for n, c in hgvs.utils.cachestats.registry.caches().items() if c is reg._validate
+        ]
+        self.assertEqual(1, len(names))
+        self.assertTrue(names[0].startswith("AccessionRegistry.validate"))
+        self.assertEqual(3, hgvs.utils.cachestats.as_dict(names)[names[0]]["hits"])
+
+    def test_parser(self):
+        hp = hgvs.parser.Parser()
+        var1 = hp.parse("NM_01234.5:c.22+1A>T")
+        var2 = hp.parse("NM_01234.5(GENE):c.22_23delinsTT")
+        var3 = hp.parse_lazy("NM_01234.5:c.22+1A>T")
+        self.assertIs(var1.ac, var2.ac)
+        self.assertIs(var1.ac, var3.ac)
+        self.assertIn(var1.ac, hgvs.utils.accessions.registry)
+        self.assertEqual(ValidationLevel.VALID, var1.validate()[0])
+
+        # strings that parse_lazy parses eagerly are interned too
+        with mock.patch.object(hgvs.parser, "_lazy_header_re", re.compile(r"(?!)")):
+            var4 = hp.parse_lazy("".join(["NM_01234.5", ":c.22+1A>T"]))
+        self.assertNotIsInstance(var4, hgvs.sequencevariant.LazySequenceVariant)
+        self.assertIs(var1.ac, var4.ac)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+
+import pytest
+from support.mock_data_provider import MockDataProvider
+
+import hgvs
+import hgvs.utils.tracing
+from hgvs.exceptions import HGVSDataNotAvailableError
+from hgvs.utils.accounting import CallAccountant, accounting
+from hgvs.utils.tracing import Tracer, traced, tracing
+
+
+class _Mapper:
+    def __init__(self, hdp):
+        self.hdp = hdp
+
+    @traced
+    def c_to_p(self, ac):
+        self.hdp.get_tx_mapping_options(ac)
+        self._helper(ac)
+        return self.hdp.get_seq(ac, 0, 3)
+
+    @traced
+    def _helper(self, ac):
+        self.hdp.get_tx_info(ac, "NC_000001.10", "splign")
+        self.hdp.get_seq(ac, 0, 3)
+
+
+@pytest.mark.quick
+class Test_CallAccountant(unittest.TestCase):
+    def test_operations(self):
+        hdp = MockDataProvider()
+        mapper = _Mapper(hdp)
+        with accounting() as accountant:
+            for _ in range(3):
+                self.assertEqual("ACG", mapper.c_to_p("NM_01234.5"))
+            hdp.get_seq("NM_01234.5")
+        self.assertIsNone(hgvs.utils.tracing.get_tracer())
+
+        report = accountant.report()
+        self.assertEqual({"_Mapper.c_to_p", None}, set(report))
+        op = report["_Mapper.c_to_p"]
+        self.assertEqual(3, op["count"])
+        self.assertEqual({"get_seq", "get_tx_info", "get_tx_mapping_options"}, set(op["methods"]))
+        get_seq = op["methods"]["get_seq"]
+        self.assertEqual(6, get_seq["calls"])
+        self.assertEqual(5, get_seq["hits"])
+        self.assertEqual(1, get_seq["misses"])
+        self.assertEqual(0, get_seq["errors"])
+        self.assertEqual(2.0, get_seq["calls_per_operation"])
+        self.assertGreater(get_seq["miss_time"], 0)
+        self.assertEqual(
+            {"calls": 3, "hits": 2, "misses": 1, "errors": 0},
+            {
+                k: v
+                for k, v in op["methods"]["get_tx_info"].items()
+                if k in ("calls", "hits", "misses", "errors")
+            },
+        )
+        self.assertEqual(0, report[None]["count"])
+        self.assertEqual(1, report[None]["methods"]["get_seq"]["misses"])
+        self.assertIsNone(report[None]["methods"]["get_seq"]["calls_per_operation"])
+
+        rows = accountant.rows()
+        self.assertEqual(4, len(rows))
+        self.assertEqual(
+            hdp.fetches["get_seq"], sum(r["misses"] for r in rows if r["method"] == "get_seq")
+        )
+        text = accountant.format_report()
+        self.assertEqual(5, len(text.splitlines()))
+        self.assertIn("_Mapper.c_to_p", text)
+
+        accountant.clear()
+        self.assertEqual({}, accountant.report())
+
+    def test_errors(self):
+        hdp = MockDataProvider()
+        mapper = _Mapper(hdp)
+        with accounting() as accountant:
+            for _ in range(2):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    mapper.c_to_p("NM_99999.9")
+        methods = accountant.report()["_Mapper.c_to_p"]["methods"]
+        self.assertEqual(
+            {"calls": 2, "hits": 0, "misses": 2, "errors": 2},
+            {
+                k: methods["get_tx_mapping_options"][k]
+                for k in ("calls", "hits", "misses", "errors")
+            },
+        )
+        self.assertNotIn("get_seq", methods)
+
+    def test_negative_hits(self):
+        negative_maxsize = hgvs.global_config.lru_cache.negative_maxsize
+        hgvs.global_config.lru_cache.negative_maxsize = 10
+        try:
+            hdp = MockDataProvider()
+        finally:
+            hgvs.global_config.lru_cache.negative_maxsize = negative_maxsize
+        with accounting() as accountant:
+            for _ in range(3):
+                with self.assertRaises(HGVSDataNotAvailableError):
+                    hdp.get_tx_info("NM_99999.9", "NC_000001.10", "splign")
+        # calls answered from the negative cache are hits, not errors
+        self.assertEqual(
+            {"calls": 3, "hits": 2, "negative_hits": 2, "misses": 1, "errors": 1},
+            {
+                k: v
+                for k, v in accountant.report()[None]["methods"]["get_tx_info"].items()
+                if k in ("calls", "hits", "negative_hits", "misses", "errors")
+            },
+        )
+        self.assertEqual(1, hdp.fetches["get_tx_info"])
+
+    def test_threads(self):
+        hdp = MockDataProvider()
+        mapper = _Mapper(hdp)
+        accountant = CallAccountant()
+
+        def work():
+            for _ in range(10):
+                mapper.c_to_p("NM_01234.5")
+
+        with accounting(accountant):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        op = accountant.report()["_Mapper.c_to_p"]
+        self.assertEqual(40, op["count"])
+        self.assertEqual(80, op["methods"]["get_seq"]["calls"])
+        self.assertEqual(80, op["methods"]["get_seq"]["hits"] + op["methods"]["get_seq"]["misses"])
+
+    def test_restores_tracer(self):
+        tracer = Tracer()
+        with tracing(tracer):
+            with accounting():
+                pass
+            self.assertIs(tracer, hgvs.utils.tracing.get_tracer())
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
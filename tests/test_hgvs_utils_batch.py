@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import gzip
+import itertools
+import os
+import unittest
+
+import pytest
+
+import hgvs.edit
+import hgvs.location
+import hgvs.parser
+import hgvs.posedit
+import hgvs.sequencevariant
+from hgvs.enums import Datum
+from hgvs.exceptions import HGVSUnsupportedOperationError
+from hgvs.utils.batch import VariantBatch
+from hgvs.utils.frozen import freeze
+
+
+@pytest.mark.quick
+@pytest.mark.models
+class Test_VariantBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hp = hgvs.parser.Parser()
+
+    def assertSameVariants(self, variants, variants2):
+        # uncertain positions do not support ==, so compare reprs and classes
+        self.assertEqual(len(variants), len(variants2))
+        for var, var2 in zip(variants, variants2):
+            self.assertEqual(repr(var), repr(var2))
+            self.assertIs(type(var.posedit.pos), type(var2.posedit.pos))
+            self.assertIsNot(var, var2)
+
+    def test_columns(self):
+        variants = [
+            self.hp.parse(s)
+            for s in (
+                "NM_01234.5(GENE):c.22+1A>T",
+                "NM_01234.5:c.-5_*7del",
+                "NC_000001.10:g.100_101insAAC",
+                "NC_000001.10:g.100_102dupAAC",
+                "NP_01234.1:p.Ala22Trp",
+            )
+        ]
+        batch = VariantBatch.from_variants(variants)
+        self.assertEqual(5, len(batch))
+        self.assertEqual(["NM_01234.5", "GENE", "NC_000001.10"], batch.strings)
+        self.assertEqual([0, 0, 2, 2, -1], list(batch.ac))
+        self.assertEqual([1, -1, -1, -1, -1], list(batch.gene))
+        self.assertEqual([22, -5, 100, 100, 0], list(batch.start_base))
+        self.assertEqual([1, 0, 0, 0, 0], list(batch.start_offset))
+        self.assertEqual([22, 7, 101, 102, 0], list(batch.end_base))
+        self.assertEqual(["A", "", "", "AAC", ""], [batch.ref_at(i) for i in range(5)])
+        self.assertEqual(["T", "", "AAC", "", ""], [batch.alt_at(i) for i in range(5)])
+        self.assertEqual("AAAC", batch.ref_buffer)
+        self.assertEqual(Datum.CDS_END.value, (batch.flags[1] & 0x000C) >> 2)
+        self.assertEqual([True, True, True, True, False], [batch.is_columnar(i) for i in range(5)])
+        self.assertEqual([4], list(batch.others))
+        self.assertSameVariants(variants, batch.to_variants())
+        self.assertEqual(str(variants[-1]), str(batch[-1]))
+
+    def test_corpora(self):
+        fn = os.path.join(os.path.dirname(__file__), "data", "gauntlet")
+        with open(fn) as fh:
+            lines = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        fn = os.path.join(os.path.dirname(__file__), "data", "random-vars.gz")
+        with gzip.open(fn, "rt") as fh:
+            lines += [line.strip() for line in itertools.islice(fh, 1000)]
+        variants = []
+        for line in lines:
+            try:
+                variants.append(self.hp.parse(line))
+            except hgvs.exceptions.HGVSParseError:
+                pass
+        batch = VariantBatch.from_variants(variants)
+        self.assertSameVariants(variants, batch.to_variants())
+        self.assertSameVariants(variants, list(batch))
+        self.assertLess(len(batch.others), len(variants) / 10)
+        self.assertLess(batch.nbytes(), 100 * len(variants))
+
+    def test_uncertain_and_edge_cases(self):
+        sp = hgvs.location.SimplePosition
+        variants = [
+            self.hp.parse("NC_000001.10:g.(100_200)del"),
+            hgvs.sequencevariant.SequenceVariant(
+                ac="NC_000001.10",
+                type="g",
+                posedit=hgvs.posedit.PosEdit(
+                    pos=hgvs.location.Interval(sp(5), sp(7)),
+                    edit=hgvs.edit.Repeat(ref="CAG", min=3, max=5),
+                ),
+            ),
+            self.hp.parse("NM_01234.5:c.22+1A>T"),
+            self.hp.parse("NM_01234.5:c.22_24inv"),
+            self.hp.parse("NM_01234.5:c.22_24delinsAT"),
+            self.hp.parse("NM_01234.5:c.22A="),
+            self.hp.parse("NM_01234.5:c.22_24conNM_004006.1:c.12_14"),
+            hgvs.sequencevariant.SequenceVariant(
+                ac="NC_000001.10",
+                type="g",
+                posedit=hgvs.posedit.PosEdit(
+                    pos=hgvs.location.Interval(sp(None), sp(7)),
+                    edit=hgvs.edit.NARefAlt(ref="A", alt="T"),
+                ),
+            ),
+        ]
+        variants[2].posedit.uncertain = True
+        variants[2].posedit.edit.uncertain = True
+        batch = VariantBatch.from_variants(variants)
+        self.assertEqual(
+            [True, False, True, True, True, True, False, False],
+            [batch.is_columnar(i) for i in range(len(batch))],
+        )
+        self.assertSameVariants(variants, batch.to_variants())
+
+    def test_frozen_and_lazy(self):
+        s = "NM_01234.5:c.22+1A>T"
+        batch = VariantBatch.from_variants([freeze(self.hp.parse(s)), self.hp.parse_lazy(s)])
+        self.assertTrue(batch.is_columnar(0))
+        self.assertTrue(batch.is_columnar(1))
+        self.assertEqual([s, s], [str(v) for v in batch])
+
+    def test_errors(self):
+        with self.assertRaises(HGVSUnsupportedOperationError):
+            VariantBatch.from_variants(["NM_01234.5:c.22+1A>T"])
+        with self.assertRaises(IndexError):
+            VariantBatch.from_variants([])[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
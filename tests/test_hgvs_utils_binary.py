@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import gzip
+import itertools
+import os
+import pickle
+import unittest
+
+import pytest
+
+import hgvs.edit
+import hgvs.hgvsposition
+import hgvs.location
+import hgvs.parser
+import hgvs.posedit
+import hgvs.sequencevariant
+import hgvs.utils.binary
+from hgvs.enums import Datum
+from hgvs.exceptions import HGVSUnsupportedOperationError, HGVSUsageError
+
+
+@pytest.mark.quick
+@pytest.mark.models
+class Test_Binary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hp = hgvs.parser.Parser(backend="rd")
+
+    def assertRoundTrip(self, obj):
+        # uncertain positions do not support ==, so compare encodings
+        data = hgvs.utils.binary.dumps(obj)
+        obj2 = hgvs.utils.binary.loads(data)
+        self.assertIs(type(obj), type(obj2))
+        self.assertEqual(repr(obj), repr(obj2))
+        self.assertEqual(data, hgvs.utils.binary.dumps(obj2))
+
+    def test_location_and_edit_classes(self):
+        bop = hgvs.location.BaseOffsetPosition
+        objs = [
+            hgvs.location.SimplePosition(base=5),
+            hgvs.location.SimplePosition(base=None, uncertain=True),
+            bop(base=-12, offset=-300, datum=Datum.CDS_START),
+            bop(base=12, offset=123456789, datum=Datum.CDS_END, uncertain=True),
+            hgvs.location.AAPosition(base=22, aa="W"),
+            hgvs.location.Interval(
+                hgvs.location.SimplePosition(5), hgvs.location.SimplePosition(7)
+            ),
+            hgvs.location.BaseOffsetInterval(bop(5, -2), bop(7, 3)),
+            hgvs.edit.NARefAlt(ref="ACGT", alt="", uncertain=True),
+            hgvs.edit.NARefAlt(ref="5"),
+            hgvs.edit.AARefAlt(ref="Ala", alt="Trp", init_met=True),
+            hgvs.edit.AASub(ref="A", alt="*"),
+            hgvs.edit.AAFs(ref="A", alt="W", length="?"),
+            hgvs.edit.AAExt(ref="*", alt="Q", aaterm="*", length=17),
+            hgvs.edit.Dup(ref="ACG"),
+            hgvs.edit.Repeat(ref="CAG", min=3, max=5),
+            hgvs.edit.NACopy(copy=4),
+            hgvs.edit.Inv(ref="AC"),
+            hgvs.edit.Conv(
+                from_ac="NM_01234.5",
+                from_type="c",
+                from_pos=hgvs.location.BaseOffsetInterval(bop(1), bop(2)),
+            ),
+            hgvs.hgvsposition.HGVSPosition(
+                ac="NM_01234.5", type="c", pos=hgvs.location.BaseOffsetInterval(bop(1), bop(2))
+            ),
+        ]
+        for obj in objs:
+            self.assertRoundTrip(obj)
+            self.assertEqual(repr(obj), repr(type(obj).from_bytes(obj.to_bytes())))
+
+    def test_variants(self):
+        fn = os.path.join(os.path.dirname(__file__), "data", "gauntlet")
+        with open(fn) as fh:
+            lines = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        fn = os.path.join(os.path.dirname(__file__), "data", "random-vars.gz")
+        with gzip.open(fn, "rt") as fh:
+            lines += [line.strip() for line in itertools.islice(fh, 1000)]
+        variants = []
+        for line in lines:
+            try:
+                variants.append(self.hp.parse(line))
+            except hgvs.exceptions.HGVSParseError:
+                pass
+        for var in variants:
+            self.assertRoundTrip(var)
+            self.assertEqual(var, hgvs.sequencevariant.SequenceVariant.from_bytes(var.to_bytes()))
+
+        data = hgvs.utils.binary.dumps_list(variants)
+        self.assertEqual(variants, hgvs.utils.binary.loads_list(data))
+        self.assertLess(len(data), len(pickle.dumps(variants, -1)) / 2)
+
+    def test_lazy_variant(self):
+        var = self.hp.parse_lazy("NM_01234.5:c.22+1A>T")
+        var2 = hgvs.sequencevariant.SequenceVariant.from_bytes(var.to_bytes())
+        self.assertIs(type(var2), hgvs.sequencevariant.SequenceVariant)
+        self.assertEqual(var, var2)
+
+    def test_errors(self):
+        var = self.hp.parse("NM_01234.5:c.22+1A>T")
+        data = var.to_bytes()
+        with self.assertRaises(HGVSUsageError):
+            hgvs.edit.Edit.from_bytes(data)
+        with self.assertRaises(HGVSUsageError):
+            hgvs.utils.binary.loads(b"\x00" + data[1:])
+        for i in range(1, len(data)):
+            with self.assertRaises(HGVSUsageError):
+                hgvs.utils.binary.loads(data[:i])
+        with self.assertRaises(HGVSUsageError):
+            hgvs.utils.binary.loads(data + b"\x00")
+        with self.assertRaises(HGVSUnsupportedOperationError):
+            hgvs.utils.binary.dumps(hgvs.sequencevariant.SequenceVariant("NM_1.1", "c", 1.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import gc
+import os
+import unittest
+
+import pytest
+from support.mock_data_provider import MockDataProvider
+
+import hgvs.parser
+import hgvs.utils.cachestats
+import hgvs.variantmapper  # noqa: F401 (registers VariantMapper._fetch_AlignmentMapper)
+from hgvs.decorators.lru_cache import lru_cache
+from hgvs.utils.cachestats import CacheRegistry, estimate_nbytes
+
+
+@pytest.mark.quick
+class Test_CacheStats(unittest.TestCase):
+    def test_lru_cache_stats(self):
+        @lru_cache(maxsize=2)
+        def f(x):
+            return "x" * x
+
+        for x in (10, 20, 10, 30, 40):
+            f(x)
+        stats = f.cache_stats()
+        self.assertEqual(
+            {"hits": 1, "misses": 4, "evictions": 2, "maxsize": 2, "currsize": 2},
+            {k: stats[k] for k in ("hits", "misses", "evictions", "maxsize", "currsize")},
+        )
+        self.assertGreater(stats["miss_time"], 0)
+        self.assertGreater(stats["nbytes"], 70)
+        self.assertEqual((1, 4, 2, 2), tuple(f.cache_info()))
+        f.cache_clear()
+        stats = f.cache_stats()
+        self.assertEqual(
+            (0, 0, 0, 0, 0.0),
+            tuple(stats[k] for k in ("hits", "misses", "evictions", "currsize", "miss_time")),
+        )
+
+    def test_unbounded_and_persistent(self):
+        @lru_cache(maxsize=None)
+        def f(x):
+            return x
+
+        f(1)
+        f(1)
+        stats = f.cache_stats()
+        self.assertEqual(
+            (1, 1, 0, None, 1),
+            tuple(stats[k] for k in ("hits", "misses", "evictions", "maxsize", "currsize")),
+        )
+
+        fn = os.path.join(os.path.dirname(__file__), "data", "cache-py3.hdp")
+        hdp = MockDataProvider(seqs={}, mode="run", cache=fn)
+        stats = hdp.get_tx_mapping_options.cache_stats()
+        # persistent stores are shared by all methods and are not inspected
+        self.assertEqual((None, None), (stats["currsize"], stats["nbytes"]))
+        self.assertEqual(0, stats["hits"])
+
+    def test_estimate_nbytes(self):
+        self.assertGreater(estimate_nbytes(["a" * 1000]), 1000)
+        self.assertGreater(estimate_nbytes({"k": ("a" * 1000,)}), 1000)
+        v = hgvs.parser.Parser().parse("NM_01234.5:c.22+1A>T")
+        self.assertGreater(estimate_nbytes(v), estimate_nbytes(v, follow_objects=False))
+        shared = "a" * 1000
+        self.assertLess(estimate_nbytes([shared, shared]), 2000)
+
+    def test_registry(self):
+        class Cache:
+            def __init__(self, n):
+                self.n = n
+
+            def cache_stats(self):
+                return {
+                    "hits": self.n,
+                    "misses": 0,
+                    "evictions": 0,
+                    "maxsize": None,
+                    "max_bytes": None,
+                    "currsize": 0,
+                    "nbytes": 0,
+                    "miss_time": 0.0,
+                    "negative_hits": 0,
+                    "negative_currsize": 0,
+                }
+
+        reg = CacheRegistry()
+        c1, c2 = Cache(1), Cache(2)
+        self.assertEqual("c", reg.register("c", c1))
+        self.assertEqual("c#2", reg.register("c", c2))
+        self.assertEqual({"c": 1, "c#2": 2}, {n: s["hits"] for n, s in reg.as_dict().items()})
+        self.assertEqual(["c#2"], list(reg.as_dict(names=["c#2"])))
+        del c1
+        gc.collect()
+        self.assertEqual(["c#2"], list(reg.caches()))
+
+        text = reg.to_prometheus()
+        self.assertIn("# TYPE hgvs_cache_hits_total counter\n", text)
+        self.assertIn('hgvs_cache_hits_total{cache="c#2"} 2\n', text)
+        self.assertIn('hgvs_cache_maxsize{cache="c#2"} +Inf\n', text)
+        self.assertIn('hgvs_cache_miss_seconds_total{cache="c#2"} 0.0\n', text)
+        self.assertEqual(10 * 3, len(text.splitlines()))
+
+        c2.cache_stats = lambda: dict(Cache.cache_stats(c2), currsize=None, nbytes=None)
+        text = reg.to_prometheus()
+        self.assertNotIn("hgvs_cache_size{", text)
+        self.assertIn('hgvs_cache_max_bytes{cache="c#2"} +Inf\n', text)
+
+    def test_package_caches(self):
+        hdp = MockDataProvider()
+        hdp.get_seq("NM_01234.5", 0, 5)
+        hdp.get_seq("NM_01234.5", 0, 5)
+        parser = hgvs.parser.Parser(cache_size=10)
+        caches = hgvs.utils.cachestats.registry.caches()
+        self.assertIn("VariantMapper._fetch_AlignmentMapper", caches)
+        names = [
+            n
+            for n, c in caches.items()
+            if n.startswith("hdp.get_seq") and c.cache_stats is hdp.get_seq.cache_stats
+        ]
+        self.assertEqual(1, len(names))
+        stats = hgvs.utils.cachestats.as_dict(names=names)[names[0]]
+        self.assertEqual((1, 1), (stats["hits"], stats["misses"]))
+        self.assertIn(names[0], hgvs.utils.cachestats.to_prometheus(names=names))
+        self.assertTrue(
+            any(
+                n.startswith("Parser.parse") and c is parser._parse_cache for n, c in caches.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
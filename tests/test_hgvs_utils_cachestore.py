@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pytest
+from support.mock_data_provider import MockDataProvider
+
+import hgvs.utils.cachestats
+from hgvs.decorators.lru_cache import _make_key
+from hgvs.exceptions import HGVSDataNotAvailableError
+from hgvs.utils.cachestore import (
+    MMapDict,
+    OverlayDict,
+    SQLiteDict,
+    key_text,
+    open_cache,
+)
+from hgvs.utils.PersistentDict import PersistentDict
+
+HDP_FN = os.path.join(os.path.dirname(__file__), "data", "cache-py3.hdp")
+
+
+@pytest.mark.quick
+class Test_SQLiteDict(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.fn = os.path.join(self.tmpdir, "cache.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_mapping(self):
+        key = _make_key("get_seq", ("NM_01234.5", 1, 3), {}, False, ())
+        with SQLiteDict(self.fn) as store:
+            store[key] = "CG"
+            store["k"] = {"a": [1, 2]}
+            self.assertEqual("CG", store[key])
+            self.assertEqual("CG", store.get(key))
+            self.assertIsNone(store.get("missing"))
+            self.assertIn("k", store)
+            self.assertEqual(2, len(store))
+            del store["k"]
+            with self.assertRaises(KeyError):
+                del store["k"]
+            with self.assertRaises(KeyError):
+                store["k"]
+
+        store = SQLiteDict(self.fn, flag="r")
+        self.assertEqual([(key, "CG")], list(store.items()))
+        self.assertEqual(key.hashvalue, hash(next(iter(store))))
+        with self.assertRaises(TypeError):
+            store["k"] = 1
+        store.sync()
+        store.close()
+
+        with self.assertRaises(IOError):
+            SQLiteDict(os.path.join(self.tmpdir, "missing.sqlite"), flag="r")
+        with self.assertRaises(ValueError):
+            SQLiteDict(self.fn, flag="w")
+
+    def test_key_text(self):
+        ac1 = "".join(["NM_", "01234.5"])
+        ac2 = "".join(["NM_", "01234.5"])
+        key1 = _make_key("get_tx_info", (ac1, ac1, "splign"), {}, False, ())
+        key2 = _make_key("get_tx_info", (ac1, ac2, "splign"), {}, False, ())
+        self.assertEqual(key_text(key1), key_text(key2))
+        self.assertNotEqual(key_text(("a", 1)), key_text(("a", "1")))
+
+    def test_open_cache(self):
+        self.assertIsInstance(open_cache(self.fn), SQLiteDict)
+        self.assertIsInstance(open_cache(HDP_FN, flag="r"), PersistentDict)
+
+    def test_import_pickle(self):
+        with SQLiteDict(self.fn) as store:
+            n = store.import_pickle(HDP_FN)
+        pd = PersistentDict(HDP_FN, flag="r")
+        store = open_cache(self.fn, flag="r")
+        self.assertEqual(len(pd), n)
+        self.assertEqual(len(pd), len(store))
+        for key, value in list(pd.items())[:100]:
+            self.assertEqual(value, store[key])
+
+    def test_interface(self):
+        hdp = MockDataProvider(mode="learn", cache=self.fn)
+        self.assertEqual("CGT", hdp.get_seq("NM_01234.5", 1, 4))
+        hdp.get_tx_info("NM_01234.5", "NC_000001.10", "splign")
+        hdp.cache.close()
+
+        hdp = MockDataProvider(seqs={}, mode="run", cache=self.fn)
+        self.assertEqual("CGT", hdp.get_seq("NM_01234.5", 1, 4))
+        self.assertEqual(
+            "NM_01234.5", hdp.get_tx_info("NM_01234.5", "NC_000001.10", "splign")["tx_ac"]
+        )
+        self.assertEqual(0, sum(hdp.fetches.values()))
+        with self.assertRaises(HGVSDataNotAvailableError):
+            hdp.get_seq("NM_01234.5", 1, 5)
+
+        # stores may also be passed directly
+        store = SQLiteDict(self.fn, flag="r")
+        hdp = MockDataProvider(seqs={}, mode="run", cache=store)
+        self.assertIs(store, hdp.cache)
+        self.assertEqual("CGT", hdp.get_seq("NM_01234.5", 1, 4))
+
+    def test_verify(self):
+        hdp = MockDataProvider(mode="learn", cache=self.fn)
+        hdp.get_seq("NM_01234.5", 1, 4)
+        hdp.cache.close()
+
+        hdp = MockDataProvider(mode="verify", cache=self.fn)
+        self.assertIsInstance(hdp.cache, OverlayDict)
+        self.assertEqual("CGT", hdp.get_seq("NM_01234.5", 1, 4))
+        # misses are fetched and kept in memory; the file is not changed
+        self.assertEqual("CGTA", hdp.get_seq("NM_01234.5", 1, 5))
+        self.assertEqual("CGTA", hdp.get_seq("NM_01234.5", 1, 5))
+        self.assertEqual(3, hdp.fetches["get_seq"])
+        self.assertEqual(len(hdp.cache.store) + 1, len(hdp.cache))
+        with SQLiteDict(self.fn, flag="r") as store:
+            self.assertEqual(len(hdp.cache.store), len(store))
+
+    def test_hdp_import_run(self):
+        with SQLiteDict(self.fn) as store:
+            store.import_pickle(HDP_FN)
+        hdp = MockDataProvider(seqs={}, mode="run", cache=self.fn)
+        hdp_pickle = MockDataProvider(seqs={}, mode="run", cache=HDP_FN)
+        self.assertEqual(
+            hdp_pickle.get_tx_mapping_options("NM_183425.2"),
+            hdp.get_tx_mapping_options("NM_183425.2"),
+        )
+
+
+@pytest.mark.quick
+class Test_MMapDict(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.fn = os.path.join(self.tmpdir, "cache.hdpm")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_create(self):
+        pd = PersistentDict(HDP_FN, flag="r")
+        self.assertEqual(len(pd), MMapDict.create(self.fn, pd.items()))
+        with open_cache(self.fn, flag="r") as store:
+            self.assertIsInstance(store, MMapDict)
+            self.assertEqual(len(pd), len(store))
+            for key, value in pd.items():
+                self.assertEqual(value, store[key])
+            self.assertEqual(set(pd), set(store))
+            self.assertEqual(dict(pd.items()), dict(store.items()))
+            key = _make_key("get_seq", ("NM_99999.9", 1, 3), {}, False, ())
+            self.assertNotIn(key, store)
+            with self.assertRaises(KeyError):
+                store[key]
+            self.assertIsNone(store.get(key))
+
+    def test_replace_and_empty(self):
+        self.assertEqual(2, MMapDict.create(self.fn, [("a", 1), ("b", 2), ("a", 3)]))
+        store = MMapDict(self.fn)
+        self.assertEqual({"a": 3, "b": 2}, dict(store.items()))
+        self.assertEqual(0, MMapDict.create(self.fn, []))
+        self.assertEqual({}, dict(MMapDict(self.fn).items()))
+        self.assertEqual(["cache.hdpm"], os.listdir(self.tmpdir))
+
+    def test_errors(self):
+        with open(self.fn, "wb") as f:
+            f.write(b"not a cache file at all")
+        with self.assertRaises(IOError):
+            MMapDict(self.fn)
+        with self.assertRaises(ValueError):
+            open_cache(self.fn, flag="c")
+
+    def test_interface(self):
+        MMapDict.create(self.fn, PersistentDict(HDP_FN, flag="r").items())
+        hdp = MockDataProvider(seqs={}, mode="run", cache=self.fn)
+        hdp_pickle = MockDataProvider(seqs={}, mode="run", cache=HDP_FN)
+        self.assertEqual(
+            hdp_pickle.get_tx_mapping_options("NM_183425.2"),
+            hdp.get_tx_mapping_options("NM_183425.2"),
+        )
+        with self.assertRaises(HGVSDataNotAvailableError):
+            hdp.get_tx_mapping_options("NM_99999.9")
+        with self.assertRaises(ValueError):
+            MockDataProvider(mode="learn", cache=self.fn)
+
+    def test_verify(self):
+        MMapDict.create(self.fn, PersistentDict(HDP_FN, flag="r").items())
+        hdp = MockDataProvider(mode="verify", cache=self.fn)
+        self.assertIsInstance(hdp.cache.store, MMapDict)
+        self.assertEqual("CGTA", hdp.get_seq("NM_01234.5", 1, 5))
+        self.assertEqual("CGTA", hdp.get_seq("NM_01234.5", 1, 5))
+        self.assertEqual(2, hdp.fetches["get_seq"])
+
+    def test_stats_do_not_decode(self):
+        MMapDict.create(self.fn, PersistentDict(HDP_FN, flag="r").items())
+        hdp = MockDataProvider(seqs={}, mode="run", cache=self.fn)
+        hdp.get_tx_mapping_options("NM_183425.2")
+        caches = hgvs.utils.cachestats.registry.caches()
+        names = [
+            n
+            for n, c in caches.items()
+            if n.startswith("hdp.")
+            and c.cache_stats is getattr(hdp, n[4:].split("#")[0]).cache_stats
+        ]
+        self.assertEqual(13, len(names))
+        with mock.patch.object(MMapDict, "_entry", side_effect=AssertionError("decoded")):
+            stats = hgvs.utils.cachestats.as_dict(names=names)
+        # hits: schema_version (in __init__) and get_tx_mapping_options
+        self.assertEqual(
+            (2, None), (sum(s["hits"] for s in stats.values()), stats[names[0]]["currsize"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+import unittest
+
+import attr
+import pytest
+
+import hgvs.edit
+import hgvs.location
+import hgvs.parser
+import hgvs.sequencevariant
+import hgvs.utils.binary
+from hgvs.exceptions import HGVSUnsupportedOperationError, HGVSUsageError
+from hgvs.utils.frozen import evolve, freeze, is_frozen, thaw
+
+
+@pytest.mark.quick
+@pytest.mark.models
+class Test_Frozen(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.hp = hgvs.parser.Parser()
+
+    def test_freeze(self):
+        var = self.hp.parse("NM_01234.5:c.22_24delinsAT")
+        fvar = freeze(var)
+        self.assertTrue(is_frozen(fvar))
+        self.assertFalse(is_frozen(var))
+        self.assertIsInstance(fvar, hgvs.sequencevariant.SequenceVariant)
+        self.assertIsInstance(fvar.posedit.pos, hgvs.location.BaseOffsetInterval)
+        self.assertIsInstance(fvar.posedit.pos.start, hgvs.location.BaseOffsetPosition)
+        self.assertIsInstance(fvar.posedit.edit, hgvs.edit.NARefAlt)
+        self.assertTrue(is_frozen(fvar.posedit.pos.start))
+        self.assertIs(fvar, freeze(fvar))
+        self.assertEqual(str(var), str(fvar))
+        self.assertEqual(fvar.posedit.length_change(), var.posedit.length_change())
+
+        # freezing copies
+        var.posedit.edit.alt = "GG"
+        self.assertEqual("NM_01234.5:c.22_24delinsAT", str(fvar))
+
+    def test_immutable(self):
+        fvar = freeze(self.hp.parse("NM_01234.5:c.22+1A>T"))
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            fvar.ac = "NM_99999.1"
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            fvar.posedit.edit.alt = "G"
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            fvar.posedit.pos.start.base = 1
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            del fvar.gene
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            fvar.posedit._set_uncertain()
+
+    def test_hash_and_eq(self):
+        hgvs_strs = [
+            "NM_01234.5:c.22+1A>T",
+            "NM_01234.5:c.22+1A>G",
+            "NM_01234.5:c.22-1A>T",
+            "NM_01234.5:c.*22A>T",
+            "NM_01234.5:c.22_23dup",
+            "NM_01234.5:c.22_23inv",
+            "NP_01234.1:p.Ala22Trp",
+            "NC_000001.10:g.(100_200)del",
+        ]
+        fvars = [freeze(self.hp.parse(s)) for s in hgvs_strs]
+        fvars2 = [freeze(self.hp.parse(s)) for s in hgvs_strs]
+        self.assertEqual(fvars, fvars2)
+        self.assertEqual(len(hgvs_strs), len(set(fvars + fvars2)))
+        d = dict(zip(fvars, hgvs_strs))
+        for fvar, s in zip(fvars2, hgvs_strs):
+            self.assertEqual(s, d[fvar])
+
+        # frozen and mutable objects compare equal, in either order
+        var = self.hp.parse(hgvs_strs[0])
+        self.assertEqual(fvars[0], var)
+        self.assertEqual(var, fvars[0])
+        self.assertNotEqual(fvars[1], var)
+        self.assertNotEqual(var, fvars[1])
+
+        # uncertain positions compare by value
+        pos = hgvs.location.SimplePosition(None, uncertain=True)
+        self.assertEqual(freeze(pos), freeze(copy.copy(pos)))
+
+    def test_thaw(self):
+        fvar = freeze(self.hp.parse("NM_01234.5:c.22+1A>T"))
+        var = thaw(fvar)
+        self.assertFalse(is_frozen(var))
+        self.assertIs(type(var), hgvs.sequencevariant.SequenceVariant)
+        self.assertIs(type(var.posedit.pos.start), hgvs.location.BaseOffsetPosition)
+        self.assertEqual(fvar, var)
+        var.posedit.edit.alt = "G"
+        self.assertEqual("NM_01234.5:c.22+1A>G", str(var))
+        self.assertEqual("NM_01234.5:c.22+1A>T", str(fvar))
+
+        # thawing a mutable object makes an independent copy
+        var2 = thaw(var)
+        self.assertEqual(var, var2)
+        self.assertIsNot(var.posedit.edit, var2.posedit.edit)
+
+    def test_evolve(self):
+        fvar = freeze(self.hp.parse("NM_01234.5:c.22+1A>T"))
+        fvar2 = evolve(
+            fvar, ac="NM_01234.6", posedit=evolve(fvar.posedit, edit=thaw(fvar.posedit.edit))
+        )
+        self.assertTrue(is_frozen(fvar2))
+        self.assertTrue(is_frozen(fvar2.posedit.edit))
+        self.assertEqual("NM_01234.6:c.22+1A>T", str(fvar2))
+        self.assertIs(fvar.posedit.pos, fvar2.posedit.pos)
+        self.assertEqual("NM_01234.5:c.22+1A>T", str(fvar))
+
+        var = self.hp.parse("NM_01234.5:c.22+1A>T")
+        var2 = evolve(var, gene="GENE")
+        self.assertFalse(is_frozen(var2))
+        self.assertEqual("NM_01234.5(GENE):c.22+1A>T", str(var2))
+        self.assertIsNone(var.gene)
+
+        with self.assertRaises(HGVSUsageError):
+            evolve(fvar, acc="NM_01234.6")
+
+    def test_lazy_variant(self):
+        fvar = freeze(self.hp.parse_lazy("NM_01234.5:c.22+1A>T"))
+        self.assertTrue(is_frozen(fvar))
+        self.assertEqual(self.hp.parse("NM_01234.5:c.22+1A>T"), fvar)
+
+    def test_copy_pickle_binary(self):
+        fvar = freeze(self.hp.parse("NM_01234.5:c.22+1A>T"))
+        self.assertIs(fvar, copy.copy(fvar))
+        self.assertIs(fvar, copy.deepcopy(fvar))
+        fvar2 = pickle.loads(pickle.dumps(fvar))
+        self.assertTrue(is_frozen(fvar2))
+        self.assertEqual(fvar, fvar2)
+        self.assertEqual(hash(fvar), hash(fvar2))
+        self.assertEqual(fvar, hgvs.utils.binary.loads(hgvs.utils.binary.dumps(fvar)))
+
+    def test_errors(self):
+        for fn in (freeze, thaw, evolve):
+            with self.assertRaises(HGVSUnsupportedOperationError):
+                fn("NM_01234.5:c.22+1A>T")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import csv
+import os
+import re
+import unittest
+
+import pkg_resources
+import pytest
+
+import hgvs.parser
+import hgvs.utils.rdparser
+from hgvs.exceptions import HGVSParseError, HGVSUsageError
+
+
+class Test_RDParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = hgvs.parser.Parser()
+        cls.rd_parser = hgvs.parser.Parser(backend="rd")
+        cls._test_fn = os.path.join(os.path.dirname(__file__), "data", "grammar_test.tsv")
+
+    @pytest.mark.quick
+    def test_rule_completeness(self):
+        """ensure that all rules in grammar are implemented"""
+        grammar_rule_re = re.compile(r"^(\w+)")
+        grammar_fn = pkg_resources.resource_filename("hgvs", "_data/hgvs.pymeta")
+        with open(grammar_fn, "r") as f:
+            grammar_rules = set(r.group(1) for r in filter(None, map(grammar_rule_re.match, f)))
+        missing_rules = grammar_rules - hgvs.utils.rdparser.rule_names
+        self.assertEqual(missing_rules, set())
+
+    def test_grammar_test_cases(self):
+        """every rule must give the same result as the OMeta grammar"""
+        with open(self._test_fn, "r") as f:
+            reader = csv.DictReader(f, delimiter="\t")
+            for row in reader:
+                if row["Func"].startswith("#"):
+                    continue
+                if row["InType"] == "list":
+                    inputs = row["Test"].split("|")
+                elif row["InType"] == "string":
+                    inputs = list(row["Test"])
+                else:
+                    inputs = [row["Test"]]
+                for s in inputs:
+                    try:
+                        expected = getattr(self.parser._grammar(s), row["Func"])()
+                    except Exception:
+                        with self.assertRaises(HGVSParseError, msg=row["Func"] + ": " + s):
+                            hgvs.utils.rdparser.parse(row["Func"], s)
+                        continue
+                    actual = hgvs.utils.rdparser.parse(row["Func"], s)
+                    self.assertEqual(repr(expected), repr(actual), row["Func"] + ": " + s)
+
+    def test_gauntlet(self):
+        fn = os.path.join(os.path.dirname(__file__), "data", "gauntlet")
+        for var in open(fn, "r"):
+            var = var.strip()
+            if var.startswith("#") or var == "":
+                continue
+            v = self.rd_parser.parse_hgvs_variant(var)
+            self.assertEqual(var, v.format(conf={"max_ref_length": None}))
+            self.assertEqual(self.parser.parse_hgvs_variant(var), v)
+
+    @pytest.mark.quick
+    def test_reject(self):
+        fn = os.path.join(os.path.dirname(__file__), "data", "reject")
+        for var in open(fn, "r"):
+            var, msg = var.strip().split("\t")
+            if var.startswith("#") or var == "":
+                continue
+            with self.assertRaises(HGVSParseError):
+                self.rd_parser.parse_hgvs_variant(var)
+
+    @pytest.mark.quick
+    def test_error_message(self):
+        with self.assertRaisesRegex(HGVSParseError, "char 24: expected one of"):
+            self.rd_parser.parse("NC_000001.10:g.145414772-?_145416946+?dup")
+        with self.assertRaisesRegex(HGVSParseError, "char 11: expected a letter"):
+            self.rd_parser.parse("NM_01234.5(1BOGUS):c.22+1A>T")
+
+    @pytest.mark.quick
+    def test_backend_selection(self):
+        with self.assertRaises(HGVSUsageError):
+            hgvs.parser.Parser(backend="bogus")
+        p = hgvs.parser.Parser(backend="rd", expose_all_rules=True)
+        self.assertEqual(str(p.parse_dna_edit("delinsAT")), "delinsAT")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
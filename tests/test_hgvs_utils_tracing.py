@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+import json
+import os
+import threading
+import unittest
+
+import pytest
+import support.mock_input_source as mock_input_data_source
+from support.mock_data_provider import MockDataProvider
+
+import hgvs.parser
+import hgvs.utils.tracing
+import hgvs.variantmapper
+from hgvs.utils.tracing import Tracer, span, traced, tracing
+
+
+@traced
+def _add(a, b):
+    return a + b
+
+
+@traced(name="fail", record_args=True)
+def _fail(msg):
+    raise ValueError(msg)
+
+
+@traced(record_args=True)
+def _named(ac, name=None):
+    return name
+
+
+@pytest.mark.quick
+class Test_Tracing(unittest.TestCase):
+    def tearDown(self):
+        hgvs.utils.tracing.disable()
+
+    def test_disabled(self):
+        self.assertIsNone(hgvs.utils.tracing.get_tracer())
+        self.assertEqual(3, _add(1, 2))
+        with span("noop", a=1) as s:
+            s.set_attribute("b", 2)
+        tracer = Tracer()
+        with tracing(tracer):
+            pass
+        self.assertEqual([], tracer.spans)
+        self.assertIsNone(hgvs.utils.tracing.get_tracer())
+
+    def test_spans(self):
+        with tracing() as tracer:
+            with span("outer", ac="NM_01234.5") as s:
+                self.assertEqual(3, _add(1, 2))
+                with self.assertRaises(ValueError):
+                    _fail("boom")
+                s.set_attribute("n", 2)
+        self.assertEqual(["_add", "fail", "outer"], [s.name for s in tracer.spans])
+        add, fail, outer = tracer.spans
+        self.assertEqual([outer.span_id] * 2, [add.parent_id, fail.parent_id])
+        self.assertIsNone(outer.parent_id)
+        self.assertEqual({"args": ("boom",)}, fail.attributes)
+        self.assertEqual("ValueError", fail.error)
+        self.assertEqual({"ac": "NM_01234.5", "n": 2}, outer.attributes)
+        self.assertAlmostEqual(outer.duration - add.duration - fail.duration, outer.self_time)
+
+        report = tracer.report()
+        self.assertEqual({"_add", "fail", "outer"}, set(report))
+        self.assertEqual(1, report["fail"]["errors"])
+        self.assertEqual(outer.duration, report["outer"]["total"])
+        text = tracer.format_report()
+        self.assertTrue(text.startswith("name"))
+        self.assertEqual(4, len(text.splitlines()))
+
+        tracer.clear()
+        self.assertEqual([], tracer.spans)
+
+    def test_record_args(self):
+        with tracing() as tracer:
+            self.assertEqual("x", _named("NM_01234.5", name="x"))
+            _named("NM_01234.5")
+        self.assertEqual(["_named", "_named"], [s.name for s in tracer.spans])
+        self.assertEqual(
+            {"args": ("NM_01234.5",), "kwargs": {"name": "x"}}, tracer.spans[0].attributes
+        )
+        self.assertEqual({"args": ("NM_01234.5",)}, tracer.spans[1].attributes)
+
+    def test_fill_ref(self):
+        hdp = MockDataProvider()
+        var = hgvs.parser.Parser().parse("NM_01234.5:n.2_3del")
+        with tracing() as tracer:
+            var.fill_ref(hdp)
+        self.assertEqual("CG", var.posedit.edit.ref)
+        self.assertEqual("SequenceVariant.fill_ref", tracer.spans[-1].name)
+
+    def test_nested_tracing(self):
+        t1, t2 = Tracer(), Tracer()
+        with tracing(t1):
+            with tracing(t2):
+                _add(1, 2)
+            self.assertIs(t1, hgvs.utils.tracing.get_tracer())
+            _add(1, 2)
+        self.assertEqual(1, len(t1.spans))
+        self.assertEqual(1, len(t2.spans))
+
+    def test_threads(self):
+        def work():
+            with span("thread"):
+                _add(1, 2)
+
+        with tracing() as tracer:
+            with span("main"):
+                threads = [threading.Thread(target=work) for _ in range(4)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+        by_id = {s.span_id: s for s in tracer.spans}
+        self.assertEqual(9, len(by_id))
+        for s in tracer.spans:
+            if s.name == "_add":
+                self.assertEqual("thread", by_id[s.parent_id].name)
+            else:
+                self.assertIsNone(s.parent_id)
+
+    def test_exporters(self):
+        with tracing() as tracer:
+            with span("outer", obj=object()):
+                _add(1, 2)
+        fp = io.StringIO()
+        tracer.to_json(fp)
+        spans = json.loads(fp.getvalue())
+        self.assertEqual(["_add", "outer"], [s["name"] for s in spans])
+        self.assertEqual(spans[1]["span_id"], spans[0]["parent_id"])
+
+        fp = io.StringIO()
+        tracer.to_csv(fp)
+        rows = list(csv.DictReader(io.StringIO(fp.getvalue())))
+        self.assertEqual(list(Tracer.csv_fields), list(rows[0]))
+        self.assertEqual(["_add", "outer"], [r["name"] for r in rows])
+        self.assertIn("obj", json.loads(rows[1]["attributes"]))
+
+    def test_data_provider(self):
+        hdp = MockDataProvider()
+        with tracing() as tracer:
+            hdp.get_seq("NM_01234.5", 1, 3)
+            hdp.get_seq("NM_01234.5", 1, 3)
+            hdp.get_tx_mapping_options("NM_01234.5")
+        self.assertEqual(
+            [
+                "hdp.get_seq.fetch",
+                "hdp.get_seq",
+                "hdp.get_seq",
+                "hdp.get_tx_mapping_options.fetch",
+                "hdp.get_tx_mapping_options",
+            ],
+            [s.name for s in tracer.spans],
+        )
+        self.assertEqual(tracer.spans[1].span_id, tracer.spans[0].parent_id)
+        self.assertEqual({"args": ("NM_01234.5", 1, 3)}, tracer.spans[1].attributes)
+        self.assertEqual(1, hdp.get_seq.cache_info().hits)
+
+    def test_variantmapper(self):
+        fn = os.path.join(os.path.dirname(__file__), "data", "sanity_cp.tsv")
+        hdp = mock_input_data_source.MockInputSource(fn)
+        vm = hgvs.variantmapper.VariantMapper(hdp, prevalidation_level="INTRINSIC")
+        var_c = hgvs.parser.Parser().parse("NM_999999.1:c.6A>T")
+        with tracing() as tracer:
+            var_p = vm.c_to_p(var_c, "MOCK")
+        self.assertEqual("MOCK:p.(Lys2Asn)", str(var_p))
+        by_id = {s.span_id: s for s in tracer.spans}
+        root = tracer.spans[-1]
+        self.assertEqual("VariantMapper.c_to_p", root.name)
+        self.assertIsNone(root.parent_id)
+        self.assertIn("IntrinsicValidator.validate", [s.name for s in tracer.spans])
+        for s in tracer.spans[:-1]:
+            self.assertIn(s.parent_id, by_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import itertools
 import os
 import re
 import sys
@@ -15,6 +16,7 @@ from support import CACHE
 import hgvs.dataproviders.uta
 import hgvs.parser
 import hgvs.sequencevariant
+import hgvs.utils.frozen
 import hgvs.variantmapper
 
 
@@ -127,6 +129,32 @@ class Test_VariantMapper(unittest.TestCase):
         for rec in gxp_file_reader("tests/data/gcp/noncoding.tsv"):
             self._test_gxp_mapping(rec)
 
+    def test_frozen(self):
+        freeze = hgvs.utils.frozen.freeze
+        for rec in itertools.chain(
+            gxp_file_reader("tests/data/gcp/real.tsv"),
+            gxp_file_reader("tests/data/gcp/noncoding.tsv"),
+        ):
+            var_g = self.hp.parse_hgvs_variant(rec["HGVSg"])
+            var_x = self.hp.parse_hgvs_variant(rec["HGVSc"])
+            fvar_g = freeze(var_g)
+            fvar_x = freeze(var_x)
+            self.assertEqual(
+                str(self.hm.g_to_t(var_g, var_x.ac)), str(self.hm.g_to_t(fvar_g, var_x.ac))
+            )
+            self.assertEqual(
+                str(self.hm.t_to_g(var_x, var_g.ac)), str(self.hm.t_to_g(fvar_x, var_g.ac))
+            )
+            if var_x.type == "c":
+                self.assertEqual(str(self.hm.c_to_n(var_x)), str(self.hm.c_to_n(fvar_x)))
+            if var_x.type == "c" and rec["HGVSp"]:
+                pro_ac = self.hp.parse_hgvs_variant(rec["HGVSp"]).ac
+                self.assertEqual(
+                    str(self.hm.c_to_p(var_x, pro_ac)), str(self.hm.c_to_p(fvar_x, pro_ac))
+                )
+            self.assertEqual(fvar_g, freeze(self.hp.parse_hgvs_variant(rec["HGVSg"])))
+            self.assertEqual(fvar_x, freeze(self.hp.parse_hgvs_variant(rec["HGVSc"])))
+
     def _test_gxp_mapping(self, rec):
         """given one record (row) of g, c/n/r, and p (optional) test variants, map
         g->c/n/r, c/n/r->g, and c->p and verify equivalence